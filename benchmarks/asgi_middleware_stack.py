@@ -0,0 +1,188 @@
+"""
+Compares the admin middleware stack per request, on an authenticated request to a trivial
+endpoint:
+
+    legacy: `AuthMiddleware` and `ExceptionMiddleware` as they were before the ASGI rewrite,
+            registered with `app.middleware("http")`, i.e. each wrapped in `BaseHTTPMiddleware`
+    asgi:   the current pure ASGI middlewares, registered with `BoundMiddleware`
+
+JWT verification is replaced by a stand-in auth service returning a fixed user, so only the
+middleware overhead is measured. Requests are sent one at a time through `httpx.ASGITransport`,
+without a network round trip.
+
+Usage:
+    python benchmarks/asgi_middleware_stack.py [--requests 5000] [--warmup 500]
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+from typing import Callable, Optional
+
+import httpx
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+from loguru import logger
+
+from py_spring_admin.core.controller.commons import HTTPMethod
+from py_spring_admin.core.controller.middleware.auth_middleware import AuthMiddleware
+from py_spring_admin.core.controller.middleware.exception_middleware import (
+    ExceptionMiddleware,
+)
+from py_spring_admin.core.controller.middleware.middleware_base import BoundMiddleware
+from py_spring_admin.core.repository.commons import UserRead, UserRole
+from py_spring_admin.core.service.errors import HandledServerError
+
+TOKEN = "benchmark-token"
+EXCLUDED_ROUTES = ["/spring-admin/public", "/docs", "/favicon.ico", "/openapi.json"]
+
+
+class _StandInAuthService:
+    def __init__(self) -> None:
+        self.user_read = UserRead(
+            id=1, role=UserRole.Admin, user_name="admin", is_verified=True
+        )
+
+    def get_user_from_jwt(self, token: str) -> Optional[UserRead]:
+        return self.user_read if token == TOKEN else None
+
+
+class _LegacyAuthMiddleware:
+    def __init__(self, auth_service: _StandInAuthService) -> None:
+        self.auth_service = auth_service
+        self.excluded_routes = list(EXCLUDED_ROUTES)
+
+    async def __call__(self, request: Request, call_next: Callable):
+        utc_time = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        if request.method == HTTPMethod.OPTIONS:
+            return await call_next(request)
+        optional_jwt = request.cookies.get(AuthMiddleware.COOKIE_NAME)
+        for url in self.excluded_routes:
+            if url in str(request.url):
+                logger.info(f"[AUTH MIDDLEWARE ROUTE EXCLUDED] Bypass URL: {url}")
+                return await call_next(request)
+
+        if optional_jwt is None:
+            return JSONResponse(
+                content={"detail": "Please login first", "timestamp": utc_time},
+                status_code=status.HTTP_401_UNAUTHORIZED,
+            )
+        user_read = self.auth_service.get_user_from_jwt(optional_jwt)
+        if user_read is None:
+            return JSONResponse(
+                content={"detail": "Please login first", "timestamp": utc_time},
+                status_code=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        request.state.user = user_read.model_dump()
+        return await call_next(request)
+
+
+class _LegacyExceptionMiddleware:
+    async def __call__(self, request: Request, call_next: Callable):
+        utc_time = datetime.datetime.now(datetime.timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        try:
+            return await call_next(request)
+        except HandledServerError as handled_error:
+            logger.error(f"Handled Error: {handled_error.message}, code: {handled_error.status_code}")
+            return JSONResponse(
+                content={
+                    "timestamp": utc_time,
+                    "message": handled_error.message,
+                    "status": handled_error.status_code,
+                },
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
+        except Exception as base_exception:
+            logger.exception(base_exception)
+            return JSONResponse(
+                content={
+                    "timestamp": utc_time,
+                    "message": str(base_exception),
+                    "status": status.HTTP_403_FORBIDDEN,
+                },
+                status_code=status.HTTP_403_FORBIDDEN,
+            )
+
+
+def _create_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/items")
+    def get_items(request: Request) -> dict:
+        return {"user_name": request.state.user["user_name"], "items": [1, 2, 3]}
+
+    return app
+
+
+def _create_legacy_app(auth_service: _StandInAuthService) -> FastAPI:
+    app = _create_app()
+    app.middleware("http")(_LegacyAuthMiddleware(auth_service))
+    app.middleware("http")(_LegacyExceptionMiddleware())
+    return app
+
+
+def _create_asgi_app(auth_service: _StandInAuthService) -> FastAPI:
+    app = _create_app()
+    auth_middleware = AuthMiddleware()
+    auth_middleware.auth_service = auth_service  # type: ignore
+    auth_middleware.optional_excluded_route_pattern = (
+        auth_middleware._compile_excluded_routes(auth_middleware.excluded_routes)
+    )
+    app.add_middleware(BoundMiddleware, middleware=auth_middleware)
+    app.add_middleware(BoundMiddleware, middleware=ExceptionMiddleware())
+    return app
+
+
+async def _time_requests(app: FastAPI, requests: int, warmup: int) -> list[float]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://localhost", cookies={"jwt": TOKEN}
+    ) as client:
+        for _ in range(warmup):
+            (await client.get("/api/items")).raise_for_status()
+        durations: list[float] = []
+        for _ in range(requests):
+            started_at = time.perf_counter()
+            response = await client.get("/api/items")
+            durations.append(time.perf_counter() - started_at)
+            response.raise_for_status()
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    args = parser.parse_args()
+    logger.remove()
+
+    auth_service = _StandInAuthService()
+    results = {
+        "legacy": asyncio.run(
+            _time_requests(_create_legacy_app(auth_service), args.requests, args.warmup)
+        ),
+        "asgi": asyncio.run(
+            _time_requests(_create_asgi_app(auth_service), args.requests, args.warmup)
+        ),
+    }
+    print(f"{args.requests} sequential requests after {args.warmup} warmup requests")
+    for name, durations in results.items():
+        percentiles = statistics.quantiles(durations, n=100)
+        print(
+            f"{name:>7}: p50 {percentiles[49] * 1e6:8.0f} us  p99 {percentiles[98] * 1e6:8.0f} us"
+            f"  ({len(durations) / sum(durations):,.0f} req/s)"
+        )
+    print(
+        f"throughput gain: {sum(results['legacy']) / sum(results['asgi']):.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
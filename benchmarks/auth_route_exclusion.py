@@ -0,0 +1,115 @@
+"""
+Compares the excluded route checks of `AuthMiddleware`, per request:
+
+    legacy:  builds `str(request.url)` and scans it for every excluded route as a substring,
+             the check used before the routes were precompiled
+    pattern: matches `request.url.path` against the precompiled pattern of all excluded routes
+
+The request paths mix excluded routes (hit early and late in the route list) with regular API
+routes, which miss every excluded route and so are the worst case of the substring scan.
+
+Usage:
+    python benchmarks/auth_route_exclusion.py [--routes 50] [--requests 100000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import time
+from typing import Callable
+
+from fastapi import Request
+from starlette.types import Scope
+
+from py_spring_admin.core.controller.middleware.auth_middleware import AuthMiddleware
+
+
+def _to_scope(path: str) -> Scope:
+    return {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("localhost", 8080),
+        "path": path,
+        "query_string": b"page=1&page_size=50",
+        "headers": [(b"host", b"localhost:8080")],
+    }
+
+
+def _build_legacy_check(excluded_routes: list[str]) -> Callable[[Scope], bool]:
+    def is_excluded(scope: Scope) -> bool:
+        url = str(Request(scope).url)
+        for route in excluded_routes:
+            if route in url:
+                return True
+        return False
+
+    return is_excluded
+
+
+def _build_pattern_check(excluded_routes: list[str]) -> Callable[[Scope], bool]:
+    optional_pattern = AuthMiddleware()._compile_excluded_routes(excluded_routes)
+    assert optional_pattern is not None
+    pattern = optional_pattern
+
+    def is_excluded(scope: Scope) -> bool:
+        return pattern.match(Request(scope).url.path) is not None
+
+    return is_excluded
+
+
+def _time(is_excluded: Callable[[Scope], bool], scopes: list[Scope], repeat: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for scope in scopes:
+            is_excluded(scope)
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--routes", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    excluded_routes = AuthMiddleware().excluded_routes + [
+        f"/api/public/resource_{index}" for index in range(args.routes)
+    ]
+    paths = [
+        "/docs",
+        "/spring-admin/public/login",
+        f"/api/public/resource_{args.routes - 1}/items",
+        "/spring-admin/private/models/app_user",
+        "/spring-admin/private/models/app_user/rows/42",
+        "/api/orders/1234/lines",
+        "/api/customers",
+        "/api/reports/daily",
+    ]
+    scopes = [_to_scope(paths[index % len(paths)]) for index in range(args.requests)]
+
+    legacy_check = _build_legacy_check(excluded_routes)
+    pattern_check = _build_pattern_check(excluded_routes)
+    for path in paths:
+        scope = _to_scope(path)
+        assert legacy_check(scope) == pattern_check(scope), f"checks disagree on {path}"
+
+    print(
+        f"{len(excluded_routes)} excluded routes, {args.requests} requests, "
+        f"best / median of {args.repeat} runs"
+    )
+    results = {
+        "legacy": _time(legacy_check, scopes, args.repeat),
+        "pattern": _time(pattern_check, scopes, args.repeat),
+    }
+    for name, durations in results.items():
+        print(
+            f"{name:>8}: {min(durations) * 1000:9.1f} ms / {statistics.median(durations) * 1000:9.1f} ms"
+            f"  ({min(durations) / args.requests * 1e9:,.0f} ns/request)"
+        )
+    print(f"speedup: {min(results['legacy']) / min(results['pattern']):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
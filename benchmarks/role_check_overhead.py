@@ -0,0 +1,121 @@
+"""
+Compares the per-call overhead of the role checks in `depends_utils`, calling a trivial route
+handler with a verified admin user on `request.state.user`:
+
+    undecorated:      the handler itself, as the baseline
+    legacy:           `require_in_roles` as it was before, resolving the `Request` parameter
+                      through a `cachetools` lookup and looping over the roles on every call
+    require_in_roles: the current decorator, resolving the user parameter once when applied
+    depends_on_roles: the FastAPI dependency, awaited before the handler as FastAPI would
+
+Usage:
+    python benchmarks/role_check_overhead.py [--calls 200000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import functools
+import statistics
+import time
+from typing import Any, Callable, Optional, Type, cast
+
+import cachetools
+from fastapi import Request
+
+from py_spring_admin.core.controller.depends_utils import depends_on_roles, require_in_roles
+from py_spring_admin.core.repository.commons import JWTUser, StrEnum, UserRole
+from py_spring_admin.core.service.errors import PermissionDeniedError, UserEmailNotVerified
+
+
+@cachetools.cached(cache={})
+def _legacy_find_type_in_params(
+    func: Callable[..., Any], target_type: Type[Any]
+) -> Optional[str]:
+    for attr, param_type in func.__annotations__.items():
+        if issubclass(param_type, target_type):
+            return attr
+    return None
+
+
+def _legacy_require_in_roles(roles: list[StrEnum]) -> Callable[..., Any]:
+    def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def inner_wrapper(*args, **kwargs):
+            param_name = _legacy_find_type_in_params(func, Request)
+            if param_name is None:
+                raise ValueError("Request parameter not found in function annotations")
+            request: Request = cast(Request, kwargs.get(param_name))
+            user: JWTUser = request.state.user
+
+            if not user["is_verified"]:
+                raise UserEmailNotVerified()
+
+            for role in roles:
+                if user["role"] == role:
+                    return func(*args, **kwargs)
+            raise PermissionDeniedError(f"User does not have the required role: {role}")
+
+        return inner_wrapper
+
+    return wrapper
+
+
+def get_rows(request: Request) -> int:
+    return 1
+
+
+def _time(call: Callable[[], Any], calls: int, repeat: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            call()
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+async def _time_dependency(request: Request, calls: int, repeat: int) -> list[float]:
+    check_current_user_roles = depends_on_roles([UserRole.Guest, UserRole.Admin])
+    durations: list[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        for _ in range(calls):
+            await check_current_user_roles(request)
+            get_rows(request=request)
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    request.state.user = JWTUser(id=1, role=UserRole.Admin, user_name="admin", is_verified=True)
+    # the admin role comes last, so the legacy role loop runs in full
+    roles: list[StrEnum] = [UserRole.Guest, UserRole.Admin]
+    legacy_get_rows = _legacy_require_in_roles(roles)(get_rows)
+    current_get_rows = require_in_roles(roles)(get_rows)
+
+    results = {
+        "undecorated": _time(lambda: get_rows(request=request), args.calls, args.repeat),
+        "legacy": _time(lambda: legacy_get_rows(request=request), args.calls, args.repeat),
+        "require_in_roles": _time(
+            lambda: current_get_rows(request=request), args.calls, args.repeat
+        ),
+        "depends_on_roles": asyncio.run(_time_dependency(request, args.calls, args.repeat)),
+    }
+    print(f"{args.calls} calls, best / median of {args.repeat} runs")
+    baseline = min(results["undecorated"]) / args.calls
+    for name, durations in results.items():
+        per_call = min(durations) / args.calls
+        print(
+            f"{name:>16}: {per_call * 1e9:7.0f} ns / call  (median {statistics.median(durations) / args.calls * 1e9:7.0f} ns)"
+            f"  overhead {(per_call - baseline) * 1e9:7.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
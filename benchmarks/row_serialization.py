@@ -0,0 +1,117 @@
+"""
+Compares the row serialization paths of `ModelService` on a table with Decimal, datetime and
+enum columns:
+
+    model: selects model instances and round-trips each through `json.loads(model_dump_json())`,
+           the path used before `RowSerializer`
+    row:   selects `Row` tuples and serializes them with `RowSerializer` in one pass
+
+Both paths are timed end to end, from the SELECT to the list of JSON-ready dicts, on an
+in-memory SQLite database.
+
+Usage:
+    python benchmarks/row_serialization.py [--rows 100000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import json
+import statistics
+import time
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+from py_spring_model import PySpringModel
+from sqlalchemy import create_engine, insert
+from sqlalchemy import select as select_columns
+from sqlmodel import Field, Session, select
+
+from py_spring_admin.core.repository.commons import StrEnum
+from py_spring_admin.core.service.row_serializer import RowSerializer
+
+
+class BenchmarkStatus(StrEnum):
+    Active = "active"
+    Suspended = "suspended"
+    Closed = "closed"
+
+
+class BenchmarkAccount(PySpringModel, table=True):
+    __tablename__: str = "benchmark_account"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    balance: Decimal = Field(max_digits=12, decimal_places=2)
+    status: BenchmarkStatus
+    created_at: datetime.datetime
+    closed_at: Optional[datetime.datetime] = None
+
+
+def _serialize_models(session: Session) -> list[dict[str, Any]]:
+    return [
+        json.loads(model.model_dump_json())
+        for model in session.exec(select(BenchmarkAccount)).all()
+    ]
+
+
+def _serialize_rows(session: Session) -> list[dict[str, Any]]:
+    row_serializer = RowSerializer.from_model(
+        BenchmarkAccount, BenchmarkAccount.__table__  # type: ignore
+    )
+    return [
+        row_serializer.serialize(row)
+        for row in session.execute(select_columns(*row_serializer.columns)).all()
+    ]
+
+
+def _time(session: Session, serialize: Callable[[Session], list[dict[str, Any]]], repeat: int) -> list[float]:
+    durations: list[float] = []
+    for _ in range(repeat):
+        session.expunge_all()
+        started_at = time.perf_counter()
+        serialize(session)
+        durations.append(time.perf_counter() - started_at)
+    return durations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    BenchmarkAccount.__table__.create(engine)  # type: ignore
+    created_at = datetime.datetime(2024, 1, 1, 12, 30)
+    statuses = list(BenchmarkStatus)
+    with Session(engine) as session:
+        session.execute(
+            insert(BenchmarkAccount),
+            [
+                {
+                    "name": f"account_{index}",
+                    "balance": Decimal(index) / 100,
+                    "status": statuses[index % len(statuses)],
+                    "created_at": created_at + datetime.timedelta(seconds=index),
+                    "closed_at": None if index % 2 else created_at,
+                }
+                for index in range(args.rows)
+            ],
+        )
+        session.commit()
+
+        assert _serialize_models(session) == _serialize_rows(session), "paths disagree"
+        print(f"{args.rows} rows, best / median of {args.repeat} runs")
+        results = {
+            "model": _time(session, _serialize_models, args.repeat),
+            "row": _time(session, _serialize_rows, args.repeat),
+        }
+    for name, durations in results.items():
+        print(
+            f"{name:>6}: {min(durations) * 1000:9.1f} ms / {statistics.median(durations) * 1000:9.1f} ms"
+            f"  ({args.rows / min(durations):,.0f} rows/s)"
+        )
+    print(f"speedup: {min(results['model']) / min(results['row']):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
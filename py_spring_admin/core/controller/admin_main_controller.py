@@ -6,6 +6,7 @@ from py_spring_admin.core.controller.middleware.auth_middleware import AuthMiddl
 from py_spring_admin.core.controller.middleware.exception_middleware import (
     ExceptionMiddleware,
 )
+from py_spring_admin.core.controller.middleware.middleware_base import BoundMiddleware
 
 
 class AdminMainController(RestController):
@@ -23,8 +24,9 @@ class AdminMainController(RestController):
         )
 
     def register_middlewares(self) -> None:
-        self.app.middleware("http")(self.auth_middleware)
-        self.app.middleware("http")(self.exception_middleware)
+        # the middleware added last is the outermost one
+        self.app.add_middleware(BoundMiddleware, middleware=self.auth_middleware)
+        self.app.add_middleware(BoundMiddleware, middleware=self.exception_middleware)
 
         # cors should be  enabled after middleware registration
         self.enable_cors()
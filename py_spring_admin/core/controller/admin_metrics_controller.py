@@ -0,0 +1,58 @@
+from typing import Optional
+
+from fastapi import Request
+from py_spring_core import RestController
+from pydantic import BaseModel
+
+from py_spring_admin.core.controller.depends_utils import require_role
+from py_spring_admin.core.repository.commons import UserRole
+from py_spring_admin.core.repository.user_cache import UserCacheMetrics
+from py_spring_admin.core.repository.user_service import UserService
+from py_spring_admin.core.service.auth_service import AuthService
+from py_spring_admin.core.service.email_outbox import EmailOutboxMetrics
+from py_spring_admin.core.service.otp_service import OtpService
+from py_spring_admin.core.service.otp_storage import OtpStorageStats
+from py_spring_admin.core.service.password_hashing_service import (
+    PasswordHashingMetrics,
+    PasswordHashingService,
+)
+from py_spring_admin.core.service.rate_limiter import RateLimiterStats
+from py_spring_admin.core.service.smtp_service import SmtpService
+from py_spring_admin.core.service.verified_token_cache import VerifiedTokenCacheMetrics
+
+
+class AdminMetrics(BaseModel):
+    password_hashing: PasswordHashingMetrics
+    verified_token_cache: VerifiedTokenCacheMetrics
+    email_outbox: Optional[EmailOutboxMetrics] = None
+    otp_storage: OtpStorageStats
+    rate_limiter: RateLimiterStats
+    user_cache: Optional[UserCacheMetrics] = None
+
+
+class AdminMetricsController(RestController):
+    """
+    Exposes runtime metrics of the admin services, for administrators only.
+    """
+
+    password_hashing_service: PasswordHashingService
+    auth_service: AuthService
+    smtp_service: SmtpService
+    otp_service: OtpService
+    user_service: UserService
+
+    class Config:
+        prefix: str = "/spring-admin/private"
+
+    def register_routes(self) -> None:
+        @self.router.get("/metrics")
+        @require_role(UserRole.Admin)
+        def get_metrics(request: Request) -> AdminMetrics:
+            return AdminMetrics(
+                password_hashing=self.password_hashing_service.get_metrics(),
+                verified_token_cache=self.auth_service.verified_token_cache.get_metrics(),
+                email_outbox=self.smtp_service.get_outbox_metrics(),
+                otp_storage=self.otp_service.get_stats(),
+                rate_limiter=self.auth_service.rate_limiter.get_stats(),
+                user_cache=self.user_service.get_user_cache_metrics(),
+            )
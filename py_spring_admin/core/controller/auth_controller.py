@@ -5,6 +5,7 @@ from fastapi.responses import JSONResponse
 from loguru import logger
 from py_spring_core import RestController
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 from py_spring_admin.core.repository.commons import UserRead
 from py_spring_admin.core.repository.user_service import RegisterUser, UserService
@@ -67,18 +68,22 @@ class AdminAuthController(RestController):
 
     def register_routes(self) -> None:
         @self.router.post("/login")
-        def user_login(
+        async def user_login(
             request: Request, credential: CredentialType = None
         ) -> JSONResponse:
             base_response = JSONResponse(content="Login success")
             if self._validate_jwt_for_existing_users(request):
                 return base_response
-            token = self._handle_token_from_credential(credential)
+            self._check_rate_limit(request, self._get_credential_keys(credential))
+            token = await self._handle_token_from_credential(credential)
             base_response.set_cookie(key=self.COOKIE_NAME, value=token)
             return base_response
 
         @self.router.get("/logout")
         def user_logout(request: Request) -> JSONResponse:
+            optional_jwt = request.cookies.get(self.COOKIE_NAME)
+            if optional_jwt is not None:
+                self.auth_service.revoke_token(optional_jwt)
             base_response = self._create_json_response("Logout success")
             base_response.delete_cookie(key=self.COOKIE_NAME)
             return base_response
@@ -103,8 +108,8 @@ class AdminAuthController(RestController):
             )
         
         @self.router.post("/token")
-        def get_token(schema: TokenIssueSchema) -> JSONResponse:
-            optional_user = self.user_service.find_user_by_email(schema.email)
+        async def get_token(schema: TokenIssueSchema) -> JSONResponse:
+            optional_user = await self.user_service.async_find_user_by_email(schema.email)
             if optional_user is None:
                 raise UserNotFound()
             token = self.auth_service.issue_token({"purpose": schema.purpose, "email": schema.email}, is_encrypted= True)
@@ -133,7 +138,7 @@ class AdminAuthController(RestController):
                     )
         
         @self.router.post("/verify_user_email")
-        def verify_email(token_schema: TokenSchema, otp_verification_schema: OtpVerificationSchema) -> JSONResponse:
+        async def verify_email(request: Request, token_schema: TokenSchema, otp_verification_schema: OtpVerificationSchema) -> JSONResponse:
             token_issue_schema = self.auth_service.decode_token_returning_model(token_schema.token, TokenIssueSchema)
             if token_issue_schema is None:
                 return self._create_json_response(
@@ -143,20 +148,26 @@ class AdminAuthController(RestController):
                 return self._create_json_response(
                     "Invalid token for wrong purpose", status_code=status.HTTP_401_UNAUTHORIZED
                 )
-            optional_error = self.auth_service.validate_otp(
-                OtpPurpose.UserRegistration, token_issue_schema.email, otp_verification_schema.code
+            self._check_rate_limit(request, [f"email:{token_issue_schema.email}"])
+            # the OTP storage may be a SQL table or Redis, so keep its I/O off the event loop
+            optional_error = await run_in_threadpool(
+                self.auth_service.validate_otp,
+                OtpPurpose.UserRegistration,
+                token_issue_schema.email,
+                otp_verification_schema.code,
             )
             if optional_error is not None:
                 return self._create_json_response(
                     str(optional_error), status_code=status.HTTP_403_FORBIDDEN
                 )
             
-            self.user_service.update_user_email_verified(token_issue_schema.email)
+            await self.user_service.async_update_user_email_verified(token_issue_schema.email)
             return self._create_json_response("Email verified successfully")
 
 
         @self.router.post("/reset_password")
         def reset_password(
+            request: Request,
             token_schema: TokenSchema, 
             token_verification_schema: OtpVerificationSchema,
             password_reset_schema: ResetPasswordSchema
@@ -170,6 +181,7 @@ class AdminAuthController(RestController):
                 return self._create_json_response(
                     "Invalid token for wrong purpose", status_code=status.HTTP_401_UNAUTHORIZED
                 )
+            self._check_rate_limit(request, [f"email:{token_issue_schema.email}"])
             
             optional_error = self.auth_service.validate_otp(
                 OtpPurpose.PasswordReset, token_issue_schema.email, token_verification_schema.code
@@ -188,7 +200,23 @@ class AdminAuthController(RestController):
             response.delete_cookie(key=self.COOKIE_NAME)
             return response
 
-    def _handle_token_from_credential(self, credential: CredentialType) -> str:
+    def _check_rate_limit(self, request: Request, keys: list[str]) -> None:
+        """
+        Throttles the attempt by the client IP and the targeted account, so neither one client
+        spraying many accounts nor many clients hammering one account go unchecked.
+        """
+        if request.client is not None:
+            keys = [f"ip:{request.client.host}", *keys]
+        self.auth_service.check_rate_limit(keys)
+
+    def _get_credential_keys(self, credential: CredentialType) -> list[str]:
+        if isinstance(credential, EmailCredential):
+            return [f"email:{credential.email}"]
+        if isinstance(credential, UserNameCredential):
+            return [f"user_name:{credential.user_name}"]
+        return []
+
+    async def _handle_token_from_credential(self, credential: CredentialType) -> str:
         if credential is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -196,11 +224,11 @@ class AdminAuthController(RestController):
             )
 
         if isinstance(credential, EmailCredential):
-            token = self.auth_service.user_login_by_email(
+            token = await self.auth_service.async_user_login_by_email(
                 credential.email, credential.password
             )
         elif isinstance(credential, UserNameCredential):
-            token = self.auth_service.user_login_by_user_name(
+            token = await self.auth_service.async_user_login_by_user_name(
                 credential.user_name, credential.password
             )
         else:
@@ -1,7 +1,7 @@
 import functools
-from typing import Any, Callable, Optional, Type, cast
+import inspect
+from typing import Annotated, Any, Callable, Iterable, get_args, get_origin
 
-import cachetools
 from fastapi import Request
 
 from py_spring_admin.core.repository.commons import StrEnum
@@ -23,32 +23,50 @@ def get_current_user(request: Request) -> JWTUser:
     return user
 
 
-@cachetools.cached(cache={})
-def __find_type_in_params(
-    func: Callable[..., Any], target_type: Type[Any]
-) -> Optional[str]:
+def _find_user_getter(func: Callable[..., Any]) -> Callable[[dict[str, Any]], JWTUser]:
     """
-    Finds the name of the parameter in the given function that matches the specified type.
+    Finds the parameter of the given function the current user can be read from, either a `Request`
+    or a `JWTUser` (e.g. `Annotated[JWTUser, Depends(get_current_user)]`).
 
     Args:
         func (Callable[..., Any]): The function to inspect.
-        target_type (Type[Any]): The type to search for in the function parameters.
 
     Returns:
-        Optional[str]: The name of the parameter that matches the target type, or `None` if no match is found.
+        Callable[[dict[str, Any]], JWTUser]: A function reading the current user from the keyword arguments of `func`.
+
+    Raises:
+        ValueError: If no such parameter is found in the function annotations.
     """
     for attr, param_type in func.__annotations__.items():
-        if issubclass(param_type, target_type):
-            return attr
-    return None
-
-
-def require_in_roles(roles: list[StrEnum]) -> Callable[..., Any]:
+        if attr == "return":
+            continue
+        if get_origin(param_type) is Annotated:
+            param_type = get_args(param_type)[0]
+        if param_type is JWTUser:
+            return lambda kwargs: kwargs[attr]
+        if inspect.isclass(param_type) and issubclass(param_type, Request):
+            return lambda kwargs: kwargs[attr].state.user
+    raise ValueError(
+        f"Request or JWTUser parameter not found in function annotations: {func.__name__}"
+    )
+
+
+def _check_user_roles(user: JWTUser, allowed_roles: frozenset[str]) -> None:
+    if not user["is_verified"]:
+        raise UserEmailNotVerified()
+    if user["role"] not in allowed_roles:
+        raise PermissionDeniedError(
+            f"User does not have the required role: {', '.join(sorted(allowed_roles))}"
+        )
+
+
+def require_in_roles(roles: Iterable[StrEnum]) -> Callable[..., Any]:
     """
     Decorator that requires the current user to have one or more of the specified roles.
 
     This decorator checks if the user provided in the keyword arguments has one of the required roles.
     If the user is not found or does not have any of the required roles, it raises a PermissionDeniedError.
+    The user parameter is resolved once when the decorator is applied.
 
     Usage:
         from fastapi import Request
@@ -56,24 +74,26 @@ def require_in_roles(roles: list[StrEnum]) -> Callable[..., Any]:
         @require_in_roles([UserRole.Admin, UserRole.Manager])
         def some_admin_or_manager_function(request: Request], ...):
             ...
+
+    Coroutine functions are wrapped in a coroutine function, so async route handlers stay async.
     """
+    allowed_roles = frozenset(role.value for role in roles)
 
     def wrapper(func: Callable[..., Any]) -> Callable[..., Any]:
+        get_user = _find_user_getter(func)
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_inner_wrapper(*args, **kwargs):
+                _check_user_roles(get_user(kwargs), allowed_roles)
+                return await func(*args, **kwargs)
+
+            return async_inner_wrapper
+
         @functools.wraps(func)
         def inner_wrapper(*args, **kwargs):
-            param_name = __find_type_in_params(func, Request)
-            if param_name is None:
-                raise ValueError("Request parameter not found in function annotations")
-            request: Request = cast(Request, kwargs.get(param_name))
-            user: JWTUser = request.state.user
-            
-            if not user["is_verified"]:
-                raise UserEmailNotVerified()
-
-            for role in roles:
-                if user["role"] == role:
-                    return func(*args, **kwargs)
-            raise PermissionDeniedError(f"User does not have the required role: {role}")
+            _check_user_roles(get_user(kwargs), allowed_roles)
+            return func(*args, **kwargs)
 
         return inner_wrapper
 
@@ -95,3 +115,39 @@ def require_role(role: StrEnum) -> Callable[..., Any]:
             ...
     """
     return require_in_roles([role])
+
+
+def depends_on_roles(roles: Iterable[StrEnum]) -> Callable[[Request], Any]:
+    """
+    FastAPI dependency that requires the current user to have one or more of the specified roles,
+    reading the user decoded by the auth middleware from `request.state.user`.
+    It returns the current user, and raises a PermissionDeniedError otherwise.
+
+    Usage:
+        from fastapi import Depends
+
+        @router.get("/some_path", dependencies=[Depends(depends_on_roles([UserRole.Admin]))])
+        def some_admin_function(...):
+            ...
+
+        @router.get("/other_path")
+        def other_admin_function(user: Annotated[JWTUser, Depends(depends_on_role(UserRole.Admin))]):
+            ...
+    """
+    allowed_roles = frozenset(role.value for role in roles)
+
+    # async, so FastAPI runs the check on the event loop instead of the threadpool
+    async def check_current_user_roles(request: Request) -> JWTUser:
+        user: JWTUser = request.state.user
+        _check_user_roles(user, allowed_roles)
+        return user
+
+    return check_current_user_roles
+
+
+def depends_on_role(role: StrEnum) -> Callable[[Request], Any]:
+    """
+    FastAPI dependency that requires the current user to have the specified role.
+    See `depends_on_roles`.
+    """
+    return depends_on_roles([role])
@@ -1,10 +1,12 @@
 import datetime
-from typing import Callable, ClassVar
+import re
+from typing import ClassVar, Optional
 
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 from loguru import logger
 from py_spring_core import Properties
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from py_spring_admin.core.controller.commons import HTTPMethod
 from py_spring_admin.core.controller.middleware.middleware_base import MiddlewareBase
@@ -29,6 +31,7 @@ class AuthMiddleware(MiddlewareBase):
             "/favicon.ico",
             "/openapi.json",
         ]
+        self.optional_excluded_route_pattern: Optional[re.Pattern[str]] = None
 
     def post_construct(self) -> None:
         additional_excluded_routes = self.auth_middleware_properties.excluded_routes
@@ -36,30 +39,62 @@ class AuthMiddleware(MiddlewareBase):
             f"[AUTH MIDDLEWARE] Extending excluded routes: {additional_excluded_routes}"
         )
         self.excluded_routes.extend(additional_excluded_routes)
+        self.optional_excluded_route_pattern = self._compile_excluded_routes(
+            self.excluded_routes
+        )
 
-    async def __call__(self, request: Request, call_next: Callable):
-        utc_time = datetime.datetime.now(datetime.timezone.utc).strftime(
-            "%Y-%m-%d %H:%M:%S"
+    def _compile_excluded_routes(
+        self, excluded_routes: list[str]
+    ) -> Optional[re.Pattern[str]]:
+        """
+        Compiles the excluded routes into one regex matching any of them as a prefix of the
+        request path, ending on a path segment boundary: `/docs` matches `/docs` and `/docs/x`, but
+        not `/docs-internal`. Longer routes come first, so the matched route is the most specific one.
+        """
+        if len(excluded_routes) == 0:
+            return None
+        routes = sorted(
+            {route.rstrip("/") for route in excluded_routes}, key=len, reverse=True
+        )
+        return re.compile(
+            f"(?:{'|'.join(re.escape(route) for route in routes)})(?=/|$)"
         )
-        if request.method == HTTPMethod.OPTIONS:
-            return await call_next(request)
-        optional_jwt = request.cookies.get(self.COOKIE_NAME)
-        for url in self.excluded_routes:
-            if url in str(request.url):
-                logger.info(f"[AUTH MIDDLEWARE ROUTE EXCLUDED] Bypass URL: {url}")
-                return await call_next(request)
 
-        if optional_jwt is None:
-            return JSONResponse(
-                content={"detail": "Please login first", "timestamp": utc_time},
-                status_code=status.HTTP_401_UNAUTHORIZED,
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send, app: ASGIApp
+    ) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        if request.method == HTTPMethod.OPTIONS.value:
+            await app(scope, receive, send)
+            return
+        if self.optional_excluded_route_pattern is not None:
+            optional_match = self.optional_excluded_route_pattern.match(request.url.path)
+            if optional_match is not None:
+                logger.debug(
+                    f"[AUTH MIDDLEWARE ROUTE EXCLUDED] Bypass URL: {optional_match.group(0)}"
+                )
+                await app(scope, receive, send)
+                return
+
+        optional_jwt = request.cookies.get(self.COOKIE_NAME)
+        optional_user_read = None
+        if optional_jwt is not None:
+            optional_user_read = self.auth_service.get_user_from_jwt(optional_jwt)
+        if optional_user_read is None:
+            utc_time = datetime.datetime.now(datetime.timezone.utc).strftime(
+                "%Y-%m-%d %H:%M:%S"
             )
-        user_read = self.auth_service.get_user_from_jwt(optional_jwt)
-        if user_read is None:
-            return JSONResponse(
+            response = JSONResponse(
                 content={"detail": "Please login first", "timestamp": utc_time},
                 status_code=status.HTTP_401_UNAUTHORIZED,
             )
+            await response(scope, receive, send)
+            return
 
-        request.state.user = user_read.model_dump()
-        return await call_next(request)
+        # request.state is stored in the scope, so the route handlers see the user as well
+        request.state.user = optional_user_read.model_dump()
+        await app(scope, receive, send)
@@ -1,9 +1,9 @@
 import datetime
-from typing import Callable
 
-from fastapi import Request, status
+from fastapi import status
 from fastapi.responses import JSONResponse
 from loguru import logger
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from py_spring_admin.core.controller.middleware.middleware_base import MiddlewareBase
 from py_spring_admin.core.service.errors import HandledServerError
@@ -12,28 +12,51 @@ from py_spring_admin.core.service.errors import HandledServerError
 class ExceptionMiddleware(MiddlewareBase):
     """
     Middleware for handling exceptions in the application.
+
+    Errors raised after the response has started cannot be turned into a JSON response any more,
+    so they are logged and re-raised.
     """
 
-    async def __call__(self, request: Request, call_next: Callable):
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send, app: ASGIApp
+    ) -> None:
+        if scope["type"] != "http":
+            await app(scope, receive, send)
+            return
+
+        is_response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal is_response_started
+            if message["type"] == "http.response.start":
+                is_response_started = True
+            await send(message)
+
         utc_time = datetime.datetime.now(datetime.timezone.utc).strftime(
             "%Y-%m-%d %H:%M:%S"
         )
         try:
-            return await call_next(request)
-        
+            await app(scope, receive, send_wrapper)
+            return
+
         except HandledServerError as handled_error:
             logger.error(f"Handled Error: {handled_error.message}, code: {handled_error.status_code}")
-            return JSONResponse(
+            if is_response_started:
+                raise
+            response = JSONResponse(
                 content={
                     "timestamp": utc_time,
                     "message": handled_error.message,
                     "status": handled_error.status_code,
                 },
-                status_code= status.HTTP_403_FORBIDDEN,
+                status_code=handled_error.http_status_code,
+                headers=handled_error.headers,
             )
         except Exception as base_exception:
             logger.exception(base_exception)
-            return JSONResponse(
+            if is_response_started:
+                raise
+            response = JSONResponse(
                 content={
                     "timestamp": utc_time,
                     "message": str(base_exception),
@@ -41,3 +64,4 @@ class ExceptionMiddleware(MiddlewareBase):
                 },
                 status_code=status.HTTP_403_FORBIDDEN,
             )
+        await response(scope, receive, send)
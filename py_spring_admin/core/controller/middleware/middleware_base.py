@@ -1,4 +1,29 @@
 from py_spring_core import Component
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 
-class MiddlewareBase(Component): ...
+class MiddlewareBase(Component):
+    """
+    Base class of the admin middlewares, written as pure ASGI middlewares.
+
+    Subclasses implement `__call__` with the ASGI arguments plus the next `app` to call, and are
+    registered with `app.add_middleware(BoundMiddleware, middleware=...)`.
+    """
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send, app: ASGIApp
+    ) -> None:
+        await app(scope, receive, send)
+
+
+class BoundMiddleware:
+    """
+    ASGI app binding a middleware component to the next app in the stack.
+    """
+
+    def __init__(self, app: ASGIApp, middleware: MiddlewareBase) -> None:
+        self.app = app
+        self.middleware = middleware
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.middleware(scope, receive, send, self.app)
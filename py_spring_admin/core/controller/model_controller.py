@@ -1,6 +1,6 @@
-from typing import Annotated, Any
+from typing import Annotated, Any, Optional
 
-from fastapi import Depends, Request
+from fastapi import Body, Depends, Query, Request
 from py_spring_core import RestController
 
 from py_spring_admin.core.controller.depends_utils import get_current_user, require_in_roles, require_role
@@ -8,11 +8,23 @@ from py_spring_admin.core.repository.commons import UserRole
 from py_spring_admin.core.repository.models import User
 from py_spring_admin.core.repository.user_service import UserService
 from py_spring_admin.core.service.auth_service import JWTUser
+from py_spring_admin.core.service.model_query import (
+    PaginationMode,
+    RowCountMode,
+    TableQuery,
+    parse_filters,
+    parse_order_by,
+)
 from py_spring_admin.core.service.model_service import (
+    BulkInsertRequest,
+    BulkSelectionRequest,
+    BulkTransactionResponse,
+    BulkUpdateRequest,
     InputField,
     ModelService,
     TableView,
     TransactionResponse,
+    UpdateTransactionResponse,
 )
 
 
@@ -29,49 +41,108 @@ class ModelController(RestController):
 
     def register_routes(self) -> None:
         @self.router.get("/tables")
-        def get_all_tables() -> list[str]:
+        async def get_all_tables() -> list[str]:
             return self.model_service.find_all_tables()
 
         @self.router.get("/models/{table_name}")
-        def get_all_models_in_table(table_name: str) -> TableView:
-            return self.model_service.find_all_models_in_table(table_name)
+        async def get_all_models_in_table(
+            table_name: str,
+            page: Annotated[int, Query(ge=1)] = 1,
+            page_size: Annotated[Optional[int], Query(ge=1)] = None,
+            pagination_mode: PaginationMode = PaginationMode.Offset,
+            cursor: Optional[str] = None,
+            columns: Annotated[Optional[list[str]], Query()] = None,
+            filters: Optional[str] = None,
+            order_by: Annotated[Optional[list[str]], Query()] = None,
+            count_mode: Optional[RowCountMode] = None,
+        ) -> TableView:
+            """
+            `columns` may be repeated to select a projection; `filters` is a JSON array of
+            `{"column": ..., "operator": "eq|in|range|prefix|is_null", "value": ...}` objects;
+            `order_by` may be repeated, with a leading `-` for descending order;
+            `count_mode` adds an exact (cached) or estimated total row count to the pagination.
+            """
+            query = TableQuery(
+                page=page,
+                page_size=page_size,
+                pagination_mode=pagination_mode,
+                cursor=cursor,
+                columns=columns,
+                filters=parse_filters(filters),
+                order_by=parse_order_by(order_by),
+                count_mode=count_mode,
+            )
+            return await self.model_service.async_find_all_models_in_table(table_name, query)
 
         @self.router.get("/models/enum_choices/{table_name}/{column_name}")
-        def get_enum_choices_for_column(table_name: str, column_name: str) -> list[str]:
+        async def get_enum_choices_for_column(table_name: str, column_name: str) -> list[str]:
             return self.model_service.get_table_column_enum_choices(
                 table_name, column_name
             )
 
         @self.router.post("/models/{table_name}")
         @require_role(UserRole.Admin)
-        def add_model_into_table(
+        async def add_model_into_table(
             user: Annotated[JWTUser, Depends(get_current_user)],
             table_name: str,
             fields: list[InputField],
         ) -> TransactionResponse:
-            return self.model_service.add_model_into_table_by_input_fields(
+            return await self.model_service.async_add_model_into_table_by_input_fields(
                 table_name, fields
             )
 
+        @self.router.post("/models/{table_name}/bulk")
+        @require_role(UserRole.Admin)
+        async def bulk_add_models_into_table(
+            user: Annotated[JWTUser, Depends(get_current_user)],
+            table_name: str,
+            bulk_insert_request: BulkInsertRequest,
+        ) -> BulkTransactionResponse:
+            return await self.model_service.async_bulk_add_models_into_table(
+                table_name, bulk_insert_request.rows, bulk_insert_request.mode
+            )
+
         @self.router.delete("/models/{table_name}")
         @require_role(UserRole.Admin)
-        def delete_model_from_table(
+        async def delete_model_from_table(
             user: Annotated[JWTUser, Depends(get_current_user)],
             table_name: str,
             primary_key_ids_query: dict[str, Any],
         ) -> TransactionResponse:
-            return self.model_service.delete_model_from_table(
+            return await self.model_service.async_delete_model_from_table(
                 table_name, primary_key_ids_query
             )
 
+        @self.router.delete("/models/{table_name}/bulk")
+        @require_role(UserRole.Admin)
+        async def bulk_delete_models_from_table(
+            user: Annotated[JWTUser, Depends(get_current_user)],
+            table_name: str,
+            selection: BulkSelectionRequest,
+        ) -> TransactionResponse:
+            return await self.model_service.async_bulk_delete_models_from_table(table_name, selection)
+
+        @self.router.put("/models/{table_name}/bulk")
+        @require_role(UserRole.Admin)
+        async def bulk_update_models_in_table(
+            user: Annotated[JWTUser, Depends(get_current_user)],
+            table_name: str,
+            update_request: BulkUpdateRequest,
+        ) -> TransactionResponse:
+            return await self.model_service.async_bulk_update_models_in_table(table_name, update_request)
+
         @self.router.put("/models/{table_name}")
         @require_role(UserRole.Admin)
-        def update_model_in_table(
+        async def update_model_in_table(
             user: Annotated[JWTUser, Depends(get_current_user)],
             table_name: str,
             primary_key_ids_query: dict[str, Any],
             updated_model_json_dict: dict[str, Any],
-        ) -> TransactionResponse:
-            return self.model_service.update_model_in_table(
-                table_name, primary_key_ids_query, updated_model_json_dict
+            expected_version: Annotated[Optional[Any], Body()] = None,
+        ) -> UpdateTransactionResponse:
+            return await self.model_service.async_update_model_in_table(
+                table_name,
+                primary_key_ids_query,
+                updated_model_json_dict,
+                expected_version=expected_version,
             )
@@ -0,0 +1,58 @@
+from typing import Annotated, AsyncIterator, ClassVar, Generator
+
+import anyio
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+from py_spring_core import RestController
+from starlette.concurrency import run_in_threadpool
+
+from py_spring_admin.core.service.model_service import ExportFormat, ModelService
+
+
+class ModelExportController(RestController):
+    """
+    ModelExportController streams whole tables as NDJSON or CSV downloads.
+    """
+
+    model_service: ModelService
+
+    MEDIA_TYPES: ClassVar[dict[ExportFormat, str]] = {
+        ExportFormat.NDJSON: "application/x-ndjson",
+        ExportFormat.CSV: "text/csv",
+    }
+
+    class Config:
+        prefix: str = "/spring-admin/private"
+
+    def register_routes(self) -> None:
+        @self.router.get("/models/{table_name}/export")
+        def export_models_in_table(
+            table_name: str,
+            export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+        ) -> StreamingResponse:
+            chunks = self.model_service.export_table(table_name, export_format)
+            return StreamingResponse(
+                self._iterate_chunks(chunks),
+                media_type=self.MEDIA_TYPES[export_format],
+                headers={
+                    "Content-Disposition": f'attachment; filename="{table_name}.{export_format.value}"'
+                },
+            )
+
+    async def _iterate_chunks(self, chunks: Generator[str, None, None]) -> AsyncIterator[str]:
+        """
+        Pulls chunks from the blocking export iterator in the threadpool.
+        When the client disconnects the response task is cancelled, and the iterator is closed
+        here so its database cursor is released instead of draining the rest of the table. The
+        close is shielded from that cancellation, which would otherwise abort it at its first
+        checkpoint and leave the cursor to the garbage collector.
+        """
+        try:
+            while True:
+                chunk = await run_in_threadpool(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            with anyio.CancelScope(shield=True):
+                await run_in_threadpool(chunks.close)
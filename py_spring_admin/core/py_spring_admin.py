@@ -3,6 +3,7 @@ from py_spring_core import Component, Properties
 
 from py_spring_admin.core.repository.models import User, UserRole
 from py_spring_admin.core.repository.user_repository import UserRepository
+from py_spring_admin.core.repository.user_service import UserService
 from py_spring_admin.core.service.auth_service import AuthService
 
 
@@ -17,9 +18,18 @@ class PySpringAdmin(Component):
     __key__ = "py_spring_admin"
     admin_user_properties: AdminUserProperties
     user_repo: UserRepository
+    user_service: UserService
     auth_service: AuthService
 
     def post_construct(self) -> None:
+        is_admin_exists = (
+            self.user_service.find_user_by_user_name(self.admin_user_properties.user_name)
+            is not None
+        )
+        if is_admin_exists:
+            logger.warning("[ADMIN USER EXISTS] Admin user already exists")
+            return
+        # only hashed when the admin user is created, sparing a bcrypt round on every startup
         admin_user = User(
             user_name=self.admin_user_properties.user_name,
             password=self.auth_service.get_hashed_password(
@@ -28,10 +38,4 @@ class PySpringAdmin(Component):
             email=self.admin_user_properties.email,
             role=UserRole.Admin,
         )
-        is_admin_exists = (
-            self.user_repo.find_user_by_user_name(admin_user.user_name) is not None
-        )
-        if is_admin_exists:
-            logger.warning("[ADMIN USER EXISTS] Admin user already exists")
-            return
         self.user_repo.save(admin_user)
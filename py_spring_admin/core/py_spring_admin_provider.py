@@ -1,6 +1,9 @@
 from py_spring_core import EntityProvider
 
 from py_spring_admin.core.controller.admin_main_controller import AdminMainController
+from py_spring_admin.core.controller.admin_metrics_controller import (
+    AdminMetricsController,
+)
 from py_spring_admin.core.controller.admin_site_static_file_controller import (
     AdminSiteStaticFileController,
 )
@@ -13,18 +16,40 @@ from py_spring_admin.core.controller.middleware.exception_middleware import (
     ExceptionMiddleware,
 )
 from py_spring_admin.core.controller.model_controller import ModelController
+from py_spring_admin.core.controller.model_export_controller import (
+    ModelExportController,
+)
 from py_spring_admin.core.controller.vendor.google_auth_controller import GoogleAuthController
 from py_spring_admin.core.py_spring_admin import AdminUserProperties, PySpringAdmin
-from py_spring_admin.core.repository.models import User
+from py_spring_admin.core.repository.async_database import (
+    AsyncDatabase,
+    AsyncDatabaseProperties,
+)
+from py_spring_admin.core.repository.models import (
+    EmailOutboxMessage,
+    OneTimePasswordRecord,
+    RevokedToken,
+    User,
+)
 from py_spring_admin.core.repository.user_repository import UserRepository
-from py_spring_admin.core.repository.user_service import UserService
+from py_spring_admin.core.repository.user_service import (
+    UserCacheProperties,
+    UserService,
+)
 from py_spring_admin.core.service.auth_service import (
-    AdminSecurityProperties,
     AuthService,
     SecurityBeanCollection,
 )
-from py_spring_admin.core.service.model_service import ModelService
-from py_spring_admin.core.service.otp_service import OtpService
+from py_spring_admin.core.service.model_service import (
+    ModelService,
+    ModelServiceProperties,
+)
+from py_spring_admin.core.service.otp_service import OtpProperties, OtpService
+from py_spring_admin.core.service.password_hashing_service import (
+    PasswordHashingProperties,
+    PasswordHashingService,
+)
+from py_spring_admin.core.service.security_properties import AdminSecurityProperties
 from py_spring_admin.core.service.smtp_service import SmtpProperties, SmtpService
 from py_spring_admin.core.service.vendor.google_auth_service import GoogleAuthService
 
@@ -41,7 +66,9 @@ def provide_py_spring_admin() -> EntityProvider:
     provider = EntityProvider(
         component_classes=[
             PySpringAdmin,
+            AsyncDatabase,
             UserRepository,
+            PasswordHashingService,
             UserService,
             AuthService,
             GoogleAuthService,
@@ -56,15 +83,27 @@ def provide_py_spring_admin() -> EntityProvider:
             AdminSecurityProperties,
             AuthMiddlewareProperties,
             SmtpProperties,
+            ModelServiceProperties,
+            AsyncDatabaseProperties,
+            PasswordHashingProperties,
+            OtpProperties,
+            UserCacheProperties,
         ],
         bean_collection_classes=[SecurityBeanCollection],
         rest_controller_classes=[
             AdminMainController,
             AdminAuthController,
             ModelController,
+            ModelExportController,
+            AdminMetricsController,
             GoogleAuthController,
             AdminSiteStaticFileController
         ],
-        extneral_dependencies=[User],
+        extneral_dependencies=[
+            User,
+            RevokedToken,
+            EmailOutboxMessage,
+            OneTimePasswordRecord,
+        ],
     )
     return provider
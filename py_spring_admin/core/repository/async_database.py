@@ -0,0 +1,113 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, ClassVar, Optional, TypeVar
+
+from py_spring_core import Component, Properties
+from py_spring_model import PySpringModel
+from pydantic import Field
+from sqlalchemy.engine import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+
+
+class AsyncDatabaseProperties(Properties):
+    __key__ = "async_database"
+    is_enabled: bool = Field(default=False)
+    database_url: Optional[str] = Field(default=None)
+
+
+class AsyncDatabase(Component):
+    """
+    Optional async engine and session mode, for services that serve async route handlers.
+
+    When enabled, `run_in_session` runs session work on an `AsyncSession` (asyncpg, aiosqlite),
+    so awaiting it does not hold a threadpool worker while the database responds. Synchronous
+    session code is reused through `AsyncSession.run_sync`. The async URL defaults to the URL of
+    the `PySpringModel` engine with the async driver of its backend, e.g. `postgresql+asyncpg`.
+
+    When disabled, `run_in_session` runs the same code on a `PySpringModel` managed session in
+    the threadpool, so callers do not need to branch on the mode.
+
+    Requires the `async` extra (asyncpg / aiosqlite) when enabled.
+    """
+
+    async_database_properties: AsyncDatabaseProperties
+
+    ASYNC_DRIVERS: ClassVar[dict[str, str]] = {
+        "postgresql": "postgresql+asyncpg",
+        "sqlite": "sqlite+aiosqlite",
+    }
+
+    def __init__(self) -> None:
+        self.optional_engine: Optional[AsyncEngine] = None
+        self.optional_session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+
+    def is_enabled(self) -> bool:
+        return self.async_database_properties.is_enabled
+
+    def _get_async_database_url(self) -> str | URL:
+        if self.async_database_properties.database_url is not None:
+            return self.async_database_properties.database_url
+        with PySpringModel.create_managed_session() as session:
+            sync_url = session.get_bind().url
+        backend_name = sync_url.get_backend_name()
+        if backend_name not in self.ASYNC_DRIVERS:
+            raise ValueError(
+                f"[ASYNC DATABASE] No async driver known for backend: {backend_name}, please set async_database.database_url"
+            )
+        return sync_url.set(drivername=self.ASYNC_DRIVERS[backend_name])
+
+    def _get_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        if self.optional_session_factory is None:
+            self.optional_engine = create_async_engine(self._get_async_database_url())
+            self.optional_session_factory = async_sessionmaker(
+                self.optional_engine, class_=AsyncSession, expire_on_commit=False
+            )
+        return self.optional_session_factory
+
+    @asynccontextmanager
+    async def create_managed_session(self) -> AsyncIterator[AsyncSession]:
+        async with self._get_session_factory()() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    async def run_in_session(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Runs `func(session, *args, **kwargs)` in a managed transaction, committing on success.
+        """
+        if not self.is_enabled():
+            return await run_in_threadpool(
+                self._run_in_sync_session, func, *args, **kwargs
+            )
+        async with self.create_managed_session() as session:
+            return await session.run_sync(func, *args, **kwargs)
+
+    def _run_in_sync_session(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        with PySpringModel.create_managed_session() as session:
+            return func(session, *args, **kwargs)
+
+    async def dispose(self) -> None:
+        """
+        Closes the connections of the async engine through the async pool, if it was created.
+        """
+        if self.optional_engine is None:
+            return
+        await self.optional_engine.dispose()
+        self.optional_engine = None
+        self.optional_session_factory = None
+
+    def pre_destroy(self) -> None:
+        # destruction hooks run once the server and its event loop have stopped
+        if self.optional_engine is not None:
+            asyncio.run(self.dispose())
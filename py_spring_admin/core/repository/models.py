@@ -1,3 +1,4 @@
+import datetime
 from typing import Annotated, Optional
 
 from py_spring_model import PySpringModel
@@ -5,7 +6,7 @@ from pydantic import EmailStr
 from sqlmodel import Field
 from typing_extensions import ReadOnly
 
-from py_spring_admin.core.repository.commons import UserRead, UserRole
+from py_spring_admin.core.repository.commons import StrEnum, UserRead, UserRole
 
 
 class User(PySpringModel, table=True):
@@ -19,3 +20,43 @@ class User(PySpringModel, table=True):
 
     def as_read(self) -> UserRead:
         return UserRead(id=self.id, role=self.role, user_name=self.user_name, is_verified=self.is_verified)
+
+
+class RevokedToken(PySpringModel, table=True):
+    __tablename__: str = "app_revoked_token"
+    __is_internal_table__ = True
+    jti: str = Field(primary_key=True)
+    expired_at: Optional[datetime.datetime] = Field(default=None, index=True)
+
+
+class EmailOutboxStatus(StrEnum):
+    Pending = "pending"
+    Sending = "sending"
+    Sent = "sent"
+    Dead = "dead"
+
+
+class EmailOutboxMessage(PySpringModel, table=True):
+    __tablename__: str = "app_email_outbox"
+    __is_internal_table__ = True
+    id: Optional[int] = Field(default=None, primary_key=True)
+    receiver_email: str
+    # full email bodies, including OTPs, must never be dumped
+    raw_message: str = Field(exclude=True)
+    status: str = Field(default=EmailOutboxStatus.Pending, index=True)
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime.datetime = Field(index=True)
+    claim_token: Optional[str] = Field(default=None, index=True)
+    claimed_until: Optional[datetime.datetime] = Field(default=None)
+    last_error: Optional[str] = Field(default=None, max_length=1024)
+    created_at: datetime.datetime
+    sent_at: Optional[datetime.datetime] = Field(default=None)
+
+
+class OneTimePasswordRecord(PySpringModel, table=True):
+    __tablename__: str = "app_one_time_password"
+    __is_internal_table__ = True
+    user_id: str = Field(primary_key=True)
+    purpose: str = Field(primary_key=True)
+    code_hash: str = Field(exclude=True)
+    expired_at: datetime.datetime = Field(index=True)
@@ -0,0 +1,114 @@
+import threading
+from typing import Any, Optional
+
+import cachetools
+from pydantic import BaseModel, computed_field
+
+from py_spring_admin.core.repository.models import User
+
+
+class UserCacheMetrics(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    invalidations: int
+
+    @computed_field
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0
+        return self.hits / lookups
+
+
+def _copy_user(user: User) -> User:
+    # a fresh, session-less copy, so callers never share (or mutate) the cached instance
+    return User(**{field_name: getattr(user, field_name) for field_name in User.model_fields})
+
+
+class UserCache:
+    """
+    Bounded TTL cache of `User` rows, looked up by email, user name or id. Each user takes one
+    entry per key out of `max_size`.
+
+    A user is cached under all three keys at once, and a committed write to the user must call
+    `invalidate`, which drops every key derived from it. A row loaded before an invalidation is
+    not cached (see `put`), so a lookup racing a write cannot bring the old row back. Missing
+    users are not cached, so a newly registered user is visible right away. Writes made by other
+    processes are only seen once the cached entry expires after `ttl_seconds`.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.cache: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=max_size, ttl=ttl_seconds
+        )
+        self.cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def to_key(field_name: str, value: Any) -> str:
+        return f"{field_name}:{value}"
+
+    def _to_keys(self, email: str, user_name: str, user_id: Optional[int]) -> list[str]:
+        return [
+            self.to_key("email", email),
+            self.to_key("user_name", user_name),
+            self.to_key("id", user_id),
+        ]
+
+    def get_generation(self) -> int:
+        """
+        Returns:
+            int: The number of invalidations so far, to pass to `put` for a row loaded after it.
+        """
+        with self.cache_lock:
+            return self.invalidations
+
+    def get(self, key: str) -> Optional[User]:
+        with self.cache_lock:
+            optional_user = self.cache.get(key)
+            if optional_user is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _copy_user(optional_user)
+
+    def put(self, user: User, generation: int) -> None:
+        """
+        Caches a loaded user, unless a user was invalidated since `generation` was taken, since
+        the row may then have been loaded before that write.
+        """
+        cached_user = _copy_user(user)
+        with self.cache_lock:
+            if generation != self.invalidations:
+                return
+            for key in self._to_keys(cached_user.email, cached_user.user_name, cached_user.id):
+                self.cache[key] = cached_user
+
+    def invalidate(self, email: str, user_name: str, user_id: Optional[int]) -> None:
+        with self.cache_lock:
+            for key in self._to_keys(email, user_name, user_id):
+                self.cache.pop(key, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """
+        Drops every cached user, for writes that may touch any number of users.
+        """
+        with self.cache_lock:
+            self.cache.clear()
+            self.invalidations += 1
+
+    def get_metrics(self) -> UserCacheMetrics:
+        with self.cache_lock:
+            return UserCacheMetrics(
+                size=len(self.cache),
+                max_size=int(self.cache.maxsize),
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+            )
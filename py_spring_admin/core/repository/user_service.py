@@ -1,20 +1,19 @@
-from typing import Optional
+import threading
+from typing import Any, Callable, Optional
 
 from loguru import logger
-from passlib.context import CryptContext
-from py_spring_core import Component
+from py_spring_core import Component, Properties
 from py_spring_model import PySpringModel
 from pydantic import BaseModel, Field
+from sqlalchemy.orm import Session
 
-from py_spring_core.core.entities.component import Component
-from pydantic import BaseModel
-from passlib.context import CryptContext
+from py_spring_admin.core.repository.async_database import AsyncDatabase
 from py_spring_admin.core.repository.commons import UserRead
 from py_spring_admin.core.repository.models import User, UserRole
+from py_spring_admin.core.repository.user_cache import UserCache, UserCacheMetrics
 from py_spring_admin.core.repository.user_repository import UserRepository
-from py_spring_model import PySpringModel
-
 from py_spring_admin.core.service.errors import StatusCode, UserAlreadyRegistered, UserNotFound
+from py_spring_admin.core.service.password_hashing_service import PasswordHashingService
 
 class RegisterUser(BaseModel):
     user_name: str
@@ -24,21 +23,131 @@ class RegisterUser(BaseModel):
     is_verified: bool = Field(default=False)
 
 
+class UserCacheProperties(Properties):
+    __key__ = "user_cache"
+    is_enabled: bool = Field(default=True)
+    max_size: int = Field(default=30_000, gt=0)
+    ttl_seconds: float = Field(default=30, gt=0)
+
+
 class UserService(Component):
+    """
+    Finds, registers and updates users.
+
+    Finders read through a `UserCache` keyed by email, user name and id (see
+    `UserCacheProperties`), and every write here invalidates the written user; writes through
+    `ModelService` clear the whole cache. Writes made by other workers become visible once the
+    cached entry expires.
+    """
+
     user_repo: UserRepository
-    password_context: CryptContext
+    password_hashing_service: PasswordHashingService
+    async_database: AsyncDatabase
+    user_cache_properties: UserCacheProperties
+
+    def __init__(self) -> None:
+        self.optional_user_cache: Optional[UserCache] = None
+        self.lock = threading.Lock()
+
+    def _get_user_cache(self) -> Optional[UserCache]:
+        # created on first use, since components may look users up in their own
+        # post_construct before this one is initialized
+        if not self.user_cache_properties.is_enabled:
+            return None
+        with self.lock:
+            if self.optional_user_cache is None:
+                self.optional_user_cache = UserCache(
+                    max_size=self.user_cache_properties.max_size,
+                    ttl_seconds=self.user_cache_properties.ttl_seconds,
+                )
+            return self.optional_user_cache
+
+    def _find_user(
+        self, field_name: str, value: Any, find: Callable[[], Optional[User]]
+    ) -> Optional[User]:
+        optional_user_cache = self._get_user_cache()
+        if optional_user_cache is None:
+            return find()
+        optional_user = optional_user_cache.get(UserCache.to_key(field_name, value))
+        if optional_user is not None:
+            return optional_user
+        generation = optional_user_cache.get_generation()
+        optional_user = find()
+        if optional_user is not None:
+            optional_user_cache.put(optional_user, generation)
+        return optional_user
+
+    async def _async_find_user(self, field_name: str, value: Any) -> Optional[User]:
+        optional_user_cache = self._get_user_cache()
+        if optional_user_cache is None:
+            return await self.async_database.run_in_session(
+                self._find_user_in_session, {field_name: value}
+            )
+        optional_user = optional_user_cache.get(UserCache.to_key(field_name, value))
+        if optional_user is not None:
+            return optional_user
+        generation = optional_user_cache.get_generation()
+        optional_user = await self.async_database.run_in_session(
+            self._find_user_in_session, {field_name: value}
+        )
+        if optional_user is not None:
+            optional_user_cache.put(optional_user, generation)
+        return optional_user
+
+    def _invalidate_cached_user(self, email: str, user_read: UserRead) -> None:
+        # called once the write is committed, so no lookup can load the old row afterwards
+        optional_user_cache = self._get_user_cache()
+        if optional_user_cache is not None:
+            optional_user_cache.invalidate(email, user_read.user_name, user_read.id)
+
+    def clear_user_cache(self) -> None:
+        """
+        Drops every cached user. Must be called after writes to the user table made outside this
+        service, e.g. through `ModelService`.
+        """
+        optional_user_cache = self._get_user_cache()
+        if optional_user_cache is not None:
+            optional_user_cache.clear()
+
+    def get_user_cache_metrics(self) -> Optional[UserCacheMetrics]:
+        optional_user_cache = self._get_user_cache()
+        if optional_user_cache is None:
+            return None
+        return optional_user_cache.get_metrics()
 
     def find_user_by_user_name(self, user_name: str) -> Optional[User]:
-        return self.user_repo.find_user_by_user_name(user_name)
+        return self._find_user(
+            "user_name", user_name, lambda: self.user_repo.find_user_by_user_name(user_name)
+        )
 
     def find_user_by_email(self, email: str) -> Optional[User]:
-        return self.user_repo.find_user_by_email(email)
+        return self._find_user(
+            "email", email, lambda: self.user_repo.find_user_by_email(email)
+        )
 
     def find_user_by_id(self, user_id: int) -> Optional[User]:
-        return self.user_repo.find_by_id(user_id)
+        return self._find_user("id", user_id, lambda: self.user_repo.find_by_id(user_id))
+
+    async def async_find_user_by_user_name(self, user_name: str) -> Optional[User]:
+        return await self._async_find_user("user_name", user_name)
+
+    async def async_find_user_by_email(self, email: str) -> Optional[User]:
+        return await self._async_find_user("email", email)
+
+    async def async_find_user_by_id(self, user_id: int) -> Optional[User]:
+        return await self._async_find_user("id", user_id)
+
+    def _find_user_in_session(
+        self, session: Session, query: dict[str, Any]
+    ) -> Optional[User]:
+        _, optional_user = self.user_repo._find_by_query(query, session)
+        if optional_user is not None:
+            # detach the loaded user so it stays readable after the session closes
+            session.expunge(optional_user)
+        return optional_user
 
     def get_hashed_password(self, raw_password: str) -> str:
-        return self.password_context.hash(raw_password)
+        return self.password_hashing_service.hash_password(raw_password)
 
     def update_user_password(self, user_email: str, new_password: str) -> UserRead:
         with PySpringModel.create_managed_session() as session:
@@ -51,21 +160,32 @@ class UserService(Component):
             logger.info(f"User password updated: {optional_user}")
             user_read = optional_user.as_read()
 
+        self._invalidate_cached_user(user_email, user_read)
         return user_read
     
     def update_user_email_verified(self, user_email: str) -> UserRead:
         with PySpringModel.create_managed_session() as session:
-            _, optional_user = self.user_repo._find_by_query(
-                {"email": user_email}, session
-            )
-            if optional_user is None:
-                raise UserNotFound()
-            optional_user.is_verified = True
-            logger.info(f"User email verified: {optional_user}")
-            user_read = optional_user.as_read()
+            user_read = self._update_user_email_verified_in_session(session, user_email)
+        self._invalidate_cached_user(user_email, user_read)
+        return user_read
 
+    async def async_update_user_email_verified(self, user_email: str) -> UserRead:
+        user_read = await self.async_database.run_in_session(
+            self._update_user_email_verified_in_session, user_email
+        )
+        self._invalidate_cached_user(user_email, user_read)
         return user_read
 
+    def _update_user_email_verified_in_session(
+        self, session: Session, user_email: str
+    ) -> UserRead:
+        _, optional_user = self.user_repo._find_by_query({"email": user_email}, session)
+        if optional_user is None:
+            raise UserNotFound()
+        optional_user.is_verified = True
+        logger.info(f"User email verified: {optional_user}")
+        return optional_user.as_read()
+
 
     def register_user(self, new_user: RegisterUser) -> User:
         optional_user = self.find_user_by_email(new_user.email)
@@ -85,4 +205,6 @@ class UserService(Component):
             role=new_user.role,
             is_verified=new_user.is_verified,
         )
-        return self.user_repo.save(user)
+        saved_user = self.user_repo.save(user)
+        self._invalidate_cached_user(saved_user.email, saved_user.as_read())
+        return saved_user
@@ -1,4 +1,5 @@
 import logging
+import time
 from email.message import EmailMessage
 from typing import Any, Optional, Type, TypeVar
 from uuid import uuid4
@@ -9,17 +10,26 @@ import cryptography.fernet
 import jwt
 from loguru import logger
 from passlib.context import CryptContext
-from py_spring_core import BeanCollection, Component, Properties
-from pydantic import BaseModel, Field, ValidationError
+from py_spring_core import BeanCollection, Component
+from pydantic import BaseModel, ValidationError
 from typing_extensions import TypedDict
 
-from py_spring_admin.core.service.errors import PasswordDoesNotMatch, UserNotFound
+from py_spring_admin.core.service.errors import (
+    PasswordDoesNotMatch,
+    TooManyRequests,
+    UserNotFound,
+)
 import py_spring_admin.core.service.template as template
 from py_spring_admin.core.repository.commons import JWTUser, UserRead
 from py_spring_admin.core.repository.models import User
 from py_spring_admin.core.repository.user_service import UserService
+from py_spring_admin.core.service.password_hashing_service import PasswordHashingService
+from py_spring_admin.core.service.rate_limiter import SlidingWindowRateLimiter
+from py_spring_admin.core.service.security_properties import AdminSecurityProperties
 from py_spring_admin.core.service.otp_service import InvalidOtpError, OtpPurpose, OtpService
 from py_spring_admin.core.service.smtp_service import EmailContentType, SmtpService
+from py_spring_admin.core.service.token_revocation_store import TokenRevocationStore
+from py_spring_admin.core.service.verified_token_cache import VerifiedTokenCache
 from py_spring_admin.core.service.commons import JsonWebTokenEncrypted, Token, IsSendEmailSuccess, JsonWebToken
 
 
@@ -29,13 +39,6 @@ T = TypeVar("T", bound=BaseModel)
 
 
 
-class AdminSecurityProperties(Properties):
-    __key__ = "admin_security"
-    secret: str = Field(default_factory=lambda: str(uuid4()))
-
-
-
-
 class SecurityBeanCollection(BeanCollection):
     admin_security_properties: AdminSecurityProperties
 
@@ -55,7 +58,7 @@ class AuthService(Component):
     Attributes:
         admin_security_properties (AdminSecurityProperties): Configuration properties for admin security.
         uesr_service (UserService): Service for user-related operations.
-        password_context (CryptContext): Context for password hashing and verification.
+        password_hashing_service (PasswordHashingService): Hashes and verifies passwords on a bounded worker pool.
     Methods:
         post_construct() -> None:
             Initializes the service by setting the logging level for passlib.
@@ -69,6 +72,10 @@ class AuthService(Component):
             Authenticates a user by their username and password, then issues a JWT.
         user_login_by_email(email: str, password: str) -> JsonWebToken:
             Authenticates a user by their email and password, then issues a JWT.
+        async_user_login_by_user_name / async_user_login_by_email:
+            Same as above, awaiting the user lookup and the password verification.
+        check_rate_limit(keys: list[str]) -> None:
+            Counts a login or OTP attempt for each key, raising TooManyRequests when any is over the limit.
         get_user_from_jwt(token: str) -> Optional[UserRead]:
             Validates a JWT and returns the corresponding user information if valid.
         __issue_token(payload: dict[str, Any]) -> JsonWebToken:
@@ -78,18 +85,54 @@ class AuthService(Component):
     admin_security_properties: AdminSecurityProperties
     uesr_service: UserService
     smtp_service: SmtpService
-    password_context: CryptContext
+    password_hashing_service: PasswordHashingService
     fernet: Fernet
     otp_service: OtpService
 
     def post_construct(self) -> None:
         logging.getLogger("passlib").setLevel(logging.ERROR)  # Hide passlib logs
+        self.verified_token_cache = VerifiedTokenCache(
+            max_size=self.admin_security_properties.verified_token_cache_size,
+            max_ttl_seconds=self.admin_security_properties.verified_token_cache_ttl_seconds,
+        )
+        self.token_revocation_store = TokenRevocationStore(
+            is_persisted=self.admin_security_properties.is_token_revocation_persisted,
+            max_retention_seconds=self.admin_security_properties.token_revocation_max_retention_seconds,
+            check_interval_seconds=self.admin_security_properties.token_revocation_check_interval_seconds,
+            max_checked_tokens=self.admin_security_properties.verified_token_cache_size,
+        )
+        self.token_revocation_store.load()
+        self.rate_limiter = SlidingWindowRateLimiter(
+            max_requests=self.admin_security_properties.rate_limit_max_attempts,
+            window_seconds=self.admin_security_properties.rate_limit_window_seconds,
+            max_keys=self.admin_security_properties.rate_limit_max_keys,
+        )
+
+    def check_rate_limit(self, keys: list[str]) -> None:
+        """
+        Counts one login or OTP attempt for each key (e.g. the client IP and the targeted email),
+        before any password hashing or OTP check is done for it.
+
+        Args:
+            keys (list[str]): The keys the attempt is throttled by.
+
+        Raises:
+            TooManyRequests: If any key is over the limit, with the longest wait as `Retry-After`;
+                the attempt is then counted against none of the keys.
+        """
+        optional_retry_after_seconds = self.rate_limiter.hit_all(keys)
+        if optional_retry_after_seconds is None:
+            return
+        logger.warning(f"[RATE LIMIT] Attempt throttled for keys: {keys}")
+        raise TooManyRequests(
+            SlidingWindowRateLimiter.to_retry_after_header(optional_retry_after_seconds)
+        )
 
     def get_hashed_password(self, raw_password: str) -> str:
-        return self.password_context.hash(raw_password)
+        return self.password_hashing_service.hash_password(raw_password)
 
     def __is_correct_password(self, raw_password: str, hashed_password: str) -> bool:
-        return self.password_context.verify(raw_password, hashed_password)
+        return self.password_hashing_service.verify_password(raw_password, hashed_password)
 
     def __login_user(
         self, optional_user: Optional[User], password: str
@@ -101,6 +144,20 @@ class AuthService(Component):
             raise PasswordDoesNotMatch()
 
         return self.issue_token(optional_user.model_dump(), is_encrypted= False)
+
+    async def __async_login_user(
+        self, optional_user: Optional[User], password: str
+    ) -> JsonWebToken:
+        if optional_user is None:
+            raise UserNotFound()
+
+        is_correct_password = await self.password_hashing_service.async_verify_password(
+            password, optional_user.password
+        )
+        if not is_correct_password:
+            raise PasswordDoesNotMatch()
+
+        return self.issue_token(optional_user.model_dump(), is_encrypted= False)
     
     def user_login_by_user_name_without_password(self, user: User) -> JsonWebToken:
         """
@@ -128,6 +185,16 @@ class AuthService(Component):
     def user_login_by_email(self, email: str, password: str) -> JsonWebToken:
         optional_user = self.uesr_service.find_user_by_email(email)
         return self.__login_user(optional_user, password)
+
+    async def async_user_login_by_user_name(
+        self, user_name: str, password: str
+    ) -> JsonWebToken:
+        optional_user = await self.uesr_service.async_find_user_by_user_name(user_name)
+        return await self.__async_login_user(optional_user, password)
+
+    async def async_user_login_by_email(self, email: str, password: str) -> JsonWebToken:
+        optional_user = await self.uesr_service.async_find_user_by_email(email)
+        return await self.__async_login_user(optional_user, password)
     
     def _get_user_by_email(self, email: str) -> User:
         optional_user = self.uesr_service.find_user_by_email(email)
@@ -210,10 +277,25 @@ class AuthService(Component):
     def get_user_from_jwt(self, token: str) -> Optional[UserRead]:
         """
         Validates a JSON Web Token (JWT) by decoding it using the configured secret key and algorithm.
+        Verified tokens are cached until their `exp` claim (see `VerifiedTokenCache`), so repeated
+        requests with the same token skip the decoding and validation. Tokens whose `jti` claim is
+        revoked are rejected, on cache hits too, so a revocation made while a token is cached
+        takes effect immediately.
 
         Args:
             token (str): The JWT token to validate.
         """
+        optional_verified_token = self.verified_token_cache.get(token)
+        if optional_verified_token is not None:
+            optional_cached_jti = optional_verified_token.optional_jti
+            if optional_cached_jti is None or not self.token_revocation_store.is_revoked(
+                optional_cached_jti
+            ):
+                return optional_verified_token.user_read
+            self.verified_token_cache.evict(token)
+            logger.warning(f"[REVOKED TOKEN] Token rejected: {optional_cached_jti}")
+            return
+
         try:
             jwt_user: JWTUser = jwt.decode(
                 token, self.admin_security_properties.secret, algorithms=["HS256"]
@@ -225,11 +307,70 @@ class AuthService(Component):
             logger.error(invalid_token_error)
             return
 
-        return UserRead.model_validate(jwt_user)
+        optional_jti = jwt_user.get("jti")
+        if optional_jti is not None and self.token_revocation_store.is_revoked(optional_jti):
+            logger.warning(f"[REVOKED TOKEN] Token rejected: {optional_jti}")
+            return
+
+        user_read = UserRead.model_validate(jwt_user)
+        self.verified_token_cache.put(token, user_read, jwt_user.get("exp"), optional_jti)
+        return user_read
+
+    def evict_verified_token(self, token: str) -> bool:
+        """
+        Removes a token from the verified token cache, e.g. when it is revoked, so the next
+        request with it is validated again.
+
+        Args:
+            token (str): The JWT token to evict.
+
+        Returns:
+            bool: Whether the token was cached.
+        """
+        return self.verified_token_cache.evict(token)
+
+    def revoke_token(self, token: str) -> None:
+        """
+        Revokes a JSON Web Token (JWT) until it expires, e.g. on logout.
+        Tokens issued without a `jti` claim cannot be revoked and are only evicted from the cache.
+        The token is revoked before it is evicted, so a concurrent request cannot cache it again
+        in between.
+
+        Args:
+            token (str): The JWT token to revoke.
+        """
+        try:
+            payload: dict[str, Any] = jwt.decode(
+                token,
+                self.admin_security_properties.secret,
+                algorithms=["HS256"],
+                options={"verify_exp": False},
+            )
+        except jwt.exceptions.InvalidTokenError as invalid_token_error:
+            logger.error(invalid_token_error)
+            self.evict_verified_token(token)
+            return
+
+        optional_jti = payload.get("jti")
+        if optional_jti is None:
+            logger.warning("[REVOKE TOKEN] Token has no jti claim, skipping revocation")
+            self.evict_verified_token(token)
+            return
+        self.token_revocation_store.revoke(optional_jti, payload.get("exp"))
+        self.evict_verified_token(token)
+        logger.info(f"[REVOKE TOKEN] Token revoked: {optional_jti}")
 
     def issue_token(self, payload: dict[str, Any], is_encrypted: bool) -> Token:
+        """
+        Issues a JWT with a unique `jti` claim, so it can be revoked, and an `exp` claim when
+        `AdminSecurityProperties.token_ttl_seconds` is set (7 days by default).
+        """
+        claims: dict[str, Any] = {"jti": uuid4().hex}
+        optional_token_ttl_seconds = self.admin_security_properties.token_ttl_seconds
+        if optional_token_ttl_seconds is not None:
+            claims["exp"] = int(time.time()) + optional_token_ttl_seconds
         _jwt = jwt.encode(
-            payload, self.admin_security_properties.secret, algorithm="HS256"
+            {**payload, **claims}, self.admin_security_properties.secret, algorithm="HS256"
         )
         if is_encrypted:
             return self.fernet.encrypt(_jwt.encode()).decode()
@@ -241,9 +382,13 @@ class AuthService(Component):
         except cryptography.fernet.InvalidToken:
             logger.error("Key mismatch for decryption...")
             return
-        payload = jwt.decode(
-            _jwt, self.admin_security_properties.secret, algorithms=["HS256"]
-        )
+        try:
+            payload = jwt.decode(
+                _jwt, self.admin_security_properties.secret, algorithms=["HS256"]
+            )
+        except jwt.exceptions.InvalidTokenError as invalid_token_error:
+            logger.error(invalid_token_error)
+            return
         try:
             return model.model_validate(payload)
         except ValidationError as validation_error:
@@ -0,0 +1,233 @@
+import datetime
+import email
+import email.policy
+import threading
+from email.message import EmailMessage
+from typing import Optional, cast
+from uuid import uuid4
+
+from py_spring_model import PySpringModel
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import ColumnElement, Table, and_, func, or_, select, update
+
+from py_spring_admin.core.repository.models import EmailOutboxMessage, EmailOutboxStatus
+from py_spring_admin.core.service.metrics import TimingMetrics
+
+_OUTBOX_TABLE: Table = EmailOutboxMessage.__table__  # type: ignore
+_LAST_ERROR_MAX_LENGTH: int = _OUTBOX_TABLE.c.last_error.type.length  # type: ignore
+
+
+def _utc_now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class EmailOutboxMetrics(BaseModel):
+    pending_messages: int
+    sending_messages: int
+    dead_messages: int
+    oldest_pending_age_seconds: Optional[float]
+    sent_messages: int
+    failed_attempts: int
+    dead_lettered_messages: int
+    send_latency: TimingMetrics
+
+
+class ClaimedEmail(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    id: int
+    attempts: int
+    created_at: datetime.datetime
+    email_message: EmailMessage
+
+
+class EmailOutbox:
+    """
+    Durable queue of outgoing emails, stored in the `app_email_outbox` table so queued emails
+    survive restarts and several app instances can drain the same outbox.
+
+    Workers claim pending messages in batches by stamping them with a unique claim token and a
+    lease; only the holder of the token can complete them, and messages whose lease expired (e.g.
+    the instance died mid-send) can be claimed again. A failed message is retried with exponential
+    backoff, and moved to the dead-letter state after `max_attempts` attempts.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int,
+        base_backoff_seconds: float,
+        max_backoff_seconds: float,
+        claim_lease_seconds: float,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.claim_lease_seconds = claim_lease_seconds
+        self.lock = threading.Lock()
+        self.sent_messages = 0
+        self.failed_attempts = 0
+        self.dead_lettered_messages = 0
+        self.send_latency = TimingMetrics()
+
+    def enqueue(self, email_message: EmailMessage) -> None:
+        now = _utc_now()
+        with PySpringModel.create_managed_session() as session:
+            session.add(
+                EmailOutboxMessage(
+                    receiver_email=str(email_message["To"]),
+                    raw_message=email_message.as_string(),
+                    next_attempt_at=now,
+                    created_at=now,
+                )
+            )
+
+    def _build_claimable_clause(self, now: datetime.datetime) -> ColumnElement[bool]:
+        table = _OUTBOX_TABLE.c
+        return or_(
+            and_(table.status == EmailOutboxStatus.Pending, table.next_attempt_at <= now),
+            and_(table.status == EmailOutboxStatus.Sending, table.claimed_until < now),
+        )
+
+    def claim_batch(self, batch_size: int) -> tuple[str, list[ClaimedEmail]]:
+        """
+        Claims up to `batch_size` messages due for sending, oldest first.
+
+        The claimable condition is repeated in the outer `UPDATE`, so when two instances race for
+        the same rows, the database re-checks it on the locked rows and only one claim wins.
+
+        Returns:
+            tuple[str, list[ClaimedEmail]]: The claim token and the claimed messages.
+        """
+        table = _OUTBOX_TABLE.c
+        now = _utc_now()
+        claim_token = uuid4().hex
+        claimable_ids = (
+            select(table.id)
+            .where(self._build_claimable_clause(now))
+            .order_by(table.next_attempt_at)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        with PySpringModel.create_managed_session() as session:
+            session.execute(
+                update(_OUTBOX_TABLE)
+                .where(table.id.in_(claimable_ids), self._build_claimable_clause(now))
+                .values(
+                    status=EmailOutboxStatus.Sending,
+                    claim_token=claim_token,
+                    claimed_until=now
+                    + datetime.timedelta(seconds=self.claim_lease_seconds),
+                )
+            )
+            rows = session.execute(
+                select(table.id, table.attempts, table.created_at, table.raw_message).where(
+                    table.claim_token == claim_token
+                )
+            ).all()
+        return claim_token, [
+            ClaimedEmail(
+                id=row.id,
+                attempts=row.attempts,
+                created_at=row.created_at,
+                email_message=cast(
+                    EmailMessage,
+                    email.message_from_string(row.raw_message, policy=email.policy.default),
+                ),
+            )
+            for row in rows
+        ]
+
+    def mark_sent(self, claim_token: str, claimed_emails: list[ClaimedEmail]) -> None:
+        if len(claimed_emails) == 0:
+            return
+        table = _OUTBOX_TABLE.c
+        now = _utc_now()
+        with PySpringModel.create_managed_session() as session:
+            session.execute(
+                update(_OUTBOX_TABLE)
+                .where(
+                    table.id.in_([claimed_email.id for claimed_email in claimed_emails]),
+                    table.claim_token == claim_token,
+                )
+                .values(
+                    status=EmailOutboxStatus.Sent,
+                    sent_at=now,
+                    claim_token=None,
+                    claimed_until=None,
+                )
+            )
+        with self.lock:
+            self.sent_messages += len(claimed_emails)
+            for claimed_email in claimed_emails:
+                self.send_latency.record((now - claimed_email.created_at).total_seconds())
+
+    def _get_backoff_seconds(self, attempts: int) -> float:
+        return min(
+            self.base_backoff_seconds * 2 ** (attempts - 1), self.max_backoff_seconds
+        )
+
+    def mark_failed(
+        self, claim_token: str, claimed_email: ClaimedEmail, error_message: str
+    ) -> None:
+        """
+        Schedules the next attempt of a failed message after an exponential backoff, or moves it
+        to the dead-letter state once it reached `max_attempts`. The error message is stored in
+        `last_error`, truncated to the column length.
+        """
+        table = _OUTBOX_TABLE.c
+        attempts = claimed_email.attempts + 1
+        is_dead = attempts >= self.max_attempts
+        status = EmailOutboxStatus.Dead if is_dead else EmailOutboxStatus.Pending
+        next_attempt_at = _utc_now() + datetime.timedelta(
+            seconds=self._get_backoff_seconds(attempts)
+        )
+        with PySpringModel.create_managed_session() as session:
+            session.execute(
+                update(_OUTBOX_TABLE)
+                .where(table.id == claimed_email.id, table.claim_token == claim_token)
+                .values(
+                    status=status,
+                    attempts=attempts,
+                    next_attempt_at=next_attempt_at,
+                    last_error=error_message[:_LAST_ERROR_MAX_LENGTH],
+                    claim_token=None,
+                    claimed_until=None,
+                )
+            )
+        with self.lock:
+            self.failed_attempts += 1
+            if is_dead:
+                self.dead_lettered_messages += 1
+
+    def get_metrics(self) -> EmailOutboxMetrics:
+        table = _OUTBOX_TABLE.c
+        with PySpringModel.create_managed_session() as session:
+            status_counts: dict[str, int] = {
+                row.status: row.count
+                for row in session.execute(
+                    select(table.status, func.count().label("count"))
+                    .where(table.status != EmailOutboxStatus.Sent)
+                    .group_by(table.status)
+                )
+            }
+            optional_oldest_pending_at = session.execute(
+                select(func.min(table.created_at)).where(
+                    table.status == EmailOutboxStatus.Pending
+                )
+            ).scalar_one()
+        optional_oldest_pending_age_seconds = None
+        if optional_oldest_pending_at is not None:
+            optional_oldest_pending_age_seconds = (
+                _utc_now() - optional_oldest_pending_at
+            ).total_seconds()
+        with self.lock:
+            return EmailOutboxMetrics(
+                pending_messages=status_counts.get(EmailOutboxStatus.Pending, 0),
+                sending_messages=status_counts.get(EmailOutboxStatus.Sending, 0),
+                dead_messages=status_counts.get(EmailOutboxStatus.Dead, 0),
+                oldest_pending_age_seconds=optional_oldest_pending_age_seconds,
+                sent_messages=self.sent_messages,
+                failed_attempts=self.failed_attempts,
+                dead_lettered_messages=self.dead_lettered_messages,
+                send_latency=self.send_latency.model_copy(),
+            )
@@ -1,7 +1,9 @@
 
 
 from enum import Enum
-from typing import Literal
+from typing import Literal, Optional
+
+from fastapi import status
 
 class StatusCode(str, Enum):
     UserAlreadyRegisteredAndVerified = "UserAlreadyRegisteredAndVerified"
@@ -15,15 +17,28 @@ class StatusCode(str, Enum):
     InvalidOtp = "InvalidOtp"
 
     EmailDomainNowAllowed = "InvalidOtp"
+
+    InvalidQuery = "InvalidQuery"
+
+    ServiceUnavailable = "ServiceUnavailable"
+    TooManyRequests = "TooManyRequests"
     
 
 
 
 
 class HandledServerError(Exception):
-    def __init__(self, status_code: str, message: str):
+    def __init__(
+        self,
+        status_code: str,
+        message: str,
+        http_status_code: int = status.HTTP_403_FORBIDDEN,
+        headers: Optional[dict[str, str]] = None,
+    ):
         self.status_code = status_code
         self.message = message
+        self.http_status_code = http_status_code
+        self.headers = headers
 
 class PermissionDeniedError(HandledServerError):
     def __init__(self, message: str):
@@ -56,4 +71,28 @@ class UserEmailNotVerified(HandledServerError):
 
 class EmailDomainNowAllowed(HandledServerError):
     def __init__(self):
-        super().__init__(status_code=StatusCode.EmailDomainNowAllowed, message="Email domain not allowed")
\ No newline at end of file
+        super().__init__(status_code=StatusCode.EmailDomainNowAllowed, message="Email domain not allowed")
+
+
+class InvalidQueryError(HandledServerError):
+    def __init__(self, message: str):
+        super().__init__(status_code=StatusCode.InvalidQuery, message=message)
+
+
+class PasswordHashingUnavailable(HandledServerError):
+    def __init__(self):
+        super().__init__(
+            status_code=StatusCode.ServiceUnavailable,
+            message="Too many password requests, please retry later",
+            http_status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+
+class TooManyRequests(HandledServerError):
+    def __init__(self, retry_after: str):
+        super().__init__(
+            status_code=StatusCode.TooManyRequests,
+            message="Too many attempts, please retry later",
+            http_status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            headers={"Retry-After": retry_after},
+        )
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, computed_field
+
+
+class TimingMetrics(BaseModel):
+    count: int = 0
+    total_seconds: float = 0
+    max_seconds: float = 0
+
+    @computed_field
+    @property
+    def average_seconds(self) -> float:
+        if self.count == 0:
+            return 0
+        return self.total_seconds / self.count
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
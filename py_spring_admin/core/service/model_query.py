@@ -0,0 +1,213 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Optional, Sequence
+
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from sqlalchemy import Column, ColumnElement, String, TypeDecorator, and_, false, or_
+
+from py_spring_admin.core.repository.commons import StrEnum
+from py_spring_admin.core.service.errors import InvalidQueryError
+
+
+class PaginationMode(StrEnum):
+    Offset = "offset"
+    Cursor = "cursor"
+
+
+class FilterOperator(StrEnum):
+    Eq = "eq"
+    In = "in"
+    Range = "range"
+    Prefix = "prefix"
+    IsNull = "is_null"
+
+
+class RowCountMode(StrEnum):
+    Exact = "exact"
+    Estimated = "estimated"
+
+
+class SortDirection(StrEnum):
+    Asc = "asc"
+    Desc = "desc"
+
+
+class SortColumn(BaseModel):
+    column: str
+    direction: SortDirection = SortDirection.Asc
+
+
+class ColumnFilter(BaseModel):
+    """
+    A single server-side filter on a table column. Expected `value` per operator:
+        eq: a scalar
+        in: a list of scalars
+        range: [low, high], inclusive; either bound may be null for an open range
+        prefix: a string
+        is_null: a boolean, true by default
+    """
+
+    column: str
+    operator: FilterOperator
+    value: Any = None
+
+
+class TableQuery(BaseModel):
+    page: int = Field(default=1, ge=1)
+    page_size: Optional[int] = Field(default=None, ge=1)
+    pagination_mode: PaginationMode = PaginationMode.Offset
+    cursor: Optional[str] = None
+    columns: Optional[list[str]] = None
+    filters: list[ColumnFilter] = Field(default_factory=list)
+    order_by: list[SortColumn] = Field(default_factory=list)
+    count_mode: Optional[RowCountMode] = None
+
+
+_column_filters_adapter = TypeAdapter(list[ColumnFilter])
+
+
+def parse_filters(raw_filters: Optional[str]) -> list[ColumnFilter]:
+    """
+    Parses filters passed as a JSON array of `ColumnFilter` objects (e.g. in a query parameter).
+    """
+    if raw_filters is None:
+        return []
+    try:
+        return _column_filters_adapter.validate_json(raw_filters)
+    except ValidationError as error:
+        raise InvalidQueryError(f"Invalid filters: {error}")
+
+
+def parse_order_by(raw_order_by: Optional[list[str]]) -> list[SortColumn]:
+    """
+    Parses sort keys such as `["-created_at", "user_name"]`; a leading `-` sorts descending.
+    """
+    sort_columns: list[SortColumn] = []
+    for sort_key in raw_order_by or []:
+        if sort_key.startswith("-"):
+            sort_columns.append(SortColumn(column=sort_key[1:], direction=SortDirection.Desc))
+        else:
+            sort_columns.append(SortColumn(column=sort_key, direction=SortDirection.Asc))
+    return sort_columns
+
+
+def _is_text_column(column: Column) -> bool:
+    # SQLModel maps `str` fields to `AutoString`, a `TypeDecorator` wrapping `String`
+    column_type = column.type
+    if isinstance(column_type, TypeDecorator):
+        column_type = column_type.impl_instance
+    return isinstance(column_type, String)
+
+
+def build_filter_clause(
+    column: Column, column_filter: ColumnFilter, coerce: Callable[[Any], Any]
+) -> ColumnElement[bool]:
+    """
+    Turns a `ColumnFilter` into a SQL condition on the given column.
+    `coerce` converts a JSON filter value into the column's Python type.
+    """
+    value = column_filter.value
+    match column_filter.operator:
+        case FilterOperator.Eq:
+            if value is None:
+                raise InvalidQueryError("Use the is_null operator to filter on null")
+            return column == coerce(value)
+        case FilterOperator.In:
+            if not isinstance(value, list):
+                raise InvalidQueryError("The in operator expects a list value")
+            if len(value) == 0:
+                return false()
+            return column.in_([coerce(item) for item in value])
+        case FilterOperator.Range:
+            if not isinstance(value, list) or len(value) != 2:
+                raise InvalidQueryError("The range operator expects a [low, high] value")
+            low, high = value
+            if low is None and high is None:
+                raise InvalidQueryError("The range operator expects at least one bound")
+            clauses: list[ColumnElement[bool]] = []
+            if low is not None:
+                clauses.append(column >= coerce(low))
+            if high is not None:
+                clauses.append(column <= coerce(high))
+            return and_(*clauses)
+        case FilterOperator.Prefix:
+            if not _is_text_column(column):
+                raise InvalidQueryError(
+                    f"The prefix operator only applies to text columns: {column.name}"
+                )
+            if not isinstance(value, str):
+                raise InvalidQueryError("The prefix operator expects a string value")
+            return column.startswith(value, autoescape=True)
+        case FilterOperator.IsNull:
+            if value is None or value is True:
+                return column.is_(None)
+            if value is False:
+                return column.is_not(None)
+            raise InvalidQueryError("The is_null operator expects a boolean value")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encodes the key values of the last row of a page into an opaque, URL-safe continuation token.
+    """
+    payload = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, key_size: int) -> list[Any]:
+    """
+    Decodes a continuation token produced by `encode_cursor`.
+
+    Raises:
+        InvalidQueryError: If the token is malformed or does not hold `key_size` values.
+    """
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidQueryError("Invalid cursor")
+    if not isinstance(values, list) or len(values) != key_size:
+        raise InvalidQueryError("Invalid cursor")
+    return values
+
+
+def build_keyset_clause(
+    columns: Sequence[Column],
+    values: Sequence[Any],
+    directions: Sequence[SortDirection],
+) -> ColumnElement[bool]:
+    """
+    Builds the row-after-key condition for keyset pagination over (possibly composite) sort keys:
+        (c1 > v1) OR (c1 = v1 AND c2 > v2) OR ...
+    with `<` instead of `>` for descending columns. The expanded form is used instead of a
+    row-value comparison so that mixed directions work and it runs on every dialect.
+    """
+    clauses: list[ColumnElement[bool]] = []
+    for index, column in enumerate(columns):
+        equalities = [columns[prefix] == values[prefix] for prefix in range(index)]
+        match directions[index]:
+            case SortDirection.Asc:
+                comparison = column > values[index]
+            case SortDirection.Desc:
+                comparison = column < values[index]
+        clauses.append(and_(*equalities, comparison))
+    return or_(*clauses)
+
+
+def is_sort_index_backed(
+    sort_columns: Sequence[SortColumn], index_column_names: Sequence[Sequence[str]]
+) -> bool:
+    """
+    Tells whether the sort columns are a leading prefix of one of the given indexes, scanned
+    either forwards (all ascending) or backwards (all descending).
+    """
+    if len(sort_columns) == 0:
+        return True
+    if len({sort_column.direction for sort_column in sort_columns}) > 1:
+        return False
+    sort_column_names = [sort_column.column for sort_column in sort_columns]
+    return any(
+        list(column_names[: len(sort_column_names)]) == sort_column_names
+        for column_names in index_column_names
+    )
@@ -1,15 +1,73 @@
+import csv
+import datetime
+import io
 import json
+from contextlib import closing
 from enum import Enum
-from typing import Annotated, Any, Type, TypeVar, Union, get_args, get_origin
+from functools import cached_property
+from typing import (
+    Annotated,
+    Any,
+    Callable,
+    Generator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
 from uuid import UUID
 
-import cachetools
-from py_spring_core import Component
+from py_spring_core import Component, Properties
 from py_spring_model import PySpringModel
-from pydantic import BaseModel, Field, computed_field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    computed_field,
+    field_validator,
+)
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    DateTime,
+    Insert,
+    Table,
+    UniqueConstraint,
+    and_,
+    delete,
+    insert,
+    or_,
+    update,
+)
+from sqlalchemy import select as select_columns
+from sqlalchemy.orm import Session
 from sqlmodel import select
 from typing_extensions import ReadOnly
 
+from py_spring_admin.core.repository.async_database import AsyncDatabase
+from py_spring_admin.core.repository.commons import StrEnum
+from py_spring_admin.core.repository.models import User
+from py_spring_admin.core.repository.user_service import UserService
+from py_spring_admin.core.service.errors import HandledServerError, InvalidQueryError
+from py_spring_admin.core.service.model_query import (
+    ColumnFilter,
+    PaginationMode,
+    SortColumn,
+    SortDirection,
+    TableQuery,
+    build_filter_clause,
+    build_keyset_clause,
+    decode_cursor,
+    encode_cursor,
+    is_sort_index_backed,
+)
+from py_spring_admin.core.service.row_counter import RowCounter
+from py_spring_admin.core.service.row_serializer import RowSerializer
+
 ID = TypeVar("ID", int, UUID)
 
 
@@ -34,6 +92,8 @@ class InputField(BaseModel):
 
 
 class _TableColumn(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     private_field: str = Field(exclude=True)
     sql_type: str
     builtin_type: str
@@ -41,25 +101,78 @@ class _TableColumn(BaseModel):
     is_readonly: bool
 
     @computed_field
-    @property
+    @cached_property
     def is_enum(self) -> bool:
         return self.builtin_type == Enum.__name__
 
     @computed_field
-    @property
+    @cached_property
     def field(self) -> str:
         return to_camel_case(self.private_field)
 
     @computed_field
-    @property
+    @cached_property
     def header(self) -> str:
         return self.field.replace("_", " ").upper()
 
 
+class _TableSchema(BaseModel):
+    """
+    Immutable, precomputed description of a table, built once in `ModelService.post_construct`.
+    """
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    table_name: str
+    model_cls: Type[PySpringModel]
+    table: Table
+    columns: tuple[_TableColumn, ...]
+    primary_key_columns: tuple[str, ...]
+    concurrency_column: Optional[str]
+    index_column_names: tuple[tuple[str, ...], ...]
+    readonly_columns: frozenset[str]
+    enum_choices: dict[str, tuple[str, ...]]
+    value_adapters: dict[str, TypeAdapter]
+    row_serializer: RowSerializer
+
+
+class ModelServiceProperties(Properties):
+    __key__ = "model_service"
+    default_page_size: int = Field(default=50, gt=0)
+    max_page_size: int = Field(default=500, gt=0)
+    export_batch_size: int = Field(default=1000, gt=0)
+    row_count_cache_size: int = Field(default=1024, gt=0)
+    row_count_cache_ttl_seconds: float = Field(default=60, gt=0)
+    bulk_chunk_size: int = Field(default=500, gt=0)
+    concurrency_column_names: list[str] = Field(default=["version", "updated_at"])
+
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class TablePagination(BaseModel):
+    mode: PaginationMode
+    page: Optional[int] = None
+    page_size: int
+    has_next_page: bool
+    next_cursor: Optional[str] = None
+    total_rows: Optional[int] = None
+    is_total_estimated: bool = False
+
+
+class TableSort(BaseModel):
+    order_by: list[SortColumn]
+    is_index_backed: bool
+
+
 class TableView(BaseModel):
     table_name: str
     columns: list[_TableColumn]
     rows: list[dict[str, Any]]
+    pagination: TablePagination
+    sort: TableSort
 
 
 class TransactionResponse(BaseModel):
@@ -68,35 +181,157 @@ class TransactionResponse(BaseModel):
     affected_rows: int
 
 
+class UpdateTransactionResponse(TransactionResponse):
+    row: Optional[dict[str, Any]] = None
+
+
+class BulkMode(StrEnum):
+    AllOrNothing = "all_or_nothing"
+    BestEffort = "best_effort"
+
+
+class BulkInsertRequest(BaseModel):
+    rows: list[list[InputField]]
+    mode: BulkMode = BulkMode.AllOrNothing
+
+
+class BulkSelectionRequest(BaseModel):
+    """
+    Selects the rows of a bulk operation, either by a list of primary key dicts or by filters.
+    """
+
+    primary_keys: Optional[list[dict[str, Any]]] = None
+    filters: Optional[list[ColumnFilter]] = None
+
+
+class BulkUpdateRequest(BulkSelectionRequest):
+    values: dict[str, Any]
+
+
+class BulkRowError(BaseModel):
+    row_index: int
+    message: str
+
+
+class BulkTransactionResponse(TransactionResponse):
+    errors: list[BulkRowError] = Field(default_factory=list)
+
+
+TransactionResponseT = TypeVar("TransactionResponseT", bound=TransactionResponse)
+
+
 class ModelService(Component):
+    """
+    Reads and writes the rows of the registered tables.
+
+    Every database operation is written once as a `_*_in_session` method taking the session it
+    runs on. The public methods run it on a `PySpringModel` managed session, and their `async_*`
+    counterparts run it through `AsyncDatabase.run_in_session`, for async route handlers.
+    """
+
+    model_service_properties: ModelServiceProperties
+    async_database: AsyncDatabase
+    user_service: UserService
+
     def __init__(self) -> None:
         self.models: dict[str, Type[PySpringModel]] = {}
+        self.table_schemas: dict[str, _TableSchema] = {}
 
     def post_construct(self) -> None:
-        self.models = PySpringModel.get_model_lookup()
+        # internal tables (e.g. the email outbox) hold secrets and are never served
+        self.models = {
+            table_name: model_cls
+            for table_name, model_cls in PySpringModel.get_model_lookup().items()
+            if not getattr(model_cls, "__is_internal_table__", False)
+        }
         self.table_definitions = PySpringModel.metadata.tables
+        self.table_schemas = {
+            table_name: self._build_table_schema(
+                model_cls, self.table_definitions[table_name]
+            )
+            for table_name, model_cls in self.models.items()
+        }
+        self.row_counter = RowCounter(
+            cache_size=self.model_service_properties.row_count_cache_size,
+            cache_ttl_seconds=self.model_service_properties.row_count_cache_ttl_seconds,
+        )
+
+    def get_table_schema(self, table_name: str) -> _TableSchema:
+        optional_schema = self.table_schemas.get(table_name)
+        if optional_schema is None:
+            raise InvalidQueryError(f"Table not found: {table_name}")
+        return optional_schema
 
-    @cachetools.cached(cache={})
     def get_primary_key_columns(self, table_name: str) -> list[str]:
-        column_names: list[str] = []
-        for column in self.table_definitions[table_name].columns:
-            if column.primary_key:
-                column_names.append(column.name)
-        return column_names
+        return list(self.get_table_schema(table_name).primary_key_columns)
 
-    @cachetools.cached(cache={})
     def get_table_column_enum_choices(self, table_name: str, column: str) -> list[str]:
-        model_cls = self.models[table_name]
-        column_type: Type[Enum] = model_cls.__annotations__[column]
-        return [enum_type.value for enum_type in column_type]
+        optional_choices = self.get_table_schema(table_name).enum_choices.get(column)
+        if optional_choices is None:
+            raise InvalidQueryError(f"Column is not an enum: {column}")
+        return list(optional_choices)
 
     def find_all_tables(self) -> list[str]:
-        return [table_name for table_name in self.table_definitions]
+        return [table_name for table_name in self.table_schemas]
 
     def find_columns_by_table(self, table_name: str) -> list[_TableColumn]:
+        return list(self.get_table_schema(table_name).columns)
+
+    def _build_table_schema(
+        self, model_cls: Type[PySpringModel], table: Table
+    ) -> _TableSchema:
+        columns = self._build_table_columns(model_cls, table)
+        enum_choices: dict[str, tuple[str, ...]] = {}
+        for column in columns:
+            if column.is_enum:
+                enum_cls: Type[Enum] = model_cls.__annotations__[column.private_field]
+                enum_choices[column.private_field] = tuple(
+                    enum_type.value for enum_type in enum_cls
+                )
+        primary_key_columns = tuple(
+            column.name for column in table.columns if column.primary_key
+        )
+        index_column_names = [primary_key_columns]
+        for index in table.indexes:
+            index_column_names.append(tuple(column.name for column in index.columns))
+        for constraint in table.constraints:
+            if isinstance(constraint, UniqueConstraint):
+                index_column_names.append(
+                    tuple(column.name for column in constraint.columns)
+                )
+        row_serializer = RowSerializer.from_model(model_cls, table)
+        value_adapters = {
+            field_name: TypeAdapter(model_cls.model_fields[field_name].annotation)
+            for field_name in row_serializer.field_names
+        }
+        return _TableSchema(
+            table_name=table.name,
+            model_cls=model_cls,
+            table=table,
+            columns=tuple(columns),
+            primary_key_columns=primary_key_columns,
+            concurrency_column=next(
+                (
+                    column_name
+                    for column_name in self.model_service_properties.concurrency_column_names
+                    if column_name in table.c
+                ),
+                None,
+            ),
+            index_column_names=tuple(index_column_names),
+            readonly_columns=frozenset(
+                column.private_field for column in columns if column.is_readonly
+            ),
+            enum_choices=enum_choices,
+            value_adapters=value_adapters,
+            row_serializer=row_serializer,
+        )
+
+    def _build_table_columns(
+        self, model_cls: Type[PySpringModel], table: Table
+    ) -> list[_TableColumn]:
         columns: list[_TableColumn] = []
-        model_cls = self.models[table_name]
-        for column in PySpringModel.metadata.tables[table_name].columns:
+        for column in table.columns:
             is_readonly: bool = False
             builtin_type: Type[object] = model_cls.__annotations__[column.name]
             is_enum = builtin_type.__class__ == Enum.__class__
@@ -123,41 +358,532 @@ class ModelService(Component):
 
         return columns
 
-    def find_all_models_in_table(self, table_name: str) -> TableView:
-        model_cls = self.models[table_name]
+    def resolve_page_size(self, page_size: Optional[int]) -> int:
+        if page_size is None:
+            page_size = self.model_service_properties.default_page_size
+        return min(page_size, self.model_service_properties.max_page_size)
+
+    def resolve_column_name(self, table_schema: _TableSchema, column_name: str) -> str:
+        """
+        Maps a (camel or snake case) column name from a request to a selectable column of the table.
+        Fields excluded from the model dump, such as passwords, are not selectable.
+        """
+        resolved_name = to_snake_case(column_name)
+        if resolved_name not in table_schema.value_adapters:
+            raise InvalidQueryError(f"Unknown column: {column_name}")
+        return resolved_name
+
+    def coerce_column_value(
+        self, table_schema: _TableSchema, column_name: str, value: Any
+    ) -> Any:
+        try:
+            return table_schema.value_adapters[column_name].validate_python(value)
+        except ValidationError:
+            raise InvalidQueryError(f"Invalid value for column {column_name}: {value!r}")
+
+    def _build_filter_clauses(
+        self, table_schema: _TableSchema, filters: list[ColumnFilter]
+    ) -> list[ColumnElement[bool]]:
+        clauses: list[ColumnElement[bool]] = []
+        for column_filter in filters:
+            column_name = self.resolve_column_name(table_schema, column_filter.column)
+            clauses.append(
+                build_filter_clause(
+                    table_schema.table.c[column_name],
+                    column_filter,
+                    lambda value: self.coerce_column_value(table_schema, column_name, value),
+                )
+            )
+        return clauses
+
+    def _project_table(
+        self,
+        table_schema: _TableSchema,
+        column_names: Optional[list[str]],
+        required_column_names: list[str],
+    ) -> tuple[RowSerializer, list[_TableColumn]]:
+        """
+        Narrows the selected columns to the requested projection. Primary key columns are always kept,
+        since rows are identified by them, as well as the given required columns.
+        """
+        if column_names is None:
+            return table_schema.row_serializer, list(table_schema.columns)
+        projected_names = set(table_schema.primary_key_columns)
+        projected_names.update(required_column_names)
+        for column_name in column_names:
+            projected_names.add(self.resolve_column_name(table_schema, column_name))
+        ordered_names = [
+            name for name in table_schema.row_serializer.field_names if name in projected_names
+        ]
+        projected_columns = [
+            column for column in table_schema.columns if column.private_field in projected_names
+        ]
+        return table_schema.row_serializer.project(ordered_names), projected_columns
+
+    def _resolve_sort_columns(
+        self, table_schema: _TableSchema, order_by: list[SortColumn]
+    ) -> list[SortColumn]:
+        sort_columns: list[SortColumn] = []
+        for sort_column in order_by:
+            column_name = self.resolve_column_name(table_schema, sort_column.column)
+            if any(resolved.column == column_name for resolved in sort_columns):
+                raise InvalidQueryError(f"Duplicate sort column: {sort_column.column}")
+            sort_columns.append(
+                SortColumn(column=column_name, direction=sort_column.direction)
+            )
+        return sort_columns
+
+    def _build_order_by_columns(
+        self, table_schema: _TableSchema, sort_columns: list[SortColumn]
+    ) -> list[SortColumn]:
+        """
+        Appends the primary key columns not already sorted on, so the row order is total
+        and pages never overlap.
+        """
+        sorted_names = {sort_column.column for sort_column in sort_columns}
+        return sort_columns + [
+            SortColumn(column=column_name, direction=SortDirection.Asc)
+            for column_name in table_schema.primary_key_columns
+            if column_name not in sorted_names
+        ]
+
+    def _to_order_by_clause(self, column: Column, direction: SortDirection) -> Any:
+        match direction:
+            case SortDirection.Asc:
+                return column.asc()
+            case SortDirection.Desc:
+                return column.desc()
+
+    def find_all_models_in_table(
+        self, table_name: str, query: Optional[TableQuery] = None
+    ) -> TableView:
+        with PySpringModel.create_managed_session() as session:
+            return self._find_all_models_in_session(session, table_name, query)
+
+    async def async_find_all_models_in_table(
+        self, table_name: str, query: Optional[TableQuery] = None
+    ) -> TableView:
+        return await self.async_database.run_in_session(
+            self._find_all_models_in_session, table_name, query
+        )
+
+    def _find_all_models_in_session(
+        self, session: Session, table_name: str, query: Optional[TableQuery] = None
+    ) -> TableView:
+        """
+        Finds one page of rows in the given table, sorted by the requested columns and then by
+        primary key. The returned sort metadata tells whether the requested sort is backed by
+        an index declared on the table.
+
+        Only the projected columns are selected and the filters are applied in the WHERE clause,
+        both validated against the table schema. The page size is capped by
+        `ModelServiceProperties.max_page_size` and applied as a LIMIT in the query; one extra row
+        is fetched to tell whether a next page exists. In offset mode the page is selected with
+        OFFSET. In cursor mode (implied when a `cursor` is given) the page starts right after the
+        primary key encoded in the cursor, so every page costs the same as the first one.
+        """
+        if query is None:
+            query = TableQuery()
+        table_schema = self.get_table_schema(table_name)
+        table = table_schema.table
+        page_size = self.resolve_page_size(query.page_size)
+        pagination_mode = query.pagination_mode
+        if query.cursor is not None:
+            pagination_mode = PaginationMode.Cursor
+
+        sort_columns = self._resolve_sort_columns(table_schema, query.order_by)
+        order_by_columns = self._build_order_by_columns(table_schema, sort_columns)
+        order_by_names = [sort_column.column for sort_column in order_by_columns]
+        row_serializer, table_columns = self._project_table(
+            table_schema, query.columns, order_by_names
+        )
+        filter_clauses = self._build_filter_clauses(table_schema, query.filters)
+        statement = (
+            select_columns(*row_serializer.columns)
+            .where(*filter_clauses)
+            .order_by(
+                *[
+                    self._to_order_by_clause(table.c[sort_column.column], sort_column.direction)
+                    for sort_column in order_by_columns
+                ]
+            )
+            .limit(page_size + 1)
+        )
+        match pagination_mode:
+            case PaginationMode.Offset:
+                statement = statement.offset((query.page - 1) * page_size)
+            case PaginationMode.Cursor:
+                for sort_column in sort_columns:
+                    if table.c[sort_column.column].nullable:
+                        raise InvalidQueryError(
+                            f"Cursor pagination cannot sort on nullable column: {sort_column.column}"
+                        )
+                if query.cursor is not None:
+                    key_values = [
+                        self.coerce_column_value(table_schema, column_name, value)
+                        for column_name, value in zip(
+                            order_by_names, decode_cursor(query.cursor, len(order_by_names))
+                        )
+                    ]
+                    statement = statement.where(
+                        build_keyset_clause(
+                            [table.c[column_name] for column_name in order_by_names],
+                            key_values,
+                            [sort_column.direction for sort_column in order_by_columns],
+                        )
+                    )
+
+        optional_row_count = None
+        result = session.execute(statement).fetchall()
+        if query.count_mode is not None:
+            filter_key = json.dumps(
+                [column_filter.model_dump(mode="json") for column_filter in query.filters],
+                sort_keys=True,
+            )
+            optional_row_count = self.row_counter.count_rows(
+                session, table, filter_clauses, filter_key, query.count_mode
+            )
+        page_rows = result[:page_size]
+        rows = [row_serializer.serialize(row) for row in page_rows]
+        has_next_page = len(result) > page_size
+        next_cursor = None
+        if pagination_mode == PaginationMode.Cursor and has_next_page:
+            last_row = page_rows[-1]._mapping
+            next_cursor = encode_cursor(
+                [last_row[column_name] for column_name in order_by_names]
+            )
+
+        pagination = TablePagination(
+            mode=pagination_mode,
+            page=query.page if pagination_mode == PaginationMode.Offset else None,
+            page_size=page_size,
+            has_next_page=has_next_page,
+            next_cursor=next_cursor,
+        )
+        if optional_row_count is not None:
+            pagination.total_rows = optional_row_count.total
+            pagination.is_total_estimated = optional_row_count.is_estimated
+        sort = TableSort(
+            order_by=order_by_columns,
+            is_index_backed=is_sort_index_backed(
+                sort_columns, table_schema.index_column_names
+            ),
+        )
+        return TableView(
+            table_name=table_name,
+            columns=table_columns,
+            rows=rows,
+            pagination=pagination,
+            sort=sort,
+        )
+
+    def iter_models_in_table(
+        self, table_name: str
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Iterates over every row in the given table as JSON-ready dicts.
+
+        Rows are read through a server-side cursor in batches of
+        `ModelServiceProperties.export_batch_size`, so memory use does not grow with the table.
+        Closing the iterator closes the cursor and the session. The table is checked right away,
+        not when the first row is pulled.
+
+        Raises:
+            InvalidQueryError: If the table does not exist.
+        """
+        return self._iter_models_in_table(self.get_table_schema(table_name))
+
+    def _iter_models_in_table(
+        self, table_schema: _TableSchema
+    ) -> Generator[dict[str, Any], None, None]:
+        row_serializer = table_schema.row_serializer
+        order_by_columns = [
+            table_schema.table.c[column_name]
+            for column_name in table_schema.primary_key_columns
+        ]
+        statement = (
+            select_columns(*row_serializer.columns)
+            .order_by(*order_by_columns)
+            .execution_options(yield_per=self.model_service_properties.export_batch_size)
+        )
         with PySpringModel.create_managed_session() as session:
-            statement = select(model_cls)
-            result = session.exec(statement).fetchall()
-            rows = [json.loads(_model.model_dump_json()) for _model in result]
-        table_columns = self.find_columns_by_table(table_name)
-        return TableView(table_name=table_name, columns=table_columns, rows=rows)
+            for row in session.exec(statement):
+                yield row_serializer.serialize(row)
+
+    def export_table(
+        self, table_name: str, export_format: ExportFormat
+    ) -> Generator[str, None, None]:
+        """
+        Exports every row in the given table as NDJSON lines or CSV, one chunk per batch.
+
+        The table is checked before the generator is returned, so an unknown table fails before
+        a streaming response has sent its headers.
+
+        Raises:
+            InvalidQueryError: If the table does not exist.
+        """
+        return self._export_table(self.get_table_schema(table_name), export_format)
+
+    def _export_table(
+        self, table_schema: _TableSchema, export_format: ExportFormat
+    ) -> Generator[str, None, None]:
+        field_names = table_schema.row_serializer.field_names
+        batch_size = self.model_service_properties.export_batch_size
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        if export_format == ExportFormat.CSV:
+            writer.writerow(field_names)
+
+        with closing(self._iter_models_in_table(table_schema)) as rows:
+            for index, row in enumerate(rows, start=1):
+                match export_format:
+                    case ExportFormat.NDJSON:
+                        buffer.write(json.dumps(row))
+                        buffer.write("\n")
+                    case ExportFormat.CSV:
+                        writer.writerow(
+                            [self._to_csv_value(row.get(field)) for field in field_names]
+                        )
+                if index % batch_size == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+        if buffer.tell() > 0:
+            yield buffer.getvalue()
+
+    def _to_csv_value(self, value: Any) -> Any:
+        if value is None:
+            return ""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value)
+        return value
+
+    def _run_transaction(
+        self,
+        table_name: str,
+        response_cls: Type[TransactionResponseT],
+        func: Callable[..., TransactionResponseT],
+        *args: Any,
+    ) -> TransactionResponseT:
+        """
+        Runs `func(session, *args)` in one transaction on a `PySpringModel` managed session.
+
+        Handled errors (e.g. an invalid query) are raised to the caller, while database errors,
+        including those raised on commit, become a failed `response_cls`.
+        """
+        try:
+            with PySpringModel.create_managed_session() as session:
+                response = func(session, *args)
+        except HandledServerError:
+            raise
+        except Exception as error:
+            return response_cls(is_success=False, message=str(error), affected_rows=0)
+        return self._complete_transaction(table_name, response)
+
+    async def _async_run_transaction(
+        self,
+        table_name: str,
+        response_cls: Type[TransactionResponseT],
+        func: Callable[..., TransactionResponseT],
+        *args: Any,
+    ) -> TransactionResponseT:
+        """
+        Same as `_run_transaction`, running `func` through `AsyncDatabase.run_in_session`.
+        """
+        try:
+            response = await self.async_database.run_in_session(func, *args)
+        except HandledServerError:
+            raise
+        except Exception as error:
+            return response_cls(is_success=False, message=str(error), affected_rows=0)
+        return self._complete_transaction(table_name, response)
+
+    def _complete_transaction(
+        self, table_name: str, response: TransactionResponseT
+    ) -> TransactionResponseT:
+        # filtered counts depend on column values, so updates invalidate them as well
+        if response.affected_rows > 0:
+            self.row_counter.invalidate(table_name)
+            # the written users are unknown here (e.g. bulk updates), so drop them all
+            if table_name == User.__tablename__:
+                self.user_service.clear_user_cache()
+        return response
 
     def add_model_into_table_by_input_fields(
         self, table_name: str, input_fields: list[InputField]
     ) -> TransactionResponse:
-        model_cls = self.models[table_name]
-        primary_key_columns = self.get_primary_key_columns(table_name)
+        return self._run_transaction(
+            table_name,
+            TransactionResponse,
+            self._add_model_by_input_fields_in_session,
+            table_name,
+            input_fields,
+        )
+
+    async def async_add_model_into_table_by_input_fields(
+        self, table_name: str, input_fields: list[InputField]
+    ) -> TransactionResponse:
+        return await self._async_run_transaction(
+            table_name,
+            TransactionResponse,
+            self._add_model_by_input_fields_in_session,
+            table_name,
+            input_fields,
+        )
+
+    def _add_model_by_input_fields_in_session(
+        self, session: Session, table_name: str, input_fields: list[InputField]
+    ) -> TransactionResponse:
+        model_dict = self._to_model_dict(self.get_table_schema(table_name), input_fields)
+        return self._add_model_in_session(session, table_name, model_dict)
+
+    def _to_model_dict(
+        self, table_schema: _TableSchema, input_fields: list[InputField]
+    ) -> dict[str, Any]:
         model_dict = {}
         for field in input_fields:
-            if field.key in primary_key_columns:
+            if field.key in table_schema.primary_key_columns:
                 continue
 
             model_dict[field.key] = field.value
-        return self._add_model_into_table(table_name, model_dict)
+        return model_dict
+
+    def bulk_add_models_into_table(
+        self,
+        table_name: str,
+        rows: list[list[InputField]],
+        mode: BulkMode = BulkMode.AllOrNothing,
+    ) -> BulkTransactionResponse:
+        return self._run_transaction(
+            table_name,
+            BulkTransactionResponse,
+            self._bulk_add_models_in_session,
+            table_name,
+            rows,
+            mode,
+        )
+
+    async def async_bulk_add_models_into_table(
+        self,
+        table_name: str,
+        rows: list[list[InputField]],
+        mode: BulkMode = BulkMode.AllOrNothing,
+    ) -> BulkTransactionResponse:
+        return await self._async_run_transaction(
+            table_name,
+            BulkTransactionResponse,
+            self._bulk_add_models_in_session,
+            table_name,
+            rows,
+            mode,
+        )
 
-    def _add_model_into_table(
-        self, table_name: str, model_json_dict: dict[str, Any]
+    def _bulk_add_models_in_session(
+        self,
+        session: Session,
+        table_name: str,
+        rows: list[list[InputField]],
+        mode: BulkMode,
+    ) -> BulkTransactionResponse:
+        """
+        Validates every row with `model_validate` and inserts the valid ones in one transaction,
+        as executemany INSERTs of `ModelServiceProperties.bulk_chunk_size` rows each.
+
+        In all-or-nothing mode any invalid row, or any database error, inserts nothing.
+        In best-effort mode invalid rows are skipped, and a chunk that fails in the database is
+        retried row by row in savepoints so only the offending rows are left out.
+        Errors are reported per row index.
+        """
+        table_schema = self.get_table_schema(table_name)
+        errors: list[BulkRowError] = []
+        indexed_values: list[tuple[int, dict[str, Any]]] = []
+        for row_index, input_fields in enumerate(rows):
+            model_dict = self._to_model_dict(table_schema, input_fields)
+            try:
+                model_instance = table_schema.model_cls.model_validate(model_dict)
+            except ValidationError as error:
+                errors.append(BulkRowError(row_index=row_index, message=str(error)))
+                continue
+            indexed_values.append(
+                (row_index, self._to_insert_values(table_schema, model_instance))
+            )
+
+        if len(errors) > 0 and mode == BulkMode.AllOrNothing:
+            return BulkTransactionResponse(
+                is_success=False,
+                message="Validation failed, no models added",
+                affected_rows=0,
+                errors=errors,
+            )
+
+        statement = insert(table_schema.table)
+        chunk_size = self.model_service_properties.bulk_chunk_size
+        affected_rows = 0
+        for chunk_start in range(0, len(indexed_values), chunk_size):
+            chunk = indexed_values[chunk_start : chunk_start + chunk_size]
+            match mode:
+                case BulkMode.AllOrNothing:
+                    session.execute(statement, [values for _, values in chunk])
+                    affected_rows += len(chunk)
+                case BulkMode.BestEffort:
+                    affected_rows += self._insert_chunk_best_effort(
+                        session, statement, chunk, errors
+                    )
+        return BulkTransactionResponse(
+            is_success=len(errors) == 0,
+            message=f"{affected_rows} models added successfully",
+            affected_rows=affected_rows,
+            errors=sorted(errors, key=lambda row_error: row_error.row_index),
+        )
+
+    def _to_insert_values(
+        self, table_schema: _TableSchema, model_instance: PySpringModel
+    ) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for column in table_schema.table.columns:
+            value = getattr(model_instance, column.name)
+            if value is None and column.primary_key:
+                continue
+            values[column.name] = value
+        return values
+
+    def _insert_chunk_best_effort(
+        self,
+        session: Session,
+        statement: Insert,
+        chunk: list[tuple[int, dict[str, Any]]],
+        errors: list[BulkRowError],
+    ) -> int:
+        try:
+            with session.begin_nested():
+                session.execute(statement, [values for _, values in chunk])
+            return len(chunk)
+        except Exception:
+            pass
+
+        affected_rows = 0
+        for row_index, values in chunk:
+            try:
+                with session.begin_nested():
+                    session.execute(statement, [values])
+                affected_rows += 1
+            except Exception as error:
+                errors.append(BulkRowError(row_index=row_index, message=str(error)))
+        return affected_rows
+
+    def _add_model_in_session(
+        self, session: Session, table_name: str, model_json_dict: dict[str, Any]
     ) -> TransactionResponse:
-        model_cls = self.models[table_name]
+        model_cls = self.get_table_schema(table_name).model_cls
         try:
             model_instance = model_cls.model_validate(model_json_dict)
-            with PySpringModel.create_managed_session() as session:
-                session.add(model_instance)
-        except Exception as error:
+        except ValidationError as error:
             return TransactionResponse(
                 is_success=False, message=str(error), affected_rows=0
             )
 
+        session.add(model_instance)
+        session.flush()
         return TransactionResponse(
             is_success=True, message="Model added successfully", affected_rows=1
         )
@@ -165,50 +891,340 @@ class ModelService(Component):
     def delete_model_from_table(
         self, table_name: str, primary_key_ids_query: dict[str, ID]
     ) -> TransactionResponse:
-        model_cls = self.models[table_name]
-        with PySpringModel.create_managed_session() as session:
-            statement = select(model_cls).filter_by(**primary_key_ids_query)
-            optional_model = session.exec(statement).one_or_none()
-            if optional_model is None:
-                return TransactionResponse(
-                    is_success=False, message="Model not found", affected_rows=0
-                )
-            session.delete(optional_model)
+        return self._run_transaction(
+            table_name,
+            TransactionResponse,
+            self._delete_model_in_session,
+            table_name,
+            primary_key_ids_query,
+        )
+
+    async def async_delete_model_from_table(
+        self, table_name: str, primary_key_ids_query: dict[str, ID]
+    ) -> TransactionResponse:
+        return await self._async_run_transaction(
+            table_name,
+            TransactionResponse,
+            self._delete_model_in_session,
+            table_name,
+            primary_key_ids_query,
+        )
 
+    def _delete_model_in_session(
+        self, session: Session, table_name: str, primary_key_ids_query: dict[str, ID]
+    ) -> TransactionResponse:
+        model_cls = self.get_table_schema(table_name).model_cls
+        statement = select(model_cls).filter_by(**primary_key_ids_query)
+        optional_model = session.execute(statement).scalars().one_or_none()
+        if optional_model is None:
+            return TransactionResponse(
+                is_success=False, message="Model not found", affected_rows=0
+            )
+        session.delete(optional_model)
         return TransactionResponse(
             is_success=True, message="Model deleted successfully", affected_rows=1
         )
 
+    def _build_primary_key_clause(
+        self, table_schema: _TableSchema, primary_keys: list[dict[str, Any]]
+    ) -> ColumnElement[bool]:
+        primary_key_names = table_schema.primary_key_columns
+        key_rows: list[list[Any]] = []
+        for primary_key in primary_keys:
+            if set(primary_key.keys()) != set(primary_key_names):
+                raise InvalidQueryError(
+                    f"Primary key must have exactly the columns: {', '.join(primary_key_names)}"
+                )
+            key_rows.append(
+                [
+                    self.coerce_column_value(table_schema, column_name, primary_key[column_name])
+                    for column_name in primary_key_names
+                ]
+            )
+
+        primary_key_columns = [table_schema.table.c[name] for name in primary_key_names]
+        if len(primary_key_columns) == 1:
+            return primary_key_columns[0].in_([key_row[0] for key_row in key_rows])
+        return or_(
+            *[
+                and_(*[column == value for column, value in zip(primary_key_columns, key_row)])
+                for key_row in key_rows
+            ]
+        )
+
+    def _build_selection_clauses(
+        self, table_schema: _TableSchema, selection: BulkSelectionRequest
+    ) -> list[ColumnElement[bool]]:
+        """
+        Builds the WHERE conditions of a bulk operation. Primary key lists are split into chunks of
+        `ModelServiceProperties.bulk_chunk_size` keys, one condition per statement.
+        An empty selection is rejected so a bulk operation never silently hits the whole table.
+        """
+        is_by_primary_keys = selection.primary_keys is not None
+        is_by_filters = selection.filters is not None
+        if is_by_primary_keys == is_by_filters:
+            raise InvalidQueryError("Provide either primary_keys or filters")
+        if selection.primary_keys is not None:
+            if len(selection.primary_keys) == 0:
+                raise InvalidQueryError("primary_keys must not be empty")
+            chunk_size = self.model_service_properties.bulk_chunk_size
+            return [
+                self._build_primary_key_clause(
+                    table_schema, selection.primary_keys[chunk_start : chunk_start + chunk_size]
+                )
+                for chunk_start in range(0, len(selection.primary_keys), chunk_size)
+            ]
+        if selection.filters is None or len(selection.filters) == 0:
+            raise InvalidQueryError("filters must not be empty")
+        return [and_(*self._build_filter_clauses(table_schema, selection.filters))]
+
+    def _coerce_update_values(
+        self, table_schema: _TableSchema, values: dict[str, Any]
+    ) -> dict[str, Any]:
+        coerced_values: dict[str, Any] = {}
+        for key, value in values.items():
+            column_name = self.resolve_column_name(table_schema, key)
+            if column_name in table_schema.readonly_columns:
+                raise InvalidQueryError(f"Column is readonly: {key}")
+            # the concurrency column is only ever bumped, never written by callers
+            if column_name == table_schema.concurrency_column:
+                raise InvalidQueryError(f"Column is managed by concurrency control: {key}")
+            coerced_values[column_name] = self.coerce_column_value(
+                table_schema, column_name, value
+            )
+        return coerced_values
+
+    def bulk_delete_models_from_table(
+        self, table_name: str, selection: BulkSelectionRequest
+    ) -> TransactionResponse:
+        return self._run_transaction(
+            table_name,
+            TransactionResponse,
+            self._bulk_delete_models_in_session,
+            table_name,
+            selection,
+        )
+
+    async def async_bulk_delete_models_from_table(
+        self, table_name: str, selection: BulkSelectionRequest
+    ) -> TransactionResponse:
+        return await self._async_run_transaction(
+            table_name,
+            TransactionResponse,
+            self._bulk_delete_models_in_session,
+            table_name,
+            selection,
+        )
+
+    def _bulk_delete_models_in_session(
+        self, session: Session, table_name: str, selection: BulkSelectionRequest
+    ) -> TransactionResponse:
+        """
+        Deletes the selected rows with set-based `DELETE ... WHERE` statements in one transaction,
+        returning the number of rows the database reports as deleted.
+        """
+        table_schema = self.get_table_schema(table_name)
+        clauses = self._build_selection_clauses(table_schema, selection)
+        affected_rows = 0
+        for clause in clauses:
+            result = session.execute(delete(table_schema.table).where(clause))
+            affected_rows += result.rowcount
+        return TransactionResponse(
+            is_success=True,
+            message=f"{affected_rows} models deleted successfully",
+            affected_rows=affected_rows,
+        )
+
+    def bulk_update_models_in_table(
+        self, table_name: str, update_request: BulkUpdateRequest
+    ) -> TransactionResponse:
+        return self._run_transaction(
+            table_name,
+            TransactionResponse,
+            self._bulk_update_models_in_session,
+            table_name,
+            update_request,
+        )
+
+    async def async_bulk_update_models_in_table(
+        self, table_name: str, update_request: BulkUpdateRequest
+    ) -> TransactionResponse:
+        return await self._async_run_transaction(
+            table_name,
+            TransactionResponse,
+            self._bulk_update_models_in_session,
+            table_name,
+            update_request,
+        )
+
+    def _bulk_update_models_in_session(
+        self, session: Session, table_name: str, update_request: BulkUpdateRequest
+    ) -> TransactionResponse:
+        """
+        Applies the same column values to the selected rows with set-based `UPDATE ... SET`
+        statements in one transaction, returning the number of rows the database reports as updated.
+        The concurrency column, if any, is bumped on every updated row like single-row updates do,
+        so a later update with a stale `expected_version` is rejected.
+        """
+        table_schema = self.get_table_schema(table_name)
+        clauses = self._build_selection_clauses(table_schema, update_request)
+        values = self._coerce_update_values(table_schema, update_request.values)
+        if len(values) == 0:
+            raise InvalidQueryError("values must not be empty")
+        concurrency_column = table_schema.concurrency_column
+        if concurrency_column is not None:
+            values[concurrency_column] = self._next_concurrency_value(
+                table_schema.table.c[concurrency_column]
+            )
+        affected_rows = 0
+        for clause in clauses:
+            result = session.execute(update(table_schema.table).where(clause).values(values))
+            affected_rows += result.rowcount
+        return TransactionResponse(
+            is_success=True,
+            message=f"{affected_rows} models updated successfully",
+            affected_rows=affected_rows,
+        )
+
+    def _next_concurrency_value(self, column: Column) -> Any:
+        if isinstance(column.type, DateTime):
+            now = datetime.datetime.now(datetime.timezone.utc)
+            return now if column.type.timezone else now.replace(tzinfo=None)
+        return column + 1
+
     def update_model_in_table(
         self,
         table_name: str,
         primary_key_ids_query: dict[str, ID],
         updated_model_json_dict: dict[str, Any],
         is_upsert: bool = False,
-    ) -> TransactionResponse:
-        model_cls = self.models[table_name]
-        try:
-            with PySpringModel.create_managed_session() as session:
-                statement = select(model_cls).filter_by(**primary_key_ids_query)  # type: ignore
-                optional_model_instance = session.exec(statement).one_or_none()
-                if optional_model_instance is None:
-                    # If the entity does not exist, insert it
-                    if not is_upsert:
-                        return TransactionResponse(
-                            is_success=False, message="Model not found", affected_rows=0
-                        )
-                    session.add(optional_model_instance)
-                else:
-                    # If the entity exists, update its attributes
-                    for key, value in updated_model_json_dict.items():
-                        setattr(optional_model_instance, key, value)
-                    session.add(optional_model_instance)
-                return TransactionResponse(
-                    is_success=True,
-                    message="Model updated successfully",
-                    affected_rows=1,
+        expected_version: Optional[Any] = None,
+    ) -> UpdateTransactionResponse:
+        return self._run_transaction(
+            table_name,
+            UpdateTransactionResponse,
+            self._update_model_in_session,
+            table_name,
+            primary_key_ids_query,
+            updated_model_json_dict,
+            is_upsert,
+            expected_version,
+        )
+
+    async def async_update_model_in_table(
+        self,
+        table_name: str,
+        primary_key_ids_query: dict[str, ID],
+        updated_model_json_dict: dict[str, Any],
+        is_upsert: bool = False,
+        expected_version: Optional[Any] = None,
+    ) -> UpdateTransactionResponse:
+        return await self._async_run_transaction(
+            table_name,
+            UpdateTransactionResponse,
+            self._update_model_in_session,
+            table_name,
+            primary_key_ids_query,
+            updated_model_json_dict,
+            is_upsert,
+            expected_version,
+        )
+
+    def _update_model_in_session(
+        self,
+        session: Session,
+        table_name: str,
+        primary_key_ids_query: dict[str, ID],
+        updated_model_json_dict: dict[str, Any],
+        is_upsert: bool,
+        expected_version: Optional[Any],
+    ) -> UpdateTransactionResponse:
+        """
+        Updates one row with a single `UPDATE ... WHERE <pk> RETURNING ...` statement and returns the
+        updated row, so the caller does not need to re-fetch the table.
+
+        Primary key and readonly columns in `updated_model_json_dict` are ignored. If the table has a
+        concurrency column (see `ModelServiceProperties.concurrency_column_names`), every update bumps
+        it (incremented for versions, set to now for timestamps); when `expected_version` is given
+        the update only applies if the stored value still matches it.
+        """
+        table_schema = self.get_table_schema(table_name)
+        table = table_schema.table
+        row_serializer = table_schema.row_serializer
+        concurrency_column = table_schema.concurrency_column
+        where_clauses = [
+            self._build_primary_key_clause(table_schema, [primary_key_ids_query])
+        ]
+        values = self._coerce_update_values(
+            table_schema,
+            {
+                key: value
+                for key, value in updated_model_json_dict.items()
+                if to_snake_case(key) not in table_schema.readonly_columns
+                and to_snake_case(key) != concurrency_column
+            },
+        )
+        if concurrency_column is not None:
+            values[concurrency_column] = self._next_concurrency_value(
+                table.c[concurrency_column]
+            )
+            if expected_version is not None:
+                where_clauses.append(
+                    table.c[concurrency_column]
+                    == self.coerce_column_value(
+                        table_schema, concurrency_column, expected_version
+                    )
                 )
-        except Exception as error:
-            return TransactionResponse(
-                is_success=False, message=str(error), affected_rows=0
+
+        optional_row = None
+        if len(values) == 0:
+            optional_row = session.execute(
+                select_columns(*row_serializer.columns).where(*where_clauses)
+            ).one_or_none()
+        elif getattr(session.get_bind().dialect, "update_returning", False):
+            optional_row = session.execute(
+                update(table)
+                .where(*where_clauses)
+                .values(values)
+                .returning(*row_serializer.columns)
+            ).one_or_none()
+        else:
+            result = session.execute(update(table).where(*where_clauses).values(values))
+            if result.rowcount > 0:
+                optional_row = session.execute(
+                    select_columns(*row_serializer.columns).where(where_clauses[0])
+                ).one()
+
+        if optional_row is None:
+            is_existing = (
+                session.execute(
+                    select_columns(*table.primary_key.columns).where(where_clauses[0])
+                ).first()
+                is not None
             )
+            if is_existing:
+                return UpdateTransactionResponse(
+                    is_success=False,
+                    message="Model was modified by another request, please reload it",
+                    affected_rows=0,
+                )
+            if not is_upsert:
+                return UpdateTransactionResponse(
+                    is_success=False, message="Model not found", affected_rows=0
+                )
+            # If the entity does not exist, insert it in the same transaction. Keys may be camel
+            # case like in the update, while model_validate expects the field names
+            model_json_dict = {
+                to_snake_case(key): value for key, value in updated_model_json_dict.items()
+            }
+            transaction_response = self._add_model_in_session(
+                session, table_name, {**model_json_dict, **primary_key_ids_query}
+            )
+            return UpdateTransactionResponse(**transaction_response.model_dump())
+
+        return UpdateTransactionResponse(
+            is_success=True,
+            message="Model updated successfully",
+            affected_rows=1,
+            row=row_serializer.serialize(optional_row),
+        )
@@ -1,21 +1,35 @@
-from collections import defaultdict
 import datetime
-import random
+import hashlib
+import hmac
+import secrets
+import threading
 from typing import Optional
 
-from py_spring_core import Component
-from pydantic import BaseModel
+from loguru import logger
+from py_spring_core import Component, Properties
+from pydantic import Field
 
-from py_spring_admin.core.repository.commons import StrEnum
+from py_spring_admin.core.service.otp_storage import (
+    InMemoryOtpStorage,
+    OneTimePassword,
+    OtpPurpose,
+    OtpStorage,
+    OtpStorageStats,
+    OtpStorageType,
+)
+from py_spring_admin.core.service.redis_otp_storage import RedisOtpStorage
+from py_spring_admin.core.service.security_properties import AdminSecurityProperties
+from py_spring_admin.core.service.sql_otp_storage import SqlOtpStorage
 
-class OtpPurpose(StrEnum):
-    PasswordReset = "password_reset"
-    UserRegistration = "user_registration"
-    
 
-class OneTimePassword(BaseModel):
-    code: str
-    expired_at: datetime.datetime
+class OtpProperties(Properties):
+    __key__ = "otp"
+    ttl_seconds: float = Field(default=300, gt=0)
+    max_entries: int = Field(default=100_000, gt=0)
+    sweep_interval_seconds: float = Field(default=60, gt=0)
+    storage_type: OtpStorageType = Field(default=OtpStorageType.Memory)
+    redis_url: Optional[str] = Field(default=None)
+    redis_key_prefix: str = Field(default="py_spring_admin:otp")
 
 
 class InvalidOtpError(Exception): ...
@@ -26,40 +40,97 @@ class OtpService(Component):
     Generates and manages one-time passwords (OTPs) for user authentication.
 
     The `OtpService` class is responsible for generating and caching OTPs for users. It provides a `generate_otp` method to generate a new OTP for a given user ID and store it in an internal cache.
+    OTPs are kept in the `OtpStorage` selected by `OtpProperties.storage_type`: bounded process
+    memory by default, or a SQL table or Redis shared by every worker. Expired OTPs are evicted by
+    a background sweeper every `OtpProperties.sweep_interval_seconds`. Codes are stored as
+    HMAC-SHA256 digests keyed with `admin_security.secret`; a 6-digit code is trivially brute
+    forced from a plain hash, but not from a keyed one without the secret.
     """
 
+    otp_properties: OtpProperties
+    admin_security_properties: AdminSecurityProperties
+
     def __init__(self) -> None:
-        self.one_time_password_cache: dict[str, dict[OtpPurpose, OneTimePassword]] = defaultdict(dict)
+        self.stop_event = threading.Event()
+        self.optional_sweeper: Optional[threading.Thread] = None
+
+    def post_construct(self) -> None:
+        self.otp_storage = self._create_otp_storage()
+        self.optional_sweeper = threading.Thread(
+            target=self._sweep_expired_otps, name="otp-sweeper", daemon=True
+        )
+        self.optional_sweeper.start()
+
+    def pre_destroy(self) -> None:
+        self.stop_event.set()
+        if self.optional_sweeper is not None:
+            self.optional_sweeper.join(timeout=5)
+
+    def _create_otp_storage(self) -> OtpStorage:
+        logger.info(f"[OTP STORAGE] Using {self.otp_properties.storage_type} OTP storage")
+        match self.otp_properties.storage_type:
+            case OtpStorageType.Memory:
+                return InMemoryOtpStorage(max_entries=self.otp_properties.max_entries)
+            case OtpStorageType.Sql:
+                return SqlOtpStorage()
+            case OtpStorageType.Redis:
+                if self.otp_properties.redis_url is None:
+                    raise ValueError("[OTP STORAGE] otp.redis_url is required for redis storage")
+                return RedisOtpStorage.from_url(
+                    self.otp_properties.redis_url, self.otp_properties.redis_key_prefix
+                )
+
+    def _sweep_expired_otps(self) -> None:
+        while not self.stop_event.wait(self.otp_properties.sweep_interval_seconds):
+            try:
+                evicted_count = self.otp_storage.evict_expired()
+            except Exception as error:
+                logger.error(f"[OTP SWEEPER] Failed to evict expired OTPs: {error}")
+                continue
+            if evicted_count > 0:
+                logger.debug(f"[OTP SWEEPER] Evicted {evicted_count} expired OTPs")
 
     def get_otp(self, purpose: OtpPurpose, _id: str) -> OneTimePassword:
         code = self._generate_otp()
         password = OneTimePassword(
             code=code,
-            expired_at=datetime.datetime.now() + datetime.timedelta(minutes=5),
+            expired_at=datetime.datetime.now()
+            + datetime.timedelta(seconds=self.otp_properties.ttl_seconds),
+        )
+        self.otp_storage.put(
+            _id,
+            purpose,
+            password.model_copy(update={"code": self._hash_code(_id, purpose, code)}),
         )
-        self.one_time_password_cache[_id][purpose] = password
         return password
 
     def validate_otp(self, _id: str, purpose: OtpPurpose ,code: str) -> Optional[InvalidOtpError]:
-        optional_otps = self.one_time_password_cache.get(_id)
-
-        if optional_otps is None:
-            return InvalidOtpError("OTP not found")
-        
-        optional_password = optional_otps.get(purpose)
+        optional_password = self.otp_storage.get(_id, purpose)
         if optional_password is None:
             return InvalidOtpError(f"OTP for purpose: {purpose} not found")
         
         is_expired = optional_password.expired_at < datetime.datetime.now()
         if is_expired:
             return InvalidOtpError("OTP is expired")
-        if optional_password.code != code:
+        if not hmac.compare_digest(
+            optional_password.code, self._hash_code(_id, purpose, code)
+        ):
             return InvalidOtpError("OTP is incorrect")
 
     def delete_otp(self, _id: str) -> None:
-        if _id in self.one_time_password_cache:
-            self.one_time_password_cache.pop(_id)
+        for purpose in OtpPurpose:
+            self.otp_storage.delete(_id, purpose)
+
+    def get_stats(self) -> OtpStorageStats:
+        return self.otp_storage.get_stats()
+
+    def _hash_code(self, _id: str, purpose: OtpPurpose, code: str) -> str:
+        return hmac.new(
+            self.admin_security_properties.secret.encode(),
+            f"{purpose.value}:{_id}:{code}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
 
     def _generate_otp(self) -> str:
         choices = list(range(0, 10))
-        return "".join(str(random.choice(choices)) for _ in range(6))
+        return "".join(str(secrets.choice(choices)) for _ in range(6))
@@ -0,0 +1,157 @@
+import datetime
+import heapq
+import itertools
+import threading
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from pydantic import BaseModel
+
+from py_spring_admin.core.repository.commons import StrEnum
+
+
+class OtpPurpose(StrEnum):
+    PasswordReset = "password_reset"
+    UserRegistration = "user_registration"
+
+
+class OneTimePassword(BaseModel):
+    code: str
+    expired_at: datetime.datetime
+
+
+class OtpStorageType(StrEnum):
+    Memory = "memory"
+    Sql = "sql"
+    Redis = "redis"
+
+
+class OtpStorageStats(BaseModel):
+    storage_type: OtpStorageType
+    live_entries: int
+    max_entries: Optional[int] = None
+    expired_evictions: int
+    capacity_evictions: int = 0
+
+
+class OtpStorage(ABC):
+    """
+    Storage of one-time passwords, keyed by id and purpose.
+
+    The in-memory storage is local to the process; the SQL and Redis storages are shared, so an
+    OTP issued by one worker or pod can be validated by another. `OtpService` only hands over
+    codes keyed-hashed with the server secret, so the stored codes are useless without it.
+    """
+
+    @abstractmethod
+    def put(self, _id: str, purpose: OtpPurpose, password: OneTimePassword) -> None: ...
+
+    @abstractmethod
+    def get(self, _id: str, purpose: OtpPurpose) -> Optional[OneTimePassword]:
+        """
+        Returns the stored password, which may already be expired if it was not evicted yet.
+        """
+
+    @abstractmethod
+    def delete(self, _id: str, purpose: OtpPurpose) -> None: ...
+
+    @abstractmethod
+    def evict_expired(self) -> int:
+        """
+        Evicts the expired passwords, returning how many were evicted.
+        """
+
+    @abstractmethod
+    def get_stats(self) -> OtpStorageStats: ...
+
+
+_OtpKey = tuple[str, OtpPurpose]
+
+
+class InMemoryOtpStorage(OtpStorage):
+    """
+    Thread-safe in-memory store of one-time passwords, keyed by id and purpose.
+
+    Entries are indexed in a heap ordered by expiry, so `evict_expired` removes each expired
+    entry in O(log n) without scanning the store. Heap items of replaced or deleted entries are
+    skipped when popped. The store holds at most `max_entries` entries; when full, the entry
+    closest to expiry is evicted to make room.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.entries: dict[_OtpKey, tuple[int, OneTimePassword]] = {}
+        self.expiry_heap: list[tuple[float, int, _OtpKey]] = []
+        self.sequence = itertools.count()
+        self.lock = threading.Lock()
+        self.expired_evictions = 0
+        self.capacity_evictions = 0
+
+    def put(self, _id: str, purpose: OtpPurpose, password: OneTimePassword) -> None:
+        key = (_id, purpose)
+        with self.lock:
+            self._evict_expired()
+            if key not in self.entries and len(self.entries) >= self.max_entries:
+                self._evict_closest_to_expiry()
+            sequence = next(self.sequence)
+            self.entries[key] = (sequence, password)
+            heapq.heappush(
+                self.expiry_heap, (password.expired_at.timestamp(), sequence, key)
+            )
+            self._compact_heap()
+
+    def get(self, _id: str, purpose: OtpPurpose) -> Optional[OneTimePassword]:
+        optional_entry = self.entries.get((_id, purpose))
+        if optional_entry is None:
+            return None
+        return optional_entry[1]
+
+    def delete(self, _id: str, purpose: OtpPurpose) -> None:
+        with self.lock:
+            self.entries.pop((_id, purpose), None)
+
+    def evict_expired(self) -> int:
+        with self.lock:
+            return self._evict_expired()
+
+    def _is_live(self, sequence: int, key: _OtpKey) -> bool:
+        optional_entry = self.entries.get(key)
+        return optional_entry is not None and optional_entry[0] == sequence
+
+    def _evict_expired(self) -> int:
+        now = datetime.datetime.now().timestamp()
+        evicted_count = 0
+        while len(self.expiry_heap) > 0 and self.expiry_heap[0][0] <= now:
+            _, sequence, key = heapq.heappop(self.expiry_heap)
+            if self._is_live(sequence, key):
+                del self.entries[key]
+                evicted_count += 1
+        self.expired_evictions += evicted_count
+        return evicted_count
+
+    def _evict_closest_to_expiry(self) -> None:
+        while len(self.expiry_heap) > 0:
+            _, sequence, key = heapq.heappop(self.expiry_heap)
+            if self._is_live(sequence, key):
+                del self.entries[key]
+                self.capacity_evictions += 1
+                return
+
+    def _compact_heap(self) -> None:
+        # drop the items of replaced and deleted entries once they outnumber the live ones
+        if len(self.expiry_heap) <= 2 * len(self.entries) + 64:
+            return
+        self.expiry_heap = [
+            item for item in self.expiry_heap if self._is_live(item[1], item[2])
+        ]
+        heapq.heapify(self.expiry_heap)
+
+    def get_stats(self) -> OtpStorageStats:
+        with self.lock:
+            return OtpStorageStats(
+                storage_type=OtpStorageType.Memory,
+                live_entries=len(self.entries),
+                max_entries=self.max_entries,
+                expired_evictions=self.expired_evictions,
+                capacity_evictions=self.capacity_evictions,
+            )
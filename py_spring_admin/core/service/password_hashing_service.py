@@ -0,0 +1,122 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from loguru import logger
+from passlib.context import CryptContext
+from py_spring_core import Component, Properties
+from pydantic import BaseModel, Field
+
+from py_spring_admin.core.service.errors import PasswordHashingUnavailable
+from py_spring_admin.core.service.metrics import TimingMetrics
+
+T = TypeVar("T")
+
+
+class PasswordHashingProperties(Properties):
+    __key__ = "password_hashing"
+    max_workers: int = Field(default=2, gt=0)
+    max_pending_tasks: int = Field(default=64, gt=0)
+
+
+class PasswordHashingMetrics(BaseModel):
+    max_workers: int
+    max_pending_tasks: int
+    pending_tasks: int
+    rejected_tasks: int
+    queue_wait: TimingMetrics
+    hash_time: TimingMetrics
+
+
+class PasswordHashingService(Component):
+    """
+    Hashes and verifies passwords on a dedicated, size-limited thread pool.
+
+    bcrypt releases the GIL while hashing, so `max_workers` threads bound the CPU spent on
+    passwords and the request threads only wait for the result. At most `max_pending_tasks` tasks
+    may be queued or running; beyond that new tasks are rejected with `PasswordHashingUnavailable`
+    (HTTP 503) instead of queueing without bound.
+    """
+
+    password_hashing_properties: PasswordHashingProperties
+    password_context: CryptContext
+
+    def __init__(self) -> None:
+        self.optional_executor: Optional[ThreadPoolExecutor] = None
+        self.lock = threading.Lock()
+        self.pending_tasks = 0
+        self.rejected_tasks = 0
+        self.queue_wait = TimingMetrics()
+        self.hash_time = TimingMetrics()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # created on first use, since components may hash passwords in their own
+        # post_construct before this one is initialized
+        with self.lock:
+            if self.optional_executor is None:
+                self.optional_executor = ThreadPoolExecutor(
+                    max_workers=self.password_hashing_properties.max_workers,
+                    thread_name_prefix="password-hashing",
+                )
+            return self.optional_executor
+
+    def pre_destroy(self) -> None:
+        if self.optional_executor is not None:
+            self.optional_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, func: Callable[..., T], *args: Any) -> Future[T]:
+        executor = self._get_executor()
+        with self.lock:
+            if self.pending_tasks >= self.password_hashing_properties.max_pending_tasks:
+                self.rejected_tasks += 1
+                logger.warning(
+                    f"[PASSWORD HASHING] Rejecting task, {self.pending_tasks} tasks pending"
+                )
+                raise PasswordHashingUnavailable()
+            self.pending_tasks += 1
+        submitted_at = time.perf_counter()
+        return executor.submit(self._run_task, submitted_at, func, *args)
+
+    def _run_task(self, submitted_at: float, func: Callable[..., T], *args: Any) -> T:
+        started_at = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            finished_at = time.perf_counter()
+            with self.lock:
+                self.pending_tasks -= 1
+                self.queue_wait.record(started_at - submitted_at)
+                self.hash_time.record(finished_at - started_at)
+
+    def hash_password(self, raw_password: str) -> str:
+        return self._submit(self.password_context.hash, raw_password).result()
+
+    def verify_password(self, raw_password: str, hashed_password: str) -> bool:
+        return self._submit(
+            self.password_context.verify, raw_password, hashed_password
+        ).result()
+
+    async def async_hash_password(self, raw_password: str) -> str:
+        return await asyncio.wrap_future(
+            self._submit(self.password_context.hash, raw_password)
+        )
+
+    async def async_verify_password(
+        self, raw_password: str, hashed_password: str
+    ) -> bool:
+        return await asyncio.wrap_future(
+            self._submit(self.password_context.verify, raw_password, hashed_password)
+        )
+
+    def get_metrics(self) -> PasswordHashingMetrics:
+        with self.lock:
+            return PasswordHashingMetrics(
+                max_workers=self.password_hashing_properties.max_workers,
+                max_pending_tasks=self.password_hashing_properties.max_pending_tasks,
+                pending_tasks=self.pending_tasks,
+                rejected_tasks=self.rejected_tasks,
+                queue_wait=self.queue_wait.model_copy(),
+                hash_time=self.hash_time.model_copy(),
+            )
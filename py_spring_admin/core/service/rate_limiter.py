@@ -0,0 +1,126 @@
+import math
+import threading
+import time
+from typing import Optional
+
+import cachetools
+from pydantic import BaseModel
+
+
+class RateLimiterStats(BaseModel):
+    tracked_keys: int
+    max_keys: int
+    allowed_requests: int
+    limited_requests: int
+
+
+class _WindowCounter:
+    __slots__ = ("window_start", "current_count", "previous_count")
+
+    def __init__(self, window_start: float) -> None:
+        self.window_start = window_start
+        self.current_count = 0
+        self.previous_count = 0
+
+
+class SlidingWindowRateLimiter:
+    """
+    In-process sliding-window rate limiter, allowing `max_requests` per key in any
+    `window_seconds` window.
+
+    The window is approximated from the counts of the current and previous fixed windows, the
+    previous one weighted by how much of it still overlaps the sliding window, so each key costs
+    two counters instead of one timestamp per request. Keys idle for two windows expire, and at
+    most `max_keys` keys are tracked, evicting the least recently used ones first.
+    """
+
+    def __init__(self, max_requests: int, window_seconds: float, max_keys: int) -> None:
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.counters: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=max_keys, ttl=2 * window_seconds
+        )
+        self.lock = threading.Lock()
+        self.allowed_requests = 0
+        self.limited_requests = 0
+
+    def _get_counter(self, key: str, now: float) -> _WindowCounter:
+        current_window_start = now - now % self.window_seconds
+        optional_counter: Optional[_WindowCounter] = self.counters.get(key)
+        if optional_counter is None:
+            counter = _WindowCounter(current_window_start)
+        else:
+            counter = optional_counter
+            elapsed_windows = round(
+                (current_window_start - counter.window_start) / self.window_seconds
+            )
+            if elapsed_windows >= 1:
+                counter.previous_count = counter.current_count if elapsed_windows == 1 else 0
+                counter.current_count = 0
+                counter.window_start = current_window_start
+        # re-inserting refreshes the TTL of the key
+        self.counters[key] = counter
+        return counter
+
+    def hit(self, key: str) -> Optional[float]:
+        """
+        Counts one request for the key, unless it is over the limit.
+
+        Returns:
+            Optional[float]: `None` if the request is allowed, else the seconds to wait before retrying.
+        """
+        return self.hit_all([key])
+
+    def hit_all(self, keys: list[str]) -> Optional[float]:
+        """
+        Counts one request for every key, only if none of them is over the limit; a rejected
+        request counts against no key, so a throttled client cannot use up the budget of the
+        other keys (e.g. the account it targets).
+
+        Returns:
+            Optional[float]: `None` if the request is allowed, else the longest wait before retrying.
+        """
+        now = time.time()
+        with self.lock:
+            counters = [self._get_counter(key, now) for key in keys]
+            retry_after_seconds = [
+                self._get_retry_after_seconds(counter, now)
+                for counter in counters
+                if self._get_weighted_count(counter, now) + 1 > self.max_requests
+            ]
+            if len(retry_after_seconds) > 0:
+                self.limited_requests += 1
+                return max(retry_after_seconds)
+            for counter in counters:
+                counter.current_count += 1
+            self.allowed_requests += 1
+            return None
+
+    def _get_weighted_count(self, counter: _WindowCounter, now: float) -> float:
+        elapsed_ratio = (now - counter.window_start) / self.window_seconds
+        return counter.previous_count * (1 - elapsed_ratio) + counter.current_count
+
+    def _get_retry_after_seconds(self, counter: _WindowCounter, now: float) -> float:
+        # the request is allowed once the weighted count drops to max_requests - 1
+        if counter.current_count + 1 > self.max_requests:
+            # the current window alone is full, wait for it to slide out in the next window
+            required_ratio = 1 - (self.max_requests - 1) / counter.current_count
+            return counter.window_start + (1 + required_ratio) * self.window_seconds - now
+        # wait until enough of the previous window slid out
+        required_ratio = (
+            1 - (self.max_requests - 1 - counter.current_count) / counter.previous_count
+        )
+        return max(counter.window_start + required_ratio * self.window_seconds - now, 0)
+
+    def get_stats(self) -> RateLimiterStats:
+        with self.lock:
+            return RateLimiterStats(
+                tracked_keys=len(self.counters),
+                max_keys=int(self.counters.maxsize),
+                allowed_requests=self.allowed_requests,
+                limited_requests=self.limited_requests,
+            )
+
+    @staticmethod
+    def to_retry_after_header(retry_after_seconds: float) -> str:
+        return str(max(math.ceil(retry_after_seconds), 1))
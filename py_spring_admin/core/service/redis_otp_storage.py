@@ -0,0 +1,70 @@
+import datetime
+import math
+from typing import Any, Optional
+
+from py_spring_admin.core.service.otp_storage import (
+    OneTimePassword,
+    OtpPurpose,
+    OtpStorage,
+    OtpStorageStats,
+    OtpStorageType,
+)
+
+
+class RedisOtpStorage(OtpStorage):
+    """
+    OTP storage on a Redis-protocol server, shared by every worker and pod using it.
+
+    Each OTP is one JSON string key set with a TTL matching its expiry, so the server evicts
+    expired OTPs itself and `evict_expired` has nothing to do. Any client with the `redis-py`
+    `get` / `set` / `delete` / `scan_iter` interface works, e.g. a `fakeredis` client in tests.
+
+    Requires the `redis` extra when created with `from_url`.
+    """
+
+    def __init__(self, client: Any, key_prefix: str) -> None:
+        self.client = client
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, key_prefix: str) -> "RedisOtpStorage":
+        try:
+            import redis
+        except ImportError as error:
+            raise ImportError(
+                "[OTP STORAGE] Redis OTP storage requires the redis package, please install py_spring_admin[redis]"
+            ) from error
+        return cls(redis.Redis.from_url(url), key_prefix)
+
+    def _to_key(self, _id: str, purpose: OtpPurpose) -> str:
+        return f"{self.key_prefix}:{purpose.value}:{_id}"
+
+    def put(self, _id: str, purpose: OtpPurpose, password: OneTimePassword) -> None:
+        ttl_seconds = math.ceil(
+            (password.expired_at - datetime.datetime.now()).total_seconds()
+        )
+        if ttl_seconds <= 0:
+            return
+        self.client.set(
+            self._to_key(_id, purpose), password.model_dump_json(), ex=ttl_seconds
+        )
+
+    def get(self, _id: str, purpose: OtpPurpose) -> Optional[OneTimePassword]:
+        optional_value = self.client.get(self._to_key(_id, purpose))
+        if optional_value is None:
+            return None
+        return OneTimePassword.model_validate_json(optional_value)
+
+    def delete(self, _id: str, purpose: OtpPurpose) -> None:
+        self.client.delete(self._to_key(_id, purpose))
+
+    def evict_expired(self) -> int:
+        return 0
+
+    def get_stats(self) -> OtpStorageStats:
+        live_entries = sum(1 for _ in self.client.scan_iter(match=f"{self.key_prefix}:*"))
+        return OtpStorageStats(
+            storage_type=OtpStorageType.Redis,
+            live_entries=live_entries,
+            expired_evictions=0,
+        )
@@ -0,0 +1,109 @@
+import threading
+from typing import Hashable, Optional, Sequence
+
+import cachetools
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Table, func, select, text
+from sqlalchemy.orm import Session
+
+from py_spring_admin.core.service.model_query import RowCountMode
+
+
+class RowCount(BaseModel):
+    total: int
+    is_estimated: bool
+
+
+class RowCounter:
+    """
+    Counts table rows for pagination.
+
+    Exact counts run `SELECT COUNT(*)` and are kept in a TTL cache, keyed by table and filter,
+    until the TTL expires or a write to the table invalidates them. A count that started before
+    an invalidation of its table is returned but not cached, since it may predate that write.
+    Estimated counts read planner statistics instead of scanning the table: `pg_class.reltuples`
+    on PostgreSQL and `sqlite_stat1` on SQLite. They fall back to the cached exact count when no
+    statistics are available or when the query is filtered.
+    """
+
+    def __init__(self, cache_size: int, cache_ttl_seconds: float) -> None:
+        self.exact_count_cache: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=cache_size, ttl=cache_ttl_seconds
+        )
+        self.cache_lock = threading.Lock()
+        self.table_generations: dict[str, int] = {}
+
+    def count_rows(
+        self,
+        session: Session,
+        table: Table,
+        where_clauses: Sequence[ColumnElement[bool]],
+        filter_key: Hashable,
+        mode: RowCountMode,
+    ) -> RowCount:
+        if mode == RowCountMode.Estimated and len(where_clauses) == 0:
+            optional_estimate = self._estimate_rows(session, table)
+            if optional_estimate is not None:
+                return RowCount(total=optional_estimate, is_estimated=True)
+        return RowCount(
+            total=self._count_rows_exactly(session, table, where_clauses, filter_key),
+            is_estimated=False,
+        )
+
+    def invalidate(self, table_name: str) -> None:
+        with self.cache_lock:
+            for cache_key in list(self.exact_count_cache.keys()):
+                if cache_key[0] == table_name:
+                    self.exact_count_cache.pop(cache_key, None)
+            self.table_generations[table_name] = self.table_generations.get(table_name, 0) + 1
+
+    def _count_rows_exactly(
+        self,
+        session: Session,
+        table: Table,
+        where_clauses: Sequence[ColumnElement[bool]],
+        filter_key: Hashable,
+    ) -> int:
+        cache_key = (table.name, filter_key)
+        with self.cache_lock:
+            optional_count = self.exact_count_cache.get(cache_key)
+            generation = self.table_generations.get(table.name, 0)
+        if optional_count is not None:
+            return optional_count
+
+        statement = select(func.count()).select_from(table).where(*where_clauses)
+        count: int = session.execute(statement).scalar_one()
+        with self.cache_lock:
+            if generation == self.table_generations.get(table.name, 0):
+                self.exact_count_cache[cache_key] = count
+        return count
+
+    def _estimate_rows(self, session: Session, table: Table) -> Optional[int]:
+        dialect = session.get_bind().dialect
+        match dialect.name:
+            case "postgresql":
+                # reltuples is -1 (or 0 on older servers) until the table has been vacuumed/analyzed
+                reltuples = session.execute(
+                    text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:table_name)"),
+                    {"table_name": dialect.identifier_preparer.format_table(table)},
+                ).scalar_one_or_none()
+                if reltuples is None or reltuples <= 0:
+                    return None
+                return int(reltuples)
+            case "sqlite":
+                has_statistics = session.execute(
+                    text(
+                        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+                    )
+                ).first()
+                if has_statistics is None:
+                    return None
+                # the first number of every sqlite_stat1 entry is the row count of the table
+                stat = session.execute(
+                    text("SELECT stat FROM sqlite_stat1 WHERE tbl = :table_name LIMIT 1"),
+                    {"table_name": table.name},
+                ).scalar_one_or_none()
+                if stat is None:
+                    return None
+                return int(stat.split()[0])
+        return None
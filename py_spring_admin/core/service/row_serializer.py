@@ -0,0 +1,123 @@
+import datetime
+import types
+from decimal import Decimal
+from enum import Enum
+from inspect import isclass
+from typing import Annotated, Any, Callable, Sequence, Type, Union, get_args, get_origin
+from uuid import UUID
+
+from py_spring_model import PySpringModel
+from pydantic import TypeAdapter
+from sqlalchemy import Column, Table
+
+ValueEncoder = Callable[[Any], Any]
+
+
+def _encode_identity(value: Any) -> Any:
+    return value
+
+
+def _encode_to_str(value: Any) -> str:
+    return str(value)
+
+
+def _encode_enum(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _encode_datetime(value: datetime.datetime) -> str:
+    iso_format = value.isoformat()
+    if iso_format.endswith("+00:00"):
+        return iso_format[:-6] + "Z"
+    return iso_format
+
+
+def _encode_isoformat(value: datetime.date | datetime.time) -> str:
+    return value.isoformat()
+
+
+def _encode_bytes(value: bytes) -> str:
+    return value.decode()
+
+
+_ENCODERS_BY_TYPE: list[tuple[Type[Any], ValueEncoder]] = [
+    (Enum, _encode_enum),
+    (bool, _encode_identity),
+    (int, _encode_identity),
+    (float, _encode_identity),
+    (str, _encode_identity),
+    (Decimal, _encode_to_str),
+    (UUID, _encode_to_str),
+    (datetime.datetime, _encode_datetime),
+    (datetime.date, _encode_isoformat),
+    (datetime.time, _encode_isoformat),
+    (bytes, _encode_bytes),
+]
+
+
+def _unwrap_annotation(annotation: Any) -> Any:
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _unwrap_annotation(get_args(annotation)[0])
+    if origin is Union or origin is types.UnionType:
+        non_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(non_none_args) == 1:
+            return _unwrap_annotation(non_none_args[0])
+    return annotation
+
+
+def _create_encoder(annotation: Any) -> ValueEncoder:
+    """
+    Picks a direct encoder matching what pydantic produces in JSON mode for the field type,
+    falling back to a TypeAdapter for anything else.
+    """
+    builtin_type = _unwrap_annotation(annotation)
+    if isclass(builtin_type):
+        for _type, encoder in _ENCODERS_BY_TYPE:
+            if issubclass(builtin_type, _type):
+                return encoder
+    type_adapter = TypeAdapter(annotation)
+    return lambda value: type_adapter.dump_python(value, mode="json")
+
+
+class RowSerializer:
+    """
+    Serializes `Row` tuples selected from a table into JSON-ready dicts in a single pass,
+    without building model instances or round-tripping through a JSON string.
+
+    Fields excluded from the model dump (e.g. `Field(exclude=True)`) are never selected.
+    """
+
+    def __init__(self, columns: Sequence[Column], encoders: Sequence[ValueEncoder]) -> None:
+        self.columns = list(columns)
+        self.field_names = [column.name for column in self.columns]
+        self.encoders = list(encoders)
+
+    @classmethod
+    def from_model(cls, model_cls: Type[PySpringModel], table: Table) -> "RowSerializer":
+        columns: list[Column] = []
+        encoders: list[ValueEncoder] = []
+        for column in table.columns:
+            field_info = model_cls.model_fields[column.name]
+            if field_info.exclude:
+                continue
+            columns.append(column)
+            encoders.append(_create_encoder(field_info.annotation))
+        return cls(columns, encoders)
+
+    def project(self, field_names: Sequence[str]) -> "RowSerializer":
+        """
+        Returns a serializer for the given subset of fields, in the given order.
+        """
+        index_lookup = {name: index for index, name in enumerate(self.field_names)}
+        indices = [index_lookup[name] for name in field_names]
+        return RowSerializer(
+            [self.columns[index] for index in indices],
+            [self.encoders[index] for index in indices],
+        )
+
+    def serialize(self, row: Sequence[Any]) -> dict[str, Any]:
+        return {
+            field_name: None if value is None else encode(value)
+            for field_name, encode, value in zip(self.field_names, self.encoders, row)
+        }
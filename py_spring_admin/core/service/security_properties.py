@@ -0,0 +1,22 @@
+from typing import Optional
+from uuid import uuid4
+
+from py_spring_core import Properties
+from pydantic import Field
+
+
+class AdminSecurityProperties(Properties):
+    __key__ = "admin_security"
+    # signs the JWTs and keys the OTP hashes, so workers sharing tokens or an OTP storage need the same one
+    secret: str = Field(default_factory=lambda: str(uuid4()))
+    verified_token_cache_size: int = Field(default=4096, gt=0)
+    verified_token_cache_ttl_seconds: float = Field(default=300, gt=0)
+    token_ttl_seconds: Optional[int] = Field(default=7 * 24 * 60 * 60, gt=0)
+    is_token_revocation_persisted: bool = Field(default=False)
+    # revocations of tokens without exp (token_ttl_seconds unset) are forgotten after this
+    token_revocation_max_retention_seconds: float = Field(default=30 * 24 * 60 * 60, gt=0)
+    # how long a persisted token found not revoked is trusted before the table is checked again
+    token_revocation_check_interval_seconds: float = Field(default=5, gt=0)
+    rate_limit_max_attempts: int = Field(default=10, gt=0)
+    rate_limit_window_seconds: float = Field(default=60, gt=0)
+    rate_limit_max_keys: int = Field(default=100_000, gt=0)
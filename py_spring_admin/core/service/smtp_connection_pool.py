@@ -0,0 +1,145 @@
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from email.message import EmailMessage
+from typing import Iterator, Optional
+
+from loguru import logger
+
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP) -> None:
+        self.smtp = smtp
+        self.last_used_at = time.monotonic()
+
+
+class FailedEmail:
+    def __init__(self, email_message: EmailMessage, error: Exception) -> None:
+        self.email_message = email_message
+        self.error = error
+
+
+class SmtpConnectionPool:
+    """
+    Pool of connected (and optionally authenticated) SMTP sessions, reused across messages so
+    the TCP, STARTTLS and LOGIN handshakes are paid once per connection instead of per message.
+
+    A connection idle for longer than `idle_timeout_seconds` is closed instead of reused, and a
+    reused connection is checked with `NOOP` first; a broken one is replaced by a new connection.
+    At most `max_size` connections are open at a time, callers beyond that wait for one.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        max_size: int,
+        idle_timeout_seconds: float,
+        optional_credentials: Optional[tuple[str, str]] = None,
+        is_starttls: bool = True,
+        timeout_seconds: float = 30,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.optional_credentials = optional_credentials
+        self.is_starttls = is_starttls
+        self.timeout_seconds = timeout_seconds
+        self.idle_connections: list[_PooledConnection] = []
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(max_size)
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout_seconds)
+        try:
+            if self.is_starttls:
+                smtp.starttls()
+            if self.optional_credentials is not None:
+                smtp.login(*self.optional_credentials)
+        except Exception:
+            self._close(smtp)
+            raise
+        logger.debug(f"[SMTP POOL] Opened connection to {self.host}:{self.port}")
+        return _PooledConnection(smtp)
+
+    def _close(self, smtp: smtplib.SMTP) -> None:
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+    def _is_healthy(self, connection: _PooledConnection) -> bool:
+        if time.monotonic() - connection.last_used_at > self.idle_timeout_seconds:
+            return False
+        try:
+            status_code, _ = connection.smtp.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return status_code == 250
+
+    def _take_connection(self) -> _PooledConnection:
+        while True:
+            with self.lock:
+                if len(self.idle_connections) == 0:
+                    break
+                connection = self.idle_connections.pop()
+            if self._is_healthy(connection):
+                return connection
+            self._close(connection.smtp)
+        return self._connect()
+
+    @contextmanager
+    def acquire(self) -> Iterator[smtplib.SMTP]:
+        """
+        Lends a healthy connection, returned to the pool on exit. If the block raises, the
+        connection is closed instead, since its session state is unknown.
+        """
+        with self.slots:
+            connection = self._take_connection()
+            try:
+                yield connection.smtp
+            except Exception:
+                self._close(connection.smtp)
+                raise
+            connection.last_used_at = time.monotonic()
+            with self.lock:
+                self.idle_connections.append(connection)
+
+    def send_messages(
+        self, sender: str, email_messages: list[EmailMessage]
+    ) -> list[FailedEmail]:
+        """
+        Sends the messages over one pooled session, reconnecting once if the session breaks.
+
+        Returns:
+            list[FailedEmail]: The messages that could not be sent, with the error of each.
+        """
+        pending_messages = list(email_messages)
+        failed_emails: list[FailedEmail] = []
+        for _ in range(2):
+            try:
+                with self.acquire() as smtp:
+                    while len(pending_messages) > 0:
+                        email_message = pending_messages[0]
+                        try:
+                            smtp.sendmail(sender, email_message["To"], email_message.as_string())
+                        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError) as error:
+                            # rejected by the server, the session itself is still usable
+                            logger.error(error)
+                            failed_emails.append(FailedEmail(email_message, error))
+                        pending_messages.pop(0)
+                return failed_emails
+            except (smtplib.SMTPException, OSError) as error:
+                logger.warning(f"[SMTP POOL] Session failed, reconnecting: {error}")
+                session_error = error
+        return failed_emails + [
+            FailedEmail(email_message, session_error) for email_message in pending_messages
+        ]
+
+    def close(self) -> None:
+        with self.lock:
+            idle_connections = self.idle_connections
+            self.idle_connections = []
+        for connection in idle_connections:
+            self._close(connection.smtp)
@@ -1,16 +1,21 @@
 import os
-import smtplib
+import queue
 import threading
-import time
 from email.message import EmailMessage
 from enum import Enum
-from typing import Optional
+from typing import Optional, cast
 
 from loguru import logger
 from py_spring_core import Component, Properties
 from pydantic import Field
 
+from py_spring_admin.core.service.email_outbox import (
+    ClaimedEmail,
+    EmailOutbox,
+    EmailOutboxMetrics,
+)
 from py_spring_admin.core.service.errors import EmailDomainNowAllowed
+from py_spring_admin.core.service.smtp_connection_pool import FailedEmail, SmtpConnectionPool
 
 
 class ServiceProvider(Enum):
@@ -28,6 +33,19 @@ class SmtpProperties(Properties):
     sender_password: str
     allowed_domains: list[str]
     is_dry_run: bool = Field(default=True)
+    worker_count: int = Field(default=1, gt=0)
+    retry_delay_seconds: float = Field(default=1, ge=0)
+    is_starttls: bool = Field(default=True)
+    is_login_required: bool = Field(default=True)
+    connection_pool_size: int = Field(default=2, gt=0)
+    connection_idle_timeout_seconds: float = Field(default=60, gt=0)
+    send_batch_size: int = Field(default=20, gt=0)
+    is_outbox_enabled: bool = Field(default=False)
+    outbox_max_attempts: int = Field(default=8, gt=0)
+    outbox_base_backoff_seconds: float = Field(default=5, gt=0)
+    outbox_max_backoff_seconds: float = Field(default=3600, gt=0)
+    outbox_claim_lease_seconds: float = Field(default=300, gt=0)
+    outbox_poll_interval_seconds: float = Field(default=5, gt=0)
 
     service_provider: Optional[ServiceProvider] = Field(default=None)
 
@@ -45,26 +63,85 @@ class EmailContentType(str, Enum):
 
 
 class SmtpService(Component):
+    """
+    Sends emails in the background.
+
+    Queued emails are sent by `SmtpProperties.worker_count` worker threads, which block on the
+    queue and wake up as soon as an email is queued. On shutdown, each worker stops after the
+    emails queued before it.
+
+    Workers drain up to `send_batch_size` queued emails at a time and send them over one
+    session of a shared `SmtpConnectionPool`. Emails that fail are queued again by a timer after
+    `retry_delay_seconds`, so the workers keep sending the other emails meanwhile.
+
+    With `is_outbox_enabled`, emails are queued in the durable `EmailOutbox` table instead of in
+    memory, and workers claim batches from it, waking up when an email is queued by this instance
+    or every `outbox_poll_interval_seconds` for emails queued by other instances.
+    """
+
     smtp_properties: SmtpProperties
 
     def __init__(self) -> None:
-        self.email_queue: list[EmailMessage] = []
-        self._handle_email_messages()
-        self.queue_lock = threading.Lock()  # Initialize a lock
+        self.email_queue: queue.Queue[Optional[EmailMessage]] = queue.Queue()
+        self.stop_event = threading.Event()
+        self.outbox_wake_event = threading.Event()
+        self.workers: list[threading.Thread] = []
+        self.retry_timers: set[threading.Timer] = set()
+        self.retry_lock = threading.Lock()
+        self.optional_email_outbox: Optional[EmailOutbox] = None
 
     def post_construct(self) -> None:
         self._properties_post_init()
+        self.connection_pool = self._create_connection_pool()
+        if self.smtp_properties.is_outbox_enabled:
+            self.optional_email_outbox = EmailOutbox(
+                max_attempts=self.smtp_properties.outbox_max_attempts,
+                base_backoff_seconds=self.smtp_properties.outbox_base_backoff_seconds,
+                max_backoff_seconds=self.smtp_properties.outbox_max_backoff_seconds,
+                claim_lease_seconds=self.smtp_properties.outbox_claim_lease_seconds,
+            )
+        self._start_workers()
+
+    def pre_destroy(self) -> None:
+        self.stop_event.set()
+        self.outbox_wake_event.set()
+        with self.retry_lock:
+            for retry_timer in self.retry_timers:
+                retry_timer.cancel()
+            if len(self.retry_timers) > 0:
+                logger.warning(
+                    f"[SMTP SERVICE] Service stopping, dropping {len(self.retry_timers)} pending email retries"
+                )
+            self.retry_timers.clear()
+        for _ in self.workers:
+            self.email_queue.put(None)  # one sentinel per worker
+        for worker in self.workers:
+            worker.join(timeout=5)
+        self.connection_pool.close()
+        logger.info("[SMTP SERVICE] Email workers stopped")
+
+    def _create_connection_pool(self) -> SmtpConnectionPool:
+        optional_credentials = None
+        if self.smtp_properties.is_login_required:
+            optional_credentials = (
+                self.smtp_properties.sender_email,
+                self.smtp_properties.sender_password,
+            )
+        return SmtpConnectionPool(
+            host=self.smtp_properties.host,
+            port=self.smtp_properties.port,
+            max_size=self.smtp_properties.connection_pool_size,
+            idle_timeout_seconds=self.smtp_properties.connection_idle_timeout_seconds,
+            optional_credentials=optional_credentials,
+            is_starttls=self.smtp_properties.is_starttls,
+        )
 
     def _properties_post_init(self) -> None:
         match self.smtp_properties.service_provider:
             case ServiceProvider.Google:
                 logger.info(f"[SMTP SERVICE] Using Google SMTP Service...")
                 self.smtp_properties = _GoogleSmtpProperties(
-                    company_name=self.smtp_properties.company_name,
-                    sender_email=self.smtp_properties.sender_email,
-                    sender_password=self.smtp_properties.sender_password,
-                    allowed_domains=self.smtp_properties.allowed_domains,
-                    is_dry_run=self.smtp_properties.is_dry_run,
+                    **self.smtp_properties.model_dump(exclude={"host", "port"})
                 )
 
     def get_company_name(self) -> str:
@@ -116,55 +193,163 @@ class SmtpService(Component):
             )
 
     def async_send_email(self, email_message: EmailMessage) -> bool:
-        with self.queue_lock:
-            self.email_queue.append(email_message)  # Acquire lock before appending
+        if self.optional_email_outbox is not None:
+            self.optional_email_outbox.enqueue(email_message)
+            self.outbox_wake_event.set()
+            return True
+        self.email_queue.put(email_message)
         return True
 
-    def _get_email(self) -> Optional[EmailMessage]:
-        with self.queue_lock:
-            if len(self.email_queue) == 0:
-                return None
-            return self.email_queue.pop(0)
+    def get_outbox_metrics(self) -> Optional[EmailOutboxMetrics]:
+        if self.optional_email_outbox is None:
+            return None
+        return self.optional_email_outbox.get_metrics()
+
+    def _push_back_emails_to_queue(self, email_messages: list[EmailMessage]) -> None:
+        # delay the retry, so an SMTP outage does not become a hot retry loop, without blocking
+        # the worker
+        with self.retry_lock:
+            if self.stop_event.is_set():
+                logger.warning(
+                    f"[EMAIL SENDING ABORTED] Service stopping, dropping {len(email_messages)} emails"
+                )
+                return
+            retry_timer = threading.Timer(
+                self.smtp_properties.retry_delay_seconds,
+                self._requeue_emails,
+                args=(email_messages,),
+            )
+            retry_timer.daemon = True
+            self.retry_timers.add(retry_timer)
+            retry_timer.start()
 
-    def _push_back_email_to_queue(self, email_message: EmailMessage) -> None:
-        with self.queue_lock:
-            self.email_queue.append(email_message)  # Acquire lock before appending
+    def _requeue_emails(self, email_messages: list[EmailMessage]) -> None:
+        with self.retry_lock:
+            # runs on the timer's own thread
+            self.retry_timers.discard(cast(threading.Timer, threading.current_thread()))
+            # pre_destroy cancels the timers under the lock, so no email lands behind the sentinels
+            if self.stop_event.is_set():
+                return
+            for email_message in email_messages:
+                self.email_queue.put(email_message)
 
-    def _send_email(self, email_message: EmailMessage) -> bool:
+    def send_emails(self, email_messages: list[EmailMessage]) -> list[FailedEmail]:
+        """
+        Sends the messages over one pooled SMTP session.
+
+        Returns:
+            list[FailedEmail]: The messages that could not be sent, with the error of each.
+        """
         try:
-            with smtplib.SMTP(
-                self.smtp_properties.host, self.smtp_properties.port
-            ) as smtp:
-                smtp.starttls()
-                sender = self.smtp_properties.sender_email
-                password = self.smtp_properties.sender_password
-                smtp.login(sender, password)
-                smtp.sendmail(sender, email_message["To"], email_message.as_string())
+            failed_emails = self.connection_pool.send_messages(
+                self.smtp_properties.sender_email, email_messages
+            )
+        except Exception as error:
+            logger.error(error)
+            return [FailedEmail(email_message, error) for email_message in email_messages]
+        failed_message_ids = {id(failed_email.email_message) for failed_email in failed_emails}
+        for email_message in email_messages:
+            if id(email_message) not in failed_message_ids:
                 logger.success(
                     f"[EMAIL SENDING SUCCESSFULLY] Sending email to {email_message['To']}"
                 )
-        except Exception as error:
-            logger.error(error)
-            return False
-        return True
+        return failed_emails
+
+    def _start_workers(self) -> None:
+        target = self._handle_email_messages
+        if self.optional_email_outbox is not None:
+            target = self._handle_outbox_messages
+        for index in range(self.smtp_properties.worker_count):
+            worker = threading.Thread(
+                target=target,
+                name=f"smtp-worker-{index}",
+                daemon=True,
+            )
+            worker.start()
+            self.workers.append(worker)
+
+    def _take_email_batch(self) -> tuple[list[EmailMessage], bool]:
+        """
+        Blocks for the next email, then takes the emails already queued behind it, up to
+        `send_batch_size`. Also tells whether the worker was asked to stop.
+        """
+        email_messages: list[EmailMessage] = []
+        optional_email_message = self.email_queue.get()
+        while optional_email_message is not None:
+            email_messages.append(optional_email_message)
+            if len(email_messages) >= self.smtp_properties.send_batch_size:
+                return email_messages, False
+            try:
+                optional_email_message = self.email_queue.get_nowait()
+            except queue.Empty:
+                return email_messages, False
+        return email_messages, True
 
     def _handle_email_messages(self) -> None:
-        def wrapper() -> None:
-            while True:
-                time.sleep(1)
-                email_message = self._get_email()
-                if email_message is None:
-                    continue
+        is_stopping = False
+        while not is_stopping:
+            email_messages, is_stopping = self._take_email_batch()
+            if len(email_messages) == 0:
+                continue
 
-                if self.smtp_properties.is_dry_run:
+            if self.smtp_properties.is_dry_run:
+                for email_message in email_messages:
                     logger.info(f"[DRY RUN] Sending email to {email_message['To']}")
+                continue
+
+            failed_emails = self.send_emails(email_messages)
+            for failed_email in failed_emails:
+                logger.error(
+                    f"[EMAIL SENDING FAILED] Failed to send email to {failed_email.email_message['To']}, push back to queue: {failed_email.error}"
+                )
+            if len(failed_emails) > 0:
+                self._push_back_emails_to_queue(
+                    [failed_email.email_message for failed_email in failed_emails]
+                )
+
+    def _handle_outbox_messages(self) -> None:
+        email_outbox = cast(EmailOutbox, self.optional_email_outbox)
+        poll_interval_seconds = self.smtp_properties.outbox_poll_interval_seconds
+        while not self.stop_event.is_set():
+            try:
+                claim_token, claimed_emails = email_outbox.claim_batch(
+                    self.smtp_properties.send_batch_size
+                )
+                if len(claimed_emails) == 0:
+                    self.outbox_wake_event.wait(poll_interval_seconds)
+                    self.outbox_wake_event.clear()
                     continue
+                self._send_claimed_emails(email_outbox, claim_token, claimed_emails)
+            except Exception as error:
+                logger.exception(error)
+                self.stop_event.wait(poll_interval_seconds)
 
-                is_sent = self._send_email(email_message)
-                if not is_sent:
-                    logger.error(
-                        f"[EMAIL SENDING FAILED] Failed to send email to {email_message['To']}, push back to queue."
-                    )
-                    self._push_back_email_to_queue(email_message)
+    def _send_claimed_emails(
+        self,
+        email_outbox: EmailOutbox,
+        claim_token: str,
+        claimed_emails: list[ClaimedEmail],
+    ) -> None:
+        if self.smtp_properties.is_dry_run:
+            for claimed_email in claimed_emails:
+                logger.info(f"[DRY RUN] Sending email to {claimed_email.email_message['To']}")
+            email_outbox.mark_sent(claim_token, claimed_emails)
+            return
 
-        threading.Thread(target=wrapper).start()
+        failed_emails = self.send_emails(
+            [claimed_email.email_message for claimed_email in claimed_emails]
+        )
+        send_errors = {
+            id(failed_email.email_message): failed_email.error for failed_email in failed_emails
+        }
+        sent_emails: list[ClaimedEmail] = []
+        for claimed_email in claimed_emails:
+            optional_error = send_errors.get(id(claimed_email.email_message))
+            if optional_error is None:
+                sent_emails.append(claimed_email)
+                continue
+            logger.error(
+                f"[EMAIL SENDING FAILED] Failed to send email to {claimed_email.email_message['To']}, attempt {claimed_email.attempts + 1}: {optional_error}"
+            )
+            email_outbox.mark_failed(claim_token, claimed_email, str(optional_error))
+        email_outbox.mark_sent(claim_token, sent_emails)
@@ -0,0 +1,83 @@
+import datetime
+import threading
+from typing import Optional
+
+from py_spring_model import PySpringModel
+from sqlalchemy import delete, func, select
+
+from py_spring_admin.core.repository.models import OneTimePasswordRecord
+from py_spring_admin.core.service.otp_storage import (
+    OneTimePassword,
+    OtpPurpose,
+    OtpStorage,
+    OtpStorageStats,
+    OtpStorageType,
+)
+
+
+class SqlOtpStorage(OtpStorage):
+    """
+    OTP storage in the `app_one_time_password` table of the `PySpringModel` engine, shared by every
+    worker and pod using the same database.
+
+    Rows are keyed by id and purpose, so issuing a new OTP replaces the previous one, and expired
+    rows are deleted in one statement through the index on `expired_at`. The table is bounded by
+    the number of users rather than by a capacity limit.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.expired_evictions = 0
+
+    def put(self, _id: str, purpose: OtpPurpose, password: OneTimePassword) -> None:
+        with PySpringModel.create_managed_session() as session:
+            session.merge(
+                OneTimePasswordRecord(
+                    user_id=_id,
+                    purpose=purpose.value,
+                    code_hash=password.code,
+                    expired_at=password.expired_at,
+                )
+            )
+
+    def get(self, _id: str, purpose: OtpPurpose) -> Optional[OneTimePassword]:
+        with PySpringModel.create_managed_session() as session:
+            optional_record = session.get(OneTimePasswordRecord, (_id, purpose.value))
+            if optional_record is None:
+                return None
+            return OneTimePassword(
+                code=optional_record.code_hash, expired_at=optional_record.expired_at
+            )
+
+    def delete(self, _id: str, purpose: OtpPurpose) -> None:
+        with PySpringModel.create_managed_session() as session:
+            session.execute(
+                delete(OneTimePasswordRecord).where(
+                    OneTimePasswordRecord.user_id == _id,  # type: ignore
+                    OneTimePasswordRecord.purpose == purpose.value,  # type: ignore
+                )
+            )
+
+    def evict_expired(self) -> int:
+        with PySpringModel.create_managed_session() as session:
+            result = session.execute(
+                delete(OneTimePasswordRecord).where(
+                    OneTimePasswordRecord.expired_at <= datetime.datetime.now()  # type: ignore
+                )
+            )
+            evicted_count = result.rowcount
+        with self.lock:
+            self.expired_evictions += evicted_count
+        return evicted_count
+
+    def get_stats(self) -> OtpStorageStats:
+        with PySpringModel.create_managed_session() as session:
+            live_entries = session.execute(
+                select(func.count()).select_from(OneTimePasswordRecord)
+            ).scalar_one()
+        with self.lock:
+            return OtpStorageStats(
+                storage_type=OtpStorageType.Sql,
+                live_entries=live_entries,
+                expired_evictions=self.expired_evictions,
+            )
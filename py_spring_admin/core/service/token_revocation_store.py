@@ -0,0 +1,143 @@
+import datetime
+import heapq
+import threading
+import time
+from typing import Optional
+
+import cachetools
+from loguru import logger
+from py_spring_model import PySpringModel
+from sqlalchemy import delete, update
+from sqlalchemy.orm import Session
+from sqlmodel import col, select
+
+from py_spring_admin.core.repository.models import RevokedToken
+
+
+class TokenRevocationStore:
+    """
+    Set of revoked token ids (`jti` claims), checked on every request in O(1).
+
+    Each revoked id is kept until the `exp` of its token, after which the token is rejected
+    anyway, and at most `max_retention_seconds` after the revocation, so ids of tokens without
+    `exp` do not pile up. Expired ids are purged from a heap ordered by expiry whenever a token
+    is revoked.
+
+    When `is_persisted` is set, revocations are also written to the `app_revoked_token` table
+    and loaded back by `load`, so they survive restarts; expired rows are deleted from the table
+    on load and on every revocation. Ids missing locally are looked up in the table, so tokens
+    revoked by other workers sharing the database are rejected too. Ids found not revoked are
+    not looked up again for `check_interval_seconds`, which bounds both the lookups per token
+    and the delay before another worker's revocation takes effect.
+    """
+
+    def __init__(
+        self,
+        is_persisted: bool,
+        max_retention_seconds: float,
+        check_interval_seconds: float = 5,
+        max_checked_tokens: int = 4096,
+    ) -> None:
+        self.is_persisted = is_persisted
+        self.max_retention_seconds = max_retention_seconds
+        self.revoked_tokens: dict[str, float] = {}
+        self.expiry_heap: list[tuple[float, str]] = []
+        self.checked_tokens: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=max_checked_tokens, ttl=check_interval_seconds
+        )
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _to_datetime(timestamp: float) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).replace(
+            tzinfo=None
+        )
+
+    def _delete_expired_rows(self, session: Session) -> None:
+        session.execute(
+            delete(RevokedToken).where(
+                col(RevokedToken.expired_at) <= self._to_datetime(time.time())
+            )
+        )
+
+    def load(self) -> None:
+        if not self.is_persisted:
+            return
+        with PySpringModel.create_managed_session() as session:
+            self._delete_expired_rows(session)
+            # rows revoked before the retention limit existed have no expiry, retain them from now
+            session.execute(
+                update(RevokedToken)
+                .where(col(RevokedToken.expired_at).is_(None))
+                .values(expired_at=self._to_datetime(time.time() + self.max_retention_seconds))
+            )
+            revoked_tokens = session.exec(select(RevokedToken)).all()
+            with self.lock:
+                for revoked_token in revoked_tokens:
+                    if revoked_token.expired_at is None:
+                        continue
+                    self._add(
+                        revoked_token.jti,
+                        revoked_token.expired_at.replace(
+                            tzinfo=datetime.timezone.utc
+                        ).timestamp(),
+                    )
+        logger.info(f"[TOKEN REVOCATION] Loaded {len(revoked_tokens)} revoked tokens")
+
+    def is_revoked(self, jti: str) -> bool:
+        optional_expired_at = self.revoked_tokens.get(jti)
+        if optional_expired_at is not None or not self.is_persisted:
+            return optional_expired_at is not None and optional_expired_at > time.time()
+        with self.lock:
+            if jti in self.checked_tokens:
+                return False
+        optional_expired_at = self._find_persisted_expiry(jti)
+        with self.lock:
+            if optional_expired_at is None or optional_expired_at <= time.time():
+                self.checked_tokens[jti] = True
+                return False
+            self._add(jti, optional_expired_at)
+        return True
+
+    def _find_persisted_expiry(self, jti: str) -> Optional[float]:
+        with PySpringModel.create_managed_session() as session:
+            optional_revoked_token = session.get(RevokedToken, jti)
+            if optional_revoked_token is None:
+                return None
+            if optional_revoked_token.expired_at is None:
+                return time.time() + self.max_retention_seconds
+            return optional_revoked_token.expired_at.replace(
+                tzinfo=datetime.timezone.utc
+            ).timestamp()
+
+    def revoke(self, jti: str, optional_expired_at: Optional[float] = None) -> None:
+        """
+        Revokes a token.
+
+        Args:
+            jti (str): The `jti` claim of the token.
+            optional_expired_at (Optional[float]): The `exp` claim of the token, as a UNIX timestamp.
+        """
+        expired_at = time.time() + self.max_retention_seconds
+        if optional_expired_at is not None:
+            expired_at = min(expired_at, optional_expired_at)
+        with self.lock:
+            self._add(jti, expired_at)
+            self.checked_tokens.pop(jti, None)
+            self._purge_expired()
+        if not self.is_persisted:
+            return
+        with PySpringModel.create_managed_session() as session:
+            session.merge(RevokedToken(jti=jti, expired_at=self._to_datetime(expired_at)))
+            self._delete_expired_rows(session)
+
+    def _add(self, jti: str, expired_at: float) -> None:
+        self.revoked_tokens[jti] = expired_at
+        heapq.heappush(self.expiry_heap, (expired_at, jti))
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        while len(self.expiry_heap) > 0 and self.expiry_heap[0][0] <= now:
+            expired_at, jti = heapq.heappop(self.expiry_heap)
+            if self.revoked_tokens.get(jti) == expired_at:
+                del self.revoked_tokens[jti]
@@ -0,0 +1,113 @@
+import hashlib
+import threading
+import time
+from typing import Optional
+
+import cachetools
+from pydantic import BaseModel, computed_field
+
+from py_spring_admin.core.repository.commons import UserRead
+
+
+class VerifiedTokenCacheMetrics(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @computed_field
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0
+        return self.hits / lookups
+
+
+class VerifiedToken(BaseModel):
+    user_read: UserRead
+    optional_jti: Optional[str] = None
+    expires_at: float
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified JWTs, so a token is decoded and validated once instead of on
+    every request.
+
+    Entries are keyed by the SHA-256 of the token, so raw tokens are never kept in memory, and
+    live until the token's `exp` claim, capped at `max_ttl_seconds`. The `jti` claim is kept with
+    each entry, so callers can check a cache hit against the revoked tokens.
+    """
+
+    def __init__(self, max_size: int, max_ttl_seconds: float) -> None:
+        self.max_ttl_seconds = max_ttl_seconds
+        self.cache: cachetools.TLRUCache = cachetools.TLRUCache(
+            maxsize=max_size,
+            ttu=lambda _, verified_token, __: verified_token.expires_at,
+        )
+        self.cache_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def hash_token(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Optional[VerifiedToken]:
+        token_hash = self.hash_token(token)
+        with self.cache_lock:
+            optional_verified_token = self.cache.get(token_hash)
+            if optional_verified_token is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return optional_verified_token
+
+    def put(
+        self,
+        token: str,
+        user_read: UserRead,
+        optional_expired_at: Optional[float] = None,
+        optional_jti: Optional[str] = None,
+    ) -> None:
+        """
+        Caches a verified token.
+
+        Args:
+            token (str): The verified token.
+            user_read (UserRead): The user the token was issued for.
+            optional_expired_at (Optional[float]): The `exp` claim of the token, as a UNIX timestamp.
+            optional_jti (Optional[str]): The `jti` claim of the token.
+        """
+        ttl_seconds = self.max_ttl_seconds
+        if optional_expired_at is not None:
+            ttl_seconds = min(ttl_seconds, optional_expired_at - time.time())
+        if ttl_seconds <= 0:
+            return
+        verified_token = VerifiedToken(
+            user_read=user_read,
+            optional_jti=optional_jti,
+            expires_at=time.monotonic() + ttl_seconds,
+        )
+        with self.cache_lock:
+            self.cache[self.hash_token(token)] = verified_token
+
+    def evict(self, token: str) -> bool:
+        with self.cache_lock:
+            is_evicted = self.cache.pop(self.hash_token(token), None) is not None
+            if is_evicted:
+                self.evictions += 1
+            return is_evicted
+
+    def get_metrics(self) -> VerifiedTokenCacheMetrics:
+        with self.cache_lock:
+            return VerifiedTokenCacheMetrics(
+                size=len(self.cache),
+                max_size=int(self.cache.maxsize),
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+            )
@@ -0,0 +1,97 @@
+from contextlib import contextmanager
+from typing import Annotated, Iterator, Optional
+
+import pytest
+from py_spring_model import PySpringModel
+from sqlalchemy import Engine, StaticPool, create_engine
+from sqlmodel import Field, Session, SQLModel
+from typing_extensions import ReadOnly
+
+from py_spring_admin.core.repository.commons import StrEnum
+from py_spring_admin.core.service.model_service import ModelService, ModelServiceProperties
+
+
+class AccountStatus(StrEnum):
+    Active = "active"
+    Closed = "closed"
+
+
+class BankAccount(PySpringModel, table=True):
+    __tablename__: str = "bank_account"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_name: str = Field(index=True, unique=True)
+    balance: int
+    status: AccountStatus = Field(default=AccountStatus.Active)
+    note: Optional[str] = None
+    opened_by: Annotated[str, ReadOnly] = Field(default="admin")
+    version: int = Field(default=0)
+
+
+class Membership(PySpringModel, table=True):
+    __tablename__: str = "membership"
+    group_id: int = Field(primary_key=True)
+    user_id: int = Field(primary_key=True)
+    role: str
+
+
+class _StandInUserService:
+    def __init__(self) -> None:
+        self.cache_clears = 0
+
+    def clear_user_cache(self) -> None:
+        self.cache_clears += 1
+
+
+@pytest.fixture
+def engine(monkeypatch) -> Iterator[Engine]:
+    """
+    In-memory SQLite database holding every model table, used by `PySpringModel` sessions.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+
+    @contextmanager
+    def create_managed_session() -> Iterator[Session]:
+        with Session(engine) as session:
+            yield session
+            session.commit()
+
+    monkeypatch.setattr(
+        PySpringModel, "create_managed_session", staticmethod(create_managed_session)
+    )
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def model_service(engine, monkeypatch) -> ModelService:
+    """
+    `ModelService` serving the `bank_account` and `membership` test tables.
+    """
+    test_models = {
+        BankAccount.__tablename__: BankAccount,
+        Membership.__tablename__: Membership,
+    }
+    monkeypatch.setattr(PySpringModel, "get_model_lookup", staticmethod(lambda: test_models))
+    model_service = ModelService()
+    model_service.model_service_properties = ModelServiceProperties()
+    model_service.user_service = _StandInUserService()  # type: ignore
+    model_service.post_construct()
+    return model_service
+
+
+def add_bank_accounts(engine: Engine, count: int) -> None:
+    with Session(engine) as session:
+        for index in range(count):
+            session.add(
+                BankAccount(
+                    id=index + 1,
+                    user_name=f"user_{index:02d}",
+                    balance=index % 5 * 100,
+                    status=AccountStatus.Closed if index % 4 == 0 else AccountStatus.Active,
+                    note=None if index % 3 == 0 else f"note {index}",
+                )
+            )
+        session.commit()
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, SQLModel, select
+
+from py_spring_admin.core.repository.async_database import (
+    AsyncDatabase,
+    AsyncDatabaseProperties,
+)
+from tests.conftest import BankAccount
+
+
+def _create_async_database(properties: AsyncDatabaseProperties) -> AsyncDatabase:
+    async_database = AsyncDatabase()
+    async_database.async_database_properties = properties
+    return async_database
+
+
+def _add_bank_account(session: Session, user_name: str) -> int:
+    session.add(BankAccount(user_name=user_name, balance=1))
+    session.flush()
+    return len(session.exec(select(BankAccount)).all())
+
+
+def _add_bank_account_and_fail(session: Session, user_name: str) -> None:
+    _add_bank_account(session, user_name)
+    raise ValueError("failed")
+
+
+@pytest.fixture
+def database_path(tmp_path) -> str:
+    database_path = str(tmp_path / "admin.db")
+    sync_engine = create_engine(f"sqlite:///{database_path}")
+    SQLModel.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+    return database_path
+
+
+def _find_user_names(database_path: str) -> list[str]:
+    sync_engine = create_engine(f"sqlite:///{database_path}")
+    with Session(sync_engine) as session:
+        user_names = [bank_account.user_name for bank_account in session.exec(select(BankAccount))]
+    sync_engine.dispose()
+    return user_names
+
+
+def test_run_in_session_commits_on_an_async_session(database_path):
+    async_database = _create_async_database(
+        AsyncDatabaseProperties(is_enabled=True, database_url=f"sqlite+aiosqlite:///{database_path}")
+    )
+
+    async def run() -> int:
+        try:
+            return await async_database.run_in_session(_add_bank_account, "async_user")
+        finally:
+            await async_database.dispose()
+
+    assert asyncio.run(run()) == 1
+    assert _find_user_names(database_path) == ["async_user"]
+
+
+def test_run_in_session_rolls_back_on_errors(database_path):
+    async_database = _create_async_database(
+        AsyncDatabaseProperties(is_enabled=True, database_url=f"sqlite+aiosqlite:///{database_path}")
+    )
+
+    async def run() -> None:
+        try:
+            await async_database.run_in_session(_add_bank_account_and_fail, "async_user")
+        finally:
+            await async_database.dispose()
+
+    with pytest.raises(ValueError):
+        asyncio.run(run())
+    assert _find_user_names(database_path) == []
+
+
+def test_disabled_mode_runs_on_the_sync_session(engine):
+    async_database = _create_async_database(AsyncDatabaseProperties(is_enabled=False))
+
+    assert asyncio.run(async_database.run_in_session(_add_bank_account, "sync_user")) == 1
+    with Session(engine) as session:
+        assert [bank_account.user_name for bank_account in session.exec(select(BankAccount))] == [
+            "sync_user"
+        ]
+
+
+def test_pre_destroy_disposes_the_async_pool(database_path, monkeypatch):
+    async_database = _create_async_database(
+        AsyncDatabaseProperties(is_enabled=True, database_url=f"sqlite+aiosqlite:///{database_path}")
+    )
+    asyncio.run(async_database.run_in_session(_add_bank_account, "async_user"))
+    disposed_engines: list[AsyncEngine] = []
+    dispose = AsyncEngine.dispose
+
+    async def recording_dispose(self, close: bool = True) -> None:
+        disposed_engines.append(self)
+        await dispose(self, close)
+
+    monkeypatch.setattr(AsyncEngine, "dispose", recording_dispose)
+    engine = async_database.optional_engine
+
+    async_database.pre_destroy()
+
+    assert disposed_engines == [engine]
+    assert async_database.optional_engine is None
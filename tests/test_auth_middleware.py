@@ -0,0 +1,57 @@
+import pytest
+
+from py_spring_admin.core.controller.middleware.auth_middleware import AuthMiddleware
+
+
+@pytest.fixture
+def auth_middleware() -> AuthMiddleware:
+    auth_middleware = AuthMiddleware()
+    auth_middleware.excluded_routes.extend(["/api/health/", "/api/public"])
+    auth_middleware.optional_excluded_route_pattern = auth_middleware._compile_excluded_routes(
+        auth_middleware.excluded_routes
+    )
+    return auth_middleware
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/docs",
+        "/docs/oauth2-redirect",
+        "/openapi.json",
+        "/spring-admin/public/login",
+        "/api/health",
+        "/api/health/ready",
+        "/api/public/",
+    ],
+)
+def test_excluded_routes_match_on_segment_boundaries(auth_middleware, path):
+    assert auth_middleware.optional_excluded_route_pattern is not None
+    assert auth_middleware.optional_excluded_route_pattern.match(path) is not None
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/docs-internal",
+        "/openapi.jsonx",
+        "/spring-admin/publicity",
+        "/api/healthcheck",
+        "/spring-admin/private/docs",
+        "/v2/api/public",
+    ],
+)
+def test_other_routes_are_not_excluded(auth_middleware, path):
+    assert auth_middleware.optional_excluded_route_pattern is not None
+    assert auth_middleware.optional_excluded_route_pattern.match(path) is None
+
+
+def test_the_most_specific_route_is_matched():
+    pattern = AuthMiddleware()._compile_excluded_routes(["/api", "/api/public"])
+    assert pattern is not None
+    optional_match = pattern.match("/api/public/items")
+    assert optional_match is not None and optional_match.group(0) == "/api/public"
+
+
+def test_no_excluded_routes_compile_to_no_pattern():
+    assert AuthMiddleware()._compile_excluded_routes([]) is None
@@ -0,0 +1,81 @@
+from typing import Optional
+
+import jwt
+
+from py_spring_admin.core.repository.commons import UserRole
+from py_spring_admin.core.service.auth_service import AdminSecurityProperties, AuthService
+
+USER_PAYLOAD = {"id": 1, "role": UserRole.Admin, "user_name": "admin", "is_verified": True}
+
+
+def _create_auth_service() -> AuthService:
+    auth_service = AuthService()
+    auth_service.admin_security_properties = AdminSecurityProperties()
+    auth_service.post_construct()
+    return auth_service
+
+
+def _get_jti(auth_service: AuthService, token: str) -> Optional[str]:
+    return jwt.decode(
+        token, auth_service.admin_security_properties.secret, algorithms=["HS256"]
+    ).get("jti")
+
+
+def test_verified_tokens_are_served_from_the_cache():
+    auth_service = _create_auth_service()
+    token = auth_service.issue_token(USER_PAYLOAD, is_encrypted=False)
+
+    assert auth_service.get_user_from_jwt(token) is not None
+    assert auth_service.get_user_from_jwt(token) is not None
+    assert auth_service.verified_token_cache.get_metrics().hits == 1
+
+
+def test_cache_hits_of_revoked_tokens_are_rejected():
+    auth_service = _create_auth_service()
+    token = auth_service.issue_token(USER_PAYLOAD, is_encrypted=False)
+    assert auth_service.get_user_from_jwt(token) is not None
+
+    # revoked without going through revoke_token, e.g. by another request, while still cached
+    optional_jti = _get_jti(auth_service, token)
+    assert optional_jti is not None
+    auth_service.token_revocation_store.revoke(optional_jti)
+
+    assert auth_service.get_user_from_jwt(token) is None
+    assert auth_service.verified_token_cache.get_metrics().evictions == 1
+    assert auth_service.get_user_from_jwt(token) is None
+
+
+def test_revoke_token_revokes_before_evicting():
+    auth_service = _create_auth_service()
+    token = auth_service.issue_token(USER_PAYLOAD, is_encrypted=False)
+    assert auth_service.get_user_from_jwt(token) is not None
+    optional_jti = _get_jti(auth_service, token)
+    assert optional_jti is not None
+
+    is_revoked_at_eviction: list[bool] = []
+    evict = auth_service.verified_token_cache.evict
+
+    def record_eviction(token: str) -> bool:
+        is_revoked_at_eviction.append(
+            auth_service.token_revocation_store.is_revoked(optional_jti)
+        )
+        return evict(token)
+
+    auth_service.verified_token_cache.evict = record_eviction  # type: ignore
+    auth_service.revoke_token(token)
+
+    assert is_revoked_at_eviction == [True]
+    assert auth_service.get_user_from_jwt(token) is None
+
+
+def test_tokens_without_jti_are_only_evicted():
+    auth_service = _create_auth_service()
+    token = jwt.encode(
+        USER_PAYLOAD, auth_service.admin_security_properties.secret, algorithm="HS256"
+    )
+    assert auth_service.get_user_from_jwt(token) is not None
+
+    auth_service.revoke_token(token)
+
+    assert auth_service.verified_token_cache.get_metrics().evictions == 1
+    assert auth_service.get_user_from_jwt(token) is not None
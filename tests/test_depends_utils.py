@@ -0,0 +1,66 @@
+import asyncio
+import inspect
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, Request
+
+from py_spring_admin.core.controller.depends_utils import (
+    depends_on_role,
+    get_current_user,
+    require_in_roles,
+    require_role,
+)
+from py_spring_admin.core.repository.commons import JWTUser, UserRole
+from py_spring_admin.core.service.errors import PermissionDeniedError, UserEmailNotVerified
+
+
+def _to_request(role: str, is_verified: bool = True) -> Request:
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    request.state.user = JWTUser(id=1, role=role, user_name="user", is_verified=is_verified)
+    return request
+
+
+@require_role(UserRole.Admin)
+def get_rows(request: Request) -> str:
+    return "rows"
+
+
+@require_in_roles([UserRole.Guest, UserRole.Admin])
+async def get_profile(user: Annotated[JWTUser, Depends(get_current_user)]) -> str:
+    return user["user_name"]
+
+
+def test_require_role_allows_the_role():
+    assert get_rows(request=_to_request(UserRole.Admin)) == "rows"
+
+
+def test_require_role_rejects_other_roles():
+    with pytest.raises(PermissionDeniedError):
+        get_rows(request=_to_request(UserRole.Guest))
+
+
+def test_require_role_rejects_unverified_users():
+    with pytest.raises(UserEmailNotVerified):
+        get_rows(request=_to_request(UserRole.Admin, is_verified=False))
+
+
+def test_async_handlers_stay_async_and_read_the_jwt_user():
+    assert inspect.iscoroutinefunction(get_profile)
+    user = _to_request(UserRole.Guest).state.user
+    assert asyncio.run(get_profile(user=user)) == "user"
+
+
+def test_handlers_without_a_user_parameter_are_rejected_when_decorated():
+    with pytest.raises(ValueError):
+
+        @require_role(UserRole.Admin)
+        def get_nothing(page: int) -> None: ...
+
+
+def test_depends_on_role_returns_the_current_user():
+    check_current_user_role = depends_on_role(UserRole.Admin)
+
+    assert asyncio.run(check_current_user_role(_to_request(UserRole.Admin)))["role"] == "admin"
+    with pytest.raises(PermissionDeniedError):
+        asyncio.run(check_current_user_role(_to_request(UserRole.Guest)))
@@ -0,0 +1,114 @@
+import time
+from email.message import EmailMessage
+
+from sqlmodel import Session, select
+
+from py_spring_admin.core.repository.models import EmailOutboxMessage, EmailOutboxStatus
+from py_spring_admin.core.service.email_outbox import EmailOutbox
+
+
+def _create_outbox(max_attempts: int = 3, claim_lease_seconds: float = 60) -> EmailOutbox:
+    return EmailOutbox(
+        max_attempts=max_attempts,
+        base_backoff_seconds=0,
+        max_backoff_seconds=0,
+        claim_lease_seconds=claim_lease_seconds,
+    )
+
+
+def _enqueue(email_outbox: EmailOutbox, count: int) -> None:
+    for index in range(count):
+        email_message = EmailMessage()
+        email_message["To"] = f"user{index}@example.com"
+        email_message["Subject"] = f"Message {index}"
+        email_message.set_content("Hello")
+        email_outbox.enqueue(email_message)
+
+
+def _get_statuses(engine) -> list[str]:
+    with Session(engine) as session:
+        return [
+            outbox_message.status
+            for outbox_message in session.exec(
+                select(EmailOutboxMessage).order_by(EmailOutboxMessage.id)  # type: ignore
+            ).all()
+        ]
+
+
+def test_claims_are_disjoint_and_oldest_first(engine):
+    email_outbox = _create_outbox()
+    _enqueue(email_outbox, 5)
+
+    first_token, first_emails = email_outbox.claim_batch(3)
+    second_token, second_emails = email_outbox.claim_batch(3)
+    _, third_emails = email_outbox.claim_batch(3)
+
+    assert first_token != second_token
+    assert [claimed_email.email_message["To"] for claimed_email in first_emails] == [
+        "user0@example.com",
+        "user1@example.com",
+        "user2@example.com",
+    ]
+    assert [claimed_email.email_message["Subject"] for claimed_email in second_emails] == [
+        "Message 3",
+        "Message 4",
+    ]
+    assert third_emails == []
+
+
+def test_sent_messages_are_not_claimed_again(engine):
+    email_outbox = _create_outbox()
+    _enqueue(email_outbox, 2)
+
+    claim_token, claimed_emails = email_outbox.claim_batch(10)
+    email_outbox.mark_sent(claim_token, claimed_emails)
+
+    assert _get_statuses(engine) == [EmailOutboxStatus.Sent, EmailOutboxStatus.Sent]
+    assert email_outbox.claim_batch(10)[1] == []
+    metrics = email_outbox.get_metrics()
+    assert metrics.sent_messages == 2 and metrics.pending_messages == 0
+
+
+def test_failed_messages_are_retried_until_dead(engine):
+    email_outbox = _create_outbox(max_attempts=2)
+    _enqueue(email_outbox, 1)
+
+    claim_token, claimed_emails = email_outbox.claim_batch(10)
+    email_outbox.mark_failed(claim_token, claimed_emails[0], "connection refused")
+    assert _get_statuses(engine) == [EmailOutboxStatus.Pending]
+
+    claim_token, claimed_emails = email_outbox.claim_batch(10)
+    assert claimed_emails[0].attempts == 1
+    email_outbox.mark_failed(claim_token, claimed_emails[0], "connection refused")
+
+    assert _get_statuses(engine) == [EmailOutboxStatus.Dead]
+    assert email_outbox.claim_batch(10)[1] == []
+    metrics = email_outbox.get_metrics()
+    assert (metrics.failed_attempts, metrics.dead_lettered_messages, metrics.dead_messages) == (2, 1, 1)
+
+
+def test_failed_messages_wait_for_their_backoff(engine):
+    email_outbox = EmailOutbox(
+        max_attempts=3, base_backoff_seconds=60, max_backoff_seconds=60, claim_lease_seconds=60
+    )
+    _enqueue(email_outbox, 1)
+
+    claim_token, claimed_emails = email_outbox.claim_batch(10)
+    email_outbox.mark_failed(claim_token, claimed_emails[0], "connection refused")
+
+    assert email_outbox.claim_batch(10)[1] == []
+
+
+def test_expired_leases_are_reclaimed_and_the_stale_claim_is_ignored(engine):
+    email_outbox = _create_outbox(claim_lease_seconds=0)
+    _enqueue(email_outbox, 1)
+
+    stale_token, stale_emails = email_outbox.claim_batch(10)
+    time.sleep(0.01)
+    claim_token, claimed_emails = email_outbox.claim_batch(10)
+    assert [claimed_email.id for claimed_email in claimed_emails] == [stale_emails[0].id]
+
+    email_outbox.mark_failed(stale_token, stale_emails[0], "timed out")
+    assert _get_statuses(engine) == [EmailOutboxStatus.Sending]
+    email_outbox.mark_sent(claim_token, claimed_emails)
+    assert _get_statuses(engine) == [EmailOutboxStatus.Sent]
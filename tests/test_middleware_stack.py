@@ -0,0 +1,95 @@
+from typing import Optional
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from py_spring_admin.core.controller.middleware.auth_middleware import AuthMiddleware
+from py_spring_admin.core.controller.middleware.exception_middleware import (
+    ExceptionMiddleware,
+)
+from py_spring_admin.core.controller.middleware.middleware_base import BoundMiddleware
+from py_spring_admin.core.repository.commons import UserRead, UserRole
+from py_spring_admin.core.service.errors import TooManyRequests
+
+TOKEN = "valid-token"
+
+
+class _StandInAuthService:
+    def get_user_from_jwt(self, token: str) -> Optional[UserRead]:
+        if token != TOKEN:
+            return None
+        return UserRead(id=1, role=UserRole.Admin, user_name="admin", is_verified=True)
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+
+    @app.get("/api/user")
+    def get_user(request: Request) -> dict:
+        return request.state.user
+
+    @app.get("/docs/ping")
+    def ping() -> str:
+        return "pong"
+
+    @app.get("/api/throttled")
+    def throttled() -> None:
+        raise TooManyRequests(retry_after="30")
+
+    @app.get("/api/broken")
+    def broken() -> None:
+        raise ValueError("broken")
+
+    @app.get("/api/broken-stream")
+    def broken_stream() -> StreamingResponse:
+        def chunks():
+            yield "first"
+            raise ValueError("broken")
+
+        return StreamingResponse(chunks())
+
+    auth_middleware = AuthMiddleware()
+    auth_middleware.auth_service = _StandInAuthService()  # type: ignore
+    auth_middleware.optional_excluded_route_pattern = (
+        auth_middleware._compile_excluded_routes(auth_middleware.excluded_routes)
+    )
+    app.add_middleware(BoundMiddleware, middleware=auth_middleware)
+    app.add_middleware(BoundMiddleware, middleware=ExceptionMiddleware())
+    with TestClient(app) as client:
+        yield client
+
+
+def test_requests_without_a_valid_token_are_rejected(client):
+    assert client.get("/api/user").status_code == 401
+    assert client.get("/api/user", cookies={"jwt": "invalid"}).status_code == 401
+
+
+def test_excluded_routes_skip_authentication(client):
+    assert client.get("/docs/ping").json() == "pong"
+
+
+def test_authenticated_user_is_visible_to_the_route(client):
+    response = client.get("/api/user", cookies={"jwt": TOKEN})
+    assert response.status_code == 200
+    assert response.json()["user_name"] == "admin"
+
+
+def test_handled_errors_keep_their_status_and_headers(client):
+    response = client.get("/api/throttled", cookies={"jwt": TOKEN})
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "30"
+    assert response.json()["message"] == "Too many attempts, please retry later"
+
+
+def test_unhandled_errors_become_forbidden(client):
+    response = client.get("/api/broken", cookies={"jwt": TOKEN})
+    assert response.status_code == 403
+    assert response.json()["message"] == "broken"
+
+
+def test_errors_after_the_response_started_are_raised(client):
+    with pytest.raises(ValueError, match="broken"):
+        client.get("/api/broken-stream", cookies={"jwt": TOKEN})
@@ -0,0 +1,127 @@
+import asyncio
+import csv
+import io
+import json
+from contextlib import contextmanager
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from py_spring_model import PySpringModel
+
+from py_spring_admin.core.controller.model_export_controller import ModelExportController
+from py_spring_admin.core.service.errors import InvalidQueryError
+from py_spring_admin.core.service.model_query import TableQuery
+from py_spring_admin.core.service.model_service import ExportFormat, ModelServiceProperties
+from tests.conftest import add_bank_accounts
+
+
+@pytest.fixture
+def client(model_service):
+    model_export_controller = ModelExportController()
+    model_export_controller.model_service = model_service
+    model_export_controller.router = APIRouter(prefix=ModelExportController.Config.prefix)
+    model_export_controller.register_routes()
+    app = FastAPI()
+    app.include_router(model_export_controller.router)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture
+def session_events(monkeypatch) -> list[str]:
+    """
+    Records when `PySpringModel` sessions are opened and released.
+    """
+    session_events: list[str] = []
+    create_managed_session = PySpringModel.create_managed_session
+
+    @contextmanager
+    def recording_managed_session():
+        session_events.append("open")
+        try:
+            with create_managed_session() as session:
+                yield session
+        finally:
+            session_events.append("release")
+
+    monkeypatch.setattr(
+        PySpringModel, "create_managed_session", staticmethod(recording_managed_session)
+    )
+    return session_events
+
+
+def _find_all_rows(model_service) -> list[dict]:
+    return model_service.find_all_models_in_table("bank_account", TableQuery(page_size=100)).rows
+
+
+def test_ndjson_export_streams_every_row(model_service, engine, client):
+    add_bank_accounts(engine, 12)
+
+    response = client.get("/spring-admin/private/models/bank_account/export")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="bank_account.ndjson"' in response.headers["content-disposition"]
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == _find_all_rows(model_service)
+
+
+def test_csv_export_has_a_header_and_empty_nulls(model_service, engine, client):
+    add_bank_accounts(engine, 12)
+
+    response = client.get("/spring-admin/private/models/bank_account/export?format=csv")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    records = list(csv.DictReader(io.StringIO(response.text)))
+    expected_rows = _find_all_rows(model_service)
+    assert list(records[0]) == list(expected_rows[0])
+    assert [record["id"] for record in records] == [str(row["id"]) for row in expected_rows]
+    assert records[0]["note"] == ""
+    assert records[1]["note"] == "note 1"
+
+
+def test_chunks_hold_export_batch_size_rows(model_service, engine):
+    add_bank_accounts(engine, 7)
+    model_service.model_service_properties = ModelServiceProperties(export_batch_size=3)
+
+    ndjson_chunks = list(model_service.export_table("bank_account", ExportFormat.NDJSON))
+    assert [len(chunk.splitlines()) for chunk in ndjson_chunks] == [3, 3, 1]
+
+    csv_chunks = list(model_service.export_table("bank_account", ExportFormat.CSV))
+    # the header is written with the first batch
+    assert [len(chunk.splitlines()) for chunk in csv_chunks] == [4, 3, 1]
+
+
+def test_unknown_tables_fail_before_the_first_chunk(model_service):
+    with pytest.raises(InvalidQueryError):
+        model_service.export_table("unknown_table", ExportFormat.NDJSON)
+
+
+def test_closing_the_export_partway_releases_the_session(model_service, engine, session_events):
+    add_bank_accounts(engine, 10)
+    model_service.model_service_properties = ModelServiceProperties(export_batch_size=2)
+
+    chunks = model_service.export_table("bank_account", ExportFormat.NDJSON)
+    next(chunks)
+    assert session_events == ["open"]
+    chunks.close()
+    assert session_events == ["open", "release"]
+
+
+def test_disconnected_responses_close_the_export(model_service, engine, session_events):
+    add_bank_accounts(engine, 10)
+    model_service.model_service_properties = ModelServiceProperties(export_batch_size=2)
+    model_export_controller = ModelExportController()
+
+    async def read_one_chunk() -> None:
+        response_chunks = model_export_controller._iterate_chunks(
+            model_service.export_table("bank_account", ExportFormat.NDJSON)
+        )
+        await response_chunks.__anext__()
+        # what the response does when the client goes away mid-stream
+        await response_chunks.aclose()
+
+    asyncio.run(read_one_chunk())
+    assert session_events == ["open", "release"]
@@ -0,0 +1,105 @@
+from typing import Any
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, insert, select
+
+from py_spring_admin.core.service.errors import InvalidQueryError
+from py_spring_admin.core.service.model_query import (
+    SortColumn,
+    SortDirection,
+    build_keyset_clause,
+    decode_cursor,
+    encode_cursor,
+    is_sort_index_backed,
+    parse_order_by,
+)
+
+metadata = MetaData()
+item_table = Table(
+    "item",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("category", String, nullable=False),
+    Column("score", Integer, nullable=False),
+)
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with engine.connect() as connection:
+        connection.execute(
+            insert(item_table),
+            [
+                {"id": _id, "category": f"category_{_id % 3}", "score": _id % 4}
+                for _id in range(1, 51)
+            ],
+        )
+        yield connection
+    engine.dispose()
+
+
+def _order_by(columns: list[Column], directions: list[SortDirection]) -> list[Any]:
+    return [
+        column.asc() if direction == SortDirection.Asc else column.desc()
+        for column, direction in zip(columns, directions)
+    ]
+
+
+@pytest.mark.parametrize(
+    "directions",
+    [
+        [SortDirection.Asc, SortDirection.Asc, SortDirection.Asc],
+        [SortDirection.Desc, SortDirection.Desc, SortDirection.Desc],
+        [SortDirection.Asc, SortDirection.Desc, SortDirection.Asc],
+    ],
+)
+def test_keyset_pages_cover_every_row_once_in_order(connection, directions):
+    columns = [item_table.c.category, item_table.c.score, item_table.c.id]
+    order_by = _order_by(columns, directions)
+    expected_rows = connection.execute(select(item_table).order_by(*order_by)).all()
+
+    page_size = 7
+    optional_cursor = None
+    paged_rows = []
+    while True:
+        statement = select(item_table).order_by(*order_by).limit(page_size)
+        if optional_cursor is not None:
+            values = decode_cursor(optional_cursor, len(columns))
+            statement = statement.where(build_keyset_clause(columns, values, directions))
+        page = connection.execute(statement).all()
+        paged_rows.extend(page)
+        if len(page) < page_size:
+            break
+        last_row = page[-1]._mapping
+        optional_cursor = encode_cursor([last_row[column.name] for column in columns])
+
+    assert paged_rows == expected_rows
+
+
+def test_cursor_round_trips():
+    cursor = encode_cursor(["category_1", 3, 42])
+    assert "=" not in cursor
+    assert decode_cursor(cursor, 3) == ["category_1", 3, 42]
+
+
+@pytest.mark.parametrize("cursor", ["not a cursor!", encode_cursor([1, 2])])
+def test_decode_cursor_rejects_malformed_or_mismatched_cursors(cursor):
+    with pytest.raises(InvalidQueryError):
+        decode_cursor(cursor, 3)
+
+
+def test_parse_order_by():
+    assert parse_order_by(["-created_at", "user_name"]) == [
+        SortColumn(column="created_at", direction=SortDirection.Desc),
+        SortColumn(column="user_name", direction=SortDirection.Asc),
+    ]
+
+
+def test_is_sort_index_backed():
+    index_column_names = [("id",), ("category", "score")]
+    assert is_sort_index_backed(parse_order_by(["category"]), index_column_names)
+    assert is_sort_index_backed(parse_order_by(["-category", "-score"]), index_column_names)
+    assert not is_sort_index_backed(parse_order_by(["category", "-score"]), index_column_names)
+    assert not is_sort_index_backed(parse_order_by(["score"]), index_column_names)
@@ -0,0 +1,293 @@
+import pytest
+from sqlmodel import Session
+
+from py_spring_admin.core.service.errors import InvalidQueryError
+from py_spring_admin.core.service.model_query import (
+    ColumnFilter,
+    FilterOperator,
+    PaginationMode,
+    RowCountMode,
+    SortColumn,
+    SortDirection,
+    TableQuery,
+    encode_cursor,
+    parse_order_by,
+)
+from py_spring_admin.core.service.model_service import ModelServiceProperties
+from tests.conftest import Membership, add_bank_accounts
+
+
+def _find_ids(model_service, query: TableQuery) -> list[int]:
+    table_view = model_service.find_all_models_in_table("bank_account", query)
+    return [row["id"] for row in table_view.rows]
+
+
+def test_offset_pages_walk_the_table_in_primary_key_order(model_service, engine):
+    add_bank_accounts(engine, 25)
+
+    first_page = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(page=1, page_size=10)
+    )
+    assert [row["id"] for row in first_page.rows] == list(range(1, 11))
+    assert first_page.pagination.mode == PaginationMode.Offset
+    assert first_page.pagination.page == 1
+    assert first_page.pagination.has_next_page
+    assert first_page.pagination.next_cursor is None
+
+    last_page = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(page=3, page_size=10)
+    )
+    assert [row["id"] for row in last_page.rows] == list(range(21, 26))
+    assert not last_page.pagination.has_next_page
+
+
+def test_a_full_last_page_has_no_next_page(model_service, engine):
+    add_bank_accounts(engine, 20)
+
+    table_view = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(page=2, page_size=10)
+    )
+    assert len(table_view.rows) == 10
+    assert not table_view.pagination.has_next_page
+
+
+def test_page_size_defaults_and_is_capped(model_service, engine):
+    add_bank_accounts(engine, 30)
+    model_service.model_service_properties = ModelServiceProperties(
+        default_page_size=5, max_page_size=12
+    )
+
+    default_page = model_service.find_all_models_in_table("bank_account")
+    assert default_page.pagination.page_size == 5 and len(default_page.rows) == 5
+
+    capped_page = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(page_size=1000)
+    )
+    assert capped_page.pagination.page_size == 12 and len(capped_page.rows) == 12
+
+
+def test_total_rows_are_counted_only_when_asked(model_service, engine):
+    add_bank_accounts(engine, 7)
+
+    table_view = model_service.find_all_models_in_table("bank_account", TableQuery(page_size=5))
+    assert table_view.pagination.total_rows is None
+
+    table_view = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(page_size=5, count_mode=RowCountMode.Exact)
+    )
+    assert table_view.pagination.total_rows == 7
+    assert not table_view.pagination.is_total_estimated
+
+
+def test_pages_past_the_end_are_empty(model_service, engine):
+    add_bank_accounts(engine, 3)
+
+    assert _find_ids(model_service, TableQuery(page=5, page_size=10)) == []
+
+
+def _walk_cursor_pages(model_service, table_name: str, query: TableQuery) -> list[dict]:
+    rows: list[dict] = []
+    while True:
+        table_view = model_service.find_all_models_in_table(table_name, query)
+        assert table_view.pagination.mode == PaginationMode.Cursor
+        rows.extend(table_view.rows)
+        if not table_view.pagination.has_next_page:
+            assert table_view.pagination.next_cursor is None
+            return rows
+        assert len(table_view.rows) == query.page_size
+        query = query.model_copy(update={"cursor": table_view.pagination.next_cursor})
+
+
+@pytest.mark.parametrize(
+    "order_by, sort_key",
+    [
+        ([], lambda row: row["id"]),
+        ([SortColumn(column="id", direction=SortDirection.Desc)], lambda row: -row["id"]),
+        (
+            [
+                SortColumn(column="balance", direction=SortDirection.Desc),
+                SortColumn(column="userName", direction=SortDirection.Asc),
+            ],
+            lambda row: (-row["balance"], row["user_name"]),
+        ),
+        (
+            [SortColumn(column="status", direction=SortDirection.Asc)],
+            lambda row: (row["status"], row["id"]),
+        ),
+    ],
+)
+def test_cursor_pages_cover_every_row_once_in_sort_order(
+    model_service, engine, order_by, sort_key
+):
+    add_bank_accounts(engine, 23)
+    query = TableQuery(
+        pagination_mode=PaginationMode.Cursor, page_size=4, order_by=order_by
+    )
+
+    rows = _walk_cursor_pages(model_service, "bank_account", query)
+
+    all_rows = model_service.find_all_models_in_table("bank_account", TableQuery(page_size=100)).rows
+    assert [row["id"] for row in rows] == [row["id"] for row in sorted(all_rows, key=sort_key)]
+
+
+def test_cursor_pages_over_a_composite_primary_key(model_service, engine):
+    with Session(engine) as session:
+        for group_id in [2, 1]:
+            for user_id in [3, 1, 2]:
+                session.add(Membership(group_id=group_id, user_id=user_id, role="member"))
+        session.commit()
+
+    rows = _walk_cursor_pages(
+        model_service, "membership", TableQuery(pagination_mode=PaginationMode.Cursor, page_size=4)
+    )
+    assert [(row["group_id"], row["user_id"]) for row in rows] == [
+        (group_id, user_id) for group_id in [1, 2] for user_id in [1, 2, 3]
+    ]
+
+
+def test_a_cursor_implies_cursor_mode(model_service, engine):
+    add_bank_accounts(engine, 10)
+    first_page = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(pagination_mode=PaginationMode.Cursor, page_size=3)
+    )
+
+    table_view = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(page_size=3, cursor=first_page.pagination.next_cursor)
+    )
+    assert table_view.pagination.mode == PaginationMode.Cursor
+    assert table_view.pagination.page is None
+    assert [row["id"] for row in table_view.rows] == [4, 5, 6]
+
+
+def test_cursor_mode_rejects_nullable_sort_columns(model_service, engine):
+    query = TableQuery(
+        pagination_mode=PaginationMode.Cursor, order_by=[SortColumn(column="note")]
+    )
+    with pytest.raises(InvalidQueryError):
+        model_service.find_all_models_in_table("bank_account", query)
+
+
+@pytest.mark.parametrize("cursor", ["not base64!", encode_cursor([1, 2]), encode_cursor(["x"])])
+def test_malformed_cursors_are_rejected(model_service, engine, cursor):
+    with pytest.raises(InvalidQueryError):
+        model_service.find_all_models_in_table("bank_account", TableQuery(cursor=cursor))
+
+
+@pytest.mark.parametrize(
+    "column_filter, is_expected",
+    [
+        (
+            ColumnFilter(column="balance", operator=FilterOperator.Eq, value=200),
+            lambda row: row["balance"] == 200,
+        ),
+        (
+            ColumnFilter(column="status", operator=FilterOperator.Eq, value="closed"),
+            lambda row: row["status"] == "closed",
+        ),
+        (
+            ColumnFilter(column="id", operator=FilterOperator.In, value=[2, 3, 30]),
+            lambda row: row["id"] in [2, 3],
+        ),
+        (ColumnFilter(column="id", operator=FilterOperator.In, value=[]), lambda row: False),
+        (
+            ColumnFilter(column="balance", operator=FilterOperator.Range, value=[100, 300]),
+            lambda row: 100 <= row["balance"] <= 300,
+        ),
+        (
+            ColumnFilter(column="balance", operator=FilterOperator.Range, value=[None, 100]),
+            lambda row: row["balance"] <= 100,
+        ),
+        (
+            ColumnFilter(column="userName", operator=FilterOperator.Prefix, value="user_1"),
+            lambda row: row["user_name"].startswith("user_1"),
+        ),
+        (
+            ColumnFilter(column="note", operator=FilterOperator.IsNull),
+            lambda row: row["note"] is None,
+        ),
+        (
+            ColumnFilter(column="note", operator=FilterOperator.IsNull, value=False),
+            lambda row: row["note"] is not None,
+        ),
+    ],
+)
+def test_filters_select_the_matching_rows(model_service, engine, column_filter, is_expected):
+    add_bank_accounts(engine, 20)
+    all_rows = model_service.find_all_models_in_table("bank_account", TableQuery(page_size=100)).rows
+
+    ids = _find_ids(model_service, TableQuery(page_size=100, filters=[column_filter]))
+
+    assert ids == [row["id"] for row in all_rows if is_expected(row)]
+
+
+def test_prefix_filters_escape_like_wildcards(model_service, engine):
+    add_bank_accounts(engine, 20)
+
+    prefix_filter = ColumnFilter(column="user_name", operator=FilterOperator.Prefix, value="user%")
+    assert _find_ids(model_service, TableQuery(filters=[prefix_filter])) == []
+
+
+@pytest.mark.parametrize(
+    "column_filter",
+    [
+        ColumnFilter(column="balance", operator=FilterOperator.Prefix, value="1"),
+        ColumnFilter(column="note", operator=FilterOperator.Eq, value=None),
+        ColumnFilter(column="balance", operator=FilterOperator.Eq, value="not a number"),
+        ColumnFilter(column="balance", operator=FilterOperator.Range, value=[None, None]),
+        ColumnFilter(column="unknown", operator=FilterOperator.Eq, value=1),
+    ],
+)
+def test_invalid_filters_are_rejected(model_service, engine, column_filter):
+    with pytest.raises(InvalidQueryError):
+        model_service.find_all_models_in_table("bank_account", TableQuery(filters=[column_filter]))
+
+
+def test_projections_keep_the_primary_key(model_service, engine):
+    add_bank_accounts(engine, 3)
+
+    table_view = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(columns=["userName"])
+    )
+
+    assert table_view.rows[0] == {"id": 1, "user_name": "user_00"}
+    assert [column.private_field for column in table_view.columns] == ["id", "user_name"]
+
+
+@pytest.mark.parametrize(
+    "order_by, is_index_backed",
+    [
+        ([], True),
+        (["-id"], True),
+        (["userName"], True),
+        (["-user_name"], True),
+        (["balance"], False),
+        (["user_name", "balance"], False),
+    ],
+)
+def test_sorts_report_whether_an_index_backs_them(model_service, engine, order_by, is_index_backed):
+    query = TableQuery(order_by=parse_order_by(order_by))
+    table_view = model_service.find_all_models_in_table("bank_account", query)
+
+    assert table_view.sort.is_index_backed == is_index_backed
+
+
+def test_sorts_end_with_the_primary_key(model_service, engine):
+    add_bank_accounts(engine, 10)
+
+    table_view = model_service.find_all_models_in_table(
+        "bank_account", TableQuery(order_by=parse_order_by(["-balance"]))
+    )
+
+    assert table_view.sort.order_by == parse_order_by(["-balance", "id"])
+    rows = table_view.rows
+    assert [row["id"] for row in rows] == [
+        row["id"] for row in sorted(rows, key=lambda row: (-row["balance"], row["id"]))
+    ]
+
+
+@pytest.mark.parametrize("order_by", [["unknown"], ["balance", "-balance"]])
+def test_invalid_sorts_are_rejected(model_service, engine, order_by):
+    with pytest.raises(InvalidQueryError):
+        model_service.find_all_models_in_table(
+            "bank_account", TableQuery(order_by=parse_order_by(order_by))
+        )
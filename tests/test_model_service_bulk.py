@@ -0,0 +1,234 @@
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from py_spring_admin.core.service.errors import InvalidQueryError
+from py_spring_admin.core.service.model_query import ColumnFilter, FilterOperator
+from py_spring_admin.core.service.model_service import (
+    BulkMode,
+    BulkSelectionRequest,
+    BulkUpdateRequest,
+    InputField,
+    ModelServiceProperties,
+)
+from tests.conftest import BankAccount, Membership, add_bank_accounts
+
+
+def _to_row(user_name: str, balance: object = 100) -> list[InputField]:
+    return [InputField(key="userName", value=user_name), InputField(key="balance", value=balance)]
+
+
+def _find_user_names(engine) -> list[str]:
+    with Session(engine) as session:
+        return [
+            bank_account.user_name
+            for bank_account in session.exec(select(BankAccount).order_by(BankAccount.id))  # type: ignore
+        ]
+
+
+@pytest.fixture
+def insert_statements(engine) -> list[int]:
+    """
+    Records the number of parameter sets of every INSERT sent to the database.
+    """
+    insert_statements: list[int] = []
+
+    def record_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            insert_statements.append(len(parameters) if executemany else 1)
+
+    event.listen(engine, "before_cursor_execute", record_insert)
+    yield insert_statements
+    event.remove(engine, "before_cursor_execute", record_insert)
+
+
+def test_rows_are_inserted_in_chunks(model_service, engine, insert_statements):
+    model_service.model_service_properties = ModelServiceProperties(bulk_chunk_size=2)
+    rows = [_to_row(f"bulk_{index}") for index in range(5)]
+
+    response = model_service.bulk_add_models_into_table("bank_account", rows)
+
+    assert response.is_success and response.affected_rows == 5
+    assert response.errors == []
+    assert insert_statements == [2, 2, 1]
+    assert _find_user_names(engine) == [f"bulk_{index}" for index in range(5)]
+
+
+def test_an_invalid_row_inserts_nothing_in_all_or_nothing_mode(model_service, engine):
+    rows = [_to_row("bulk_0"), _to_row("bulk_1", balance="not a number"), _to_row("bulk_2")]
+
+    response = model_service.bulk_add_models_into_table("bank_account", rows)
+
+    assert not response.is_success and response.affected_rows == 0
+    assert [row_error.row_index for row_error in response.errors] == [1]
+    assert _find_user_names(engine) == []
+
+
+def test_a_database_error_inserts_nothing_in_all_or_nothing_mode(model_service, engine):
+    add_bank_accounts(engine, 1)
+    model_service.model_service_properties = ModelServiceProperties(bulk_chunk_size=2)
+    rows = [_to_row("bulk_0"), _to_row("bulk_1"), _to_row("user_00")]
+
+    response = model_service.bulk_add_models_into_table("bank_account", rows)
+
+    assert not response.is_success and response.affected_rows == 0
+    assert _find_user_names(engine) == ["user_00"]
+
+
+def test_best_effort_skips_only_the_failing_rows(model_service, engine):
+    add_bank_accounts(engine, 1)
+    model_service.model_service_properties = ModelServiceProperties(bulk_chunk_size=2)
+    rows = [
+        _to_row("bulk_0"),
+        _to_row("bulk_1", balance="not a number"),
+        _to_row("bulk_2"),
+        _to_row("user_00"),
+        _to_row("bulk_4"),
+    ]
+
+    response = model_service.bulk_add_models_into_table("bank_account", rows, BulkMode.BestEffort)
+
+    assert not response.is_success and response.affected_rows == 3
+    assert [row_error.row_index for row_error in response.errors] == [1, 3]
+    assert "UNIQUE" in response.errors[1].message
+    assert _find_user_names(engine) == ["user_00", "bulk_0", "bulk_2", "bulk_4"]
+
+
+@pytest.fixture
+def statements(engine) -> list[str]:
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def _add_memberships(engine) -> None:
+    with Session(engine) as session:
+        for group_id in [1, 2]:
+            for user_id in [1, 2, 3]:
+                session.add(Membership(group_id=group_id, user_id=user_id, role="member"))
+        session.commit()
+
+
+def _find_memberships(engine) -> list[tuple[int, int, str]]:
+    with Session(engine) as session:
+        return [
+            (membership.group_id, membership.user_id, membership.role)
+            for membership in session.exec(
+                select(Membership).order_by(Membership.group_id, Membership.user_id)  # type: ignore
+            )
+        ]
+
+
+def test_composite_keys_are_deleted_in_chunks(model_service, engine, statements):
+    _add_memberships(engine)
+    model_service.model_service_properties = ModelServiceProperties(bulk_chunk_size=2)
+    selection = BulkSelectionRequest(
+        primary_keys=[
+            {"group_id": 1, "user_id": 1},
+            {"group_id": 2, "user_id": 3},
+            {"group_id": 2, "user_id": 1},
+            {"group_id": 9, "user_id": 9},
+        ]
+    )
+
+    response = model_service.bulk_delete_models_from_table("membership", selection)
+
+    assert response.is_success and response.affected_rows == 3
+    assert len([statement for statement in statements if statement.startswith("DELETE")]) == 2
+    assert [(group_id, user_id) for group_id, user_id, _ in _find_memberships(engine)] == [
+        (1, 2),
+        (1, 3),
+        (2, 2),
+    ]
+
+
+def test_rows_are_deleted_by_filters(model_service, engine):
+    add_bank_accounts(engine, 10)
+    selection = BulkSelectionRequest(
+        filters=[ColumnFilter(column="status", operator=FilterOperator.Eq, value="closed")]
+    )
+
+    response = model_service.bulk_delete_models_from_table("bank_account", selection)
+
+    assert response.is_success and response.affected_rows == 3
+    assert _find_user_names(engine) == [
+        f"user_{index:02d}" for index in range(10) if index % 4 != 0
+    ]
+
+
+@pytest.mark.parametrize(
+    "selection",
+    [
+        BulkSelectionRequest(),
+        BulkSelectionRequest(primary_keys=[]),
+        BulkSelectionRequest(filters=[]),
+        BulkSelectionRequest(
+            primary_keys=[{"id": 1}],
+            filters=[ColumnFilter(column="id", operator=FilterOperator.Eq, value=1)],
+        ),
+        BulkSelectionRequest(primary_keys=[{"id": 1, "user_name": "user_00"}]),
+    ],
+)
+def test_empty_or_ambiguous_selections_never_touch_the_table(model_service, engine, selection):
+    add_bank_accounts(engine, 3)
+
+    with pytest.raises(InvalidQueryError):
+        model_service.bulk_delete_models_from_table("bank_account", selection)
+    with pytest.raises(InvalidQueryError):
+        model_service.bulk_update_models_in_table(
+            "bank_account", BulkUpdateRequest(**selection.model_dump(), values={"balance": 0})
+        )
+    assert len(_find_user_names(engine)) == 3
+
+
+def test_selected_rows_are_updated(model_service, engine):
+    _add_memberships(engine)
+    model_service.model_service_properties = ModelServiceProperties(bulk_chunk_size=1)
+    update_request = BulkUpdateRequest(
+        primary_keys=[{"group_id": 1, "user_id": 2}, {"group_id": 2, "user_id": 2}],
+        values={"role": "owner"},
+    )
+
+    response = model_service.bulk_update_models_in_table("membership", update_request)
+
+    assert response.is_success and response.affected_rows == 2
+    assert [row for row in _find_memberships(engine) if row[2] == "owner"] == [
+        (1, 2, "owner"),
+        (2, 2, "owner"),
+    ]
+
+
+def test_filtered_updates_report_the_updated_rows(model_service, engine):
+    add_bank_accounts(engine, 10)
+    update_request = BulkUpdateRequest(
+        filters=[ColumnFilter(column="balance", operator=FilterOperator.Range, value=[300, None])],
+        values={"note": "reviewed"},
+    )
+
+    response = model_service.bulk_update_models_in_table("bank_account", update_request)
+
+    assert response.is_success and response.affected_rows == 4
+    with Session(engine) as session:
+        reviewed_balances = session.exec(
+            select(BankAccount.balance).where(BankAccount.note == "reviewed")
+        ).all()
+    assert sorted(reviewed_balances) == [300, 300, 400, 400]
+
+
+@pytest.mark.parametrize(
+    "values", [{}, {"id": 5}, {"openedBy": "someone"}, {"version": 3}, {"unknown": 1}]
+)
+def test_updates_of_readonly_primary_key_or_unknown_columns_are_rejected(
+    model_service, engine, values
+):
+    add_bank_accounts(engine, 3)
+
+    with pytest.raises(InvalidQueryError):
+        model_service.bulk_update_models_in_table(
+            "bank_account", BulkUpdateRequest(primary_keys=[{"id": 1}], values=values)
+        )
@@ -0,0 +1,85 @@
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+from tests.conftest import BankAccount, add_bank_accounts
+
+
+@pytest.fixture(params=[True, False], ids=["returning", "update_then_select"])
+def statements(request, engine, monkeypatch) -> list[str]:
+    """
+    Runs the test with and without UPDATE ... RETURNING support, recording every statement.
+    """
+    monkeypatch.setattr(engine.dialect, "update_returning", request.param)
+    statements: list[str] = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.split()[0])
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def _get_bank_account(engine, _id: int) -> BankAccount:
+    with Session(engine) as session:
+        optional_bank_account = session.get(BankAccount, _id)
+        assert optional_bank_account is not None
+        return optional_bank_account
+
+
+def test_updates_return_the_row_and_bump_the_version(model_service, engine, statements):
+    add_bank_accounts(engine, 3)
+    statements.clear()
+
+    response = model_service.update_model_in_table(
+        "bank_account", {"id": 2}, {"balance": 999, "openedBy": "someone", "id": 7}
+    )
+
+    assert response.is_success and response.affected_rows == 1
+    assert response.row is not None
+    assert (response.row["id"], response.row["balance"], response.row["version"]) == (2, 999, 1)
+    assert response.row["opened_by"] == "admin"
+    if engine.dialect.update_returning:
+        assert statements == ["UPDATE"]
+    else:
+        assert statements == ["UPDATE", "SELECT"]
+    bank_account = _get_bank_account(engine, 2)
+    assert (bank_account.balance, bank_account.version) == (999, 1)
+
+
+def test_expected_version_rejects_stale_updates(model_service, engine, statements):
+    add_bank_accounts(engine, 1)
+    assert model_service.update_model_in_table(
+        "bank_account", {"id": 1}, {"balance": 1}, expected_version=0
+    ).is_success
+
+    response = model_service.update_model_in_table(
+        "bank_account", {"id": 1}, {"balance": 2}, expected_version=0
+    )
+
+    assert not response.is_success and response.affected_rows == 0
+    assert response.message == "Model was modified by another request, please reload it"
+    bank_account = _get_bank_account(engine, 1)
+    assert (bank_account.balance, bank_account.version) == (1, 1)
+
+
+def test_missing_rows_are_not_found_rather_than_conflicting(model_service, engine, statements):
+    add_bank_accounts(engine, 1)
+
+    for expected_version in [None, 0]:
+        response = model_service.update_model_in_table(
+            "bank_account", {"id": 42}, {"balance": 2}, expected_version=expected_version
+        )
+        assert not response.is_success
+        assert response.message == "Model not found"
+
+
+def test_upserts_insert_missing_rows_with_the_given_key(model_service, engine, statements):
+    response = model_service.update_model_in_table(
+        "bank_account", {"id": 42}, {"userName": "new_user", "balance": 5}, is_upsert=True
+    )
+
+    assert response.is_success and response.affected_rows == 1
+    bank_account = _get_bank_account(engine, 42)
+    assert (bank_account.user_name, bank_account.balance) == ("new_user", 5)
@@ -0,0 +1,160 @@
+import datetime
+import hashlib
+
+import fakeredis
+import pytest
+
+from py_spring_admin.core.service.otp_service import InvalidOtpError, OtpProperties, OtpService
+from py_spring_admin.core.service.otp_storage import (
+    InMemoryOtpStorage,
+    OneTimePassword,
+    OtpPurpose,
+    OtpStorage,
+    OtpStorageType,
+)
+from py_spring_admin.core.service.redis_otp_storage import RedisOtpStorage
+from py_spring_admin.core.service.security_properties import AdminSecurityProperties
+from py_spring_admin.core.service.sql_otp_storage import SqlOtpStorage
+
+SECRET = "test-secret"
+
+
+@pytest.fixture(params=list(OtpStorageType))
+def otp_storage(request) -> OtpStorage:
+    match request.param:
+        case OtpStorageType.Memory:
+            return InMemoryOtpStorage(max_entries=10)
+        case OtpStorageType.Sql:
+            request.getfixturevalue("engine")
+            return SqlOtpStorage()
+        case OtpStorageType.Redis:
+            return RedisOtpStorage(fakeredis.FakeRedis(), key_prefix="test:otp")
+    raise ValueError(request.param)
+
+
+def _create_otp_service(otp_storage: OtpStorage, secret: str = SECRET) -> OtpService:
+    otp_service = OtpService()
+    otp_service.otp_properties = OtpProperties()
+    otp_service.admin_security_properties = AdminSecurityProperties(secret=secret)
+    otp_service.otp_storage = otp_storage
+    return otp_service
+
+
+def _to_password(code: str, ttl_seconds: float) -> OneTimePassword:
+    return OneTimePassword(
+        code=code,
+        expired_at=datetime.datetime.now() + datetime.timedelta(seconds=ttl_seconds),
+    )
+
+
+def test_storages_put_replace_and_delete(otp_storage):
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("first", 60))
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("second", 60))
+    otp_storage.put("1", OtpPurpose.UserRegistration, _to_password("other", 60))
+
+    optional_password = otp_storage.get("1", OtpPurpose.PasswordReset)
+    assert optional_password is not None and optional_password.code == "second"
+    assert otp_storage.get_stats().live_entries == 2
+
+    otp_storage.delete("1", OtpPurpose.PasswordReset)
+    assert otp_storage.get("1", OtpPurpose.PasswordReset) is None
+    assert otp_storage.get("1", OtpPurpose.UserRegistration) is not None
+
+
+def test_issued_otps_validate_only_with_the_right_code(otp_storage):
+    otp_service = _create_otp_service(otp_storage)
+    password = otp_service.get_otp(OtpPurpose.UserRegistration, "1")
+
+    assert otp_service.validate_otp("1", OtpPurpose.UserRegistration, password.code) is None
+    wrong_code = "0" * 6 if password.code != "0" * 6 else "1" * 6
+    assert isinstance(
+        otp_service.validate_otp("1", OtpPurpose.UserRegistration, wrong_code), InvalidOtpError
+    )
+    assert isinstance(
+        otp_service.validate_otp("1", OtpPurpose.PasswordReset, password.code), InvalidOtpError
+    )
+    assert isinstance(
+        otp_service.validate_otp("2", OtpPurpose.UserRegistration, password.code), InvalidOtpError
+    )
+
+
+def test_stored_codes_are_keyed_with_the_secret(otp_storage):
+    otp_service = _create_otp_service(otp_storage)
+    password = otp_service.get_otp(OtpPurpose.PasswordReset, "1")
+
+    optional_stored_password = otp_storage.get("1", OtpPurpose.PasswordReset)
+    assert optional_stored_password is not None
+    assert password.code not in optional_stored_password.code
+    unkeyed_hash = hashlib.sha256(
+        f"{OtpPurpose.PasswordReset.value}:1:{password.code}".encode()
+    ).hexdigest()
+    assert optional_stored_password.code != unkeyed_hash
+
+    other_secret_service = _create_otp_service(otp_storage, secret="other-secret")
+    assert isinstance(
+        other_secret_service.validate_otp("1", OtpPurpose.PasswordReset, password.code),
+        InvalidOtpError,
+    )
+
+
+class _ExpiringStorage(InMemoryOtpStorage):
+    """
+    Reads through to another storage, reporting every password as already expired.
+    """
+
+    def __init__(self, otp_storage: OtpStorage) -> None:
+        super().__init__(max_entries=1)
+        self.otp_storage = otp_storage
+
+    def get(self, _id, purpose):
+        optional_password = self.otp_storage.get(_id, purpose)
+        if optional_password is None:
+            return None
+        return optional_password.model_copy(
+            update={"expired_at": datetime.datetime.now() - datetime.timedelta(seconds=1)}
+        )
+
+
+def test_expired_otps_are_rejected(otp_storage):
+    otp_service = _create_otp_service(otp_storage)
+    password = otp_service.get_otp(OtpPurpose.PasswordReset, "1")
+    otp_service.otp_storage = _ExpiringStorage(otp_storage)
+
+    optional_error = otp_service.validate_otp("1", OtpPurpose.PasswordReset, password.code)
+    assert isinstance(optional_error, InvalidOtpError)
+    assert str(optional_error) == "OTP is expired"
+
+
+def test_shared_storages_validate_otps_issued_by_another_worker(engine):
+    issuing_service = _create_otp_service(SqlOtpStorage())
+    validating_service = _create_otp_service(SqlOtpStorage())
+
+    password = issuing_service.get_otp(OtpPurpose.UserRegistration, "1")
+    assert validating_service.validate_otp("1", OtpPurpose.UserRegistration, password.code) is None
+
+    redis_client = fakeredis.FakeRedis()
+    issuing_service = _create_otp_service(RedisOtpStorage(redis_client, key_prefix="test:otp"))
+    validating_service = _create_otp_service(RedisOtpStorage(redis_client, key_prefix="test:otp"))
+
+    password = issuing_service.get_otp(OtpPurpose.UserRegistration, "1")
+    assert validating_service.validate_otp("1", OtpPurpose.UserRegistration, password.code) is None
+
+
+def test_sql_storage_evicts_expired_rows(engine):
+    otp_storage = SqlOtpStorage()
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("expired", -1))
+    otp_storage.put("2", OtpPurpose.PasswordReset, _to_password("live", 60))
+
+    assert otp_storage.evict_expired() == 1
+    assert otp_storage.get("1", OtpPurpose.PasswordReset) is None
+    assert otp_storage.get_stats().live_entries == 1
+
+
+def test_redis_storage_sets_the_ttl_and_skips_expired_otps():
+    redis_client = fakeredis.FakeRedis()
+    otp_storage = RedisOtpStorage(redis_client, key_prefix="test:otp")
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("live", 60))
+    otp_storage.put("2", OtpPurpose.PasswordReset, _to_password("expired", -1))
+
+    assert 0 < redis_client.ttl("test:otp:password_reset:1") <= 60
+    assert otp_storage.get("2", OtpPurpose.PasswordReset) is None
@@ -0,0 +1,70 @@
+import datetime
+import time
+
+from py_spring_admin.core.service.otp_storage import (
+    InMemoryOtpStorage,
+    OneTimePassword,
+    OtpPurpose,
+)
+
+
+def _to_password(code: str, ttl_seconds: float) -> OneTimePassword:
+    return OneTimePassword(
+        code=code,
+        expired_at=datetime.datetime.now() + datetime.timedelta(seconds=ttl_seconds),
+    )
+
+
+def test_expired_entries_are_evicted_in_expiry_order():
+    otp_storage = InMemoryOtpStorage(max_entries=10)
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("111111", 0.05))
+    otp_storage.put("2", OtpPurpose.PasswordReset, _to_password("222222", 60))
+    time.sleep(0.1)
+
+    assert otp_storage.evict_expired() == 1
+    assert otp_storage.get("1", OtpPurpose.PasswordReset) is None
+    assert otp_storage.get("2", OtpPurpose.PasswordReset) is not None
+    assert otp_storage.get_stats().expired_evictions == 1
+
+
+def test_the_entry_closest_to_expiry_is_evicted_when_full():
+    otp_storage = InMemoryOtpStorage(max_entries=2)
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("111111", 120))
+    otp_storage.put("2", OtpPurpose.PasswordReset, _to_password("222222", 60))
+    otp_storage.put("3", OtpPurpose.PasswordReset, _to_password("333333", 180))
+
+    assert otp_storage.get("2", OtpPurpose.PasswordReset) is None
+    assert otp_storage.get("1", OtpPurpose.PasswordReset) is not None
+    stats = otp_storage.get_stats()
+    assert (stats.live_entries, stats.capacity_evictions) == (2, 1)
+
+
+def test_replaced_entries_keep_their_new_expiry():
+    otp_storage = InMemoryOtpStorage(max_entries=10)
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("111111", 0.05))
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("222222", 60))
+    time.sleep(0.1)
+
+    # the heap item of the replaced entry expires, but must not evict its replacement
+    assert otp_storage.evict_expired() == 0
+    optional_password = otp_storage.get("1", OtpPurpose.PasswordReset)
+    assert optional_password is not None and optional_password.code == "222222"
+
+
+def test_purposes_are_stored_apart():
+    otp_storage = InMemoryOtpStorage(max_entries=10)
+    otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("111111", 60))
+    otp_storage.put("1", OtpPurpose.UserRegistration, _to_password("222222", 60))
+    otp_storage.delete("1", OtpPurpose.PasswordReset)
+
+    assert otp_storage.get("1", OtpPurpose.PasswordReset) is None
+    assert otp_storage.get("1", OtpPurpose.UserRegistration) is not None
+
+
+def test_the_heap_is_compacted_when_mostly_stale():
+    otp_storage = InMemoryOtpStorage(max_entries=10)
+    for _ in range(1000):
+        otp_storage.put("1", OtpPurpose.PasswordReset, _to_password("111111", 60))
+
+    assert len(otp_storage.entries) == 1
+    assert len(otp_storage.expiry_heap) <= 2 * len(otp_storage.entries) + 65
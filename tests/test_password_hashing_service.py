@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from passlib.context import CryptContext
+
+from py_spring_admin.core.service.errors import HandledServerError
+from py_spring_admin.core.service.password_hashing_service import (
+    PasswordHashingProperties,
+    PasswordHashingService,
+)
+
+
+class _BlockingPasswordContext:
+    """
+    Hashes only once released, so tests control how long the worker stays busy.
+    """
+
+    def __init__(self) -> None:
+        self.started = threading.Event()
+        self.released = threading.Event()
+
+    def hash(self, raw_password: str) -> str:
+        self.started.set()
+        assert self.released.wait(timeout=5)
+        return f"hashed:{raw_password}"
+
+
+def _create_service(
+    password_context, max_workers: int, max_pending_tasks: int
+) -> PasswordHashingService:
+    password_hashing_service = PasswordHashingService()
+    password_hashing_service.password_hashing_properties = PasswordHashingProperties(
+        max_workers=max_workers, max_pending_tasks=max_pending_tasks
+    )
+    password_hashing_service.password_context = password_context
+    return password_hashing_service
+
+
+def test_tasks_beyond_the_pending_limit_are_rejected_with_503():
+    password_context = _BlockingPasswordContext()
+    password_hashing_service = _create_service(password_context, max_workers=1, max_pending_tasks=1)
+
+    with ThreadPoolExecutor(max_workers=1) as request_thread:
+        pending_hash = request_thread.submit(password_hashing_service.hash_password, "first")
+        assert password_context.started.wait(timeout=5)
+
+        with pytest.raises(HandledServerError) as error_info:
+            password_hashing_service.hash_password("second")
+        assert error_info.value.http_status_code == 503
+        with pytest.raises(HandledServerError):
+            asyncio.run(password_hashing_service.async_hash_password("third"))
+
+        password_context.released.set()
+        assert pending_hash.result(timeout=5) == "hashed:first"
+
+    metrics = password_hashing_service.get_metrics()
+    assert (metrics.pending_tasks, metrics.rejected_tasks) == (0, 2)
+    # the pool accepts tasks again once the pending one finished
+    assert password_hashing_service.hash_password("fourth") == "hashed:fourth"
+    password_hashing_service.pre_destroy()
+
+
+def test_queue_wait_and_hash_time_are_recorded():
+    password_context = _BlockingPasswordContext()
+    password_hashing_service = _create_service(password_context, max_workers=1, max_pending_tasks=2)
+
+    with ThreadPoolExecutor(max_workers=2) as request_threads:
+        first_hash = request_threads.submit(password_hashing_service.hash_password, "first")
+        assert password_context.started.wait(timeout=5)
+        # the second task queues behind the first one, which holds the only worker
+        second_hash = request_threads.submit(password_hashing_service.hash_password, "second")
+        time.sleep(0.1)
+        password_context.released.set()
+        assert first_hash.result(timeout=5) == "hashed:first"
+        assert second_hash.result(timeout=5) == "hashed:second"
+
+    metrics = password_hashing_service.get_metrics()
+    assert metrics.hash_time.count == 2 and metrics.queue_wait.count == 2
+    assert metrics.hash_time.max_seconds >= 0.1
+    assert metrics.queue_wait.max_seconds >= 0.1
+    password_hashing_service.pre_destroy()
+
+
+def test_passwords_are_hashed_and_verified_on_the_pool():
+    password_hashing_service = _create_service(
+        CryptContext(schemes=["sha256_crypt"], sha256_crypt__rounds=1000), max_workers=1, max_pending_tasks=1
+    )
+
+    hashed_password = password_hashing_service.hash_password("secret")
+
+    assert password_hashing_service.verify_password("secret", hashed_password)
+    assert not asyncio.run(password_hashing_service.async_verify_password("wrong", hashed_password))
+    password_hashing_service.pre_destroy()
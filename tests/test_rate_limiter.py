@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+
+import pytest
+
+from py_spring_admin.core.service import rate_limiter as rate_limiter_module
+from py_spring_admin.core.service.rate_limiter import SlidingWindowRateLimiter
+
+WINDOW_START = 60_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    clock = SimpleNamespace(now=WINDOW_START)
+    monkeypatch.setattr(rate_limiter_module, "time", SimpleNamespace(time=lambda: clock.now))
+    return clock
+
+
+def test_requests_over_the_limit_get_the_wait_until_one_is_allowed(clock):
+    rate_limiter = SlidingWindowRateLimiter(max_requests=3, window_seconds=60, max_keys=10)
+    assert [rate_limiter.hit("ip:1") for _ in range(3)] == [None, None, None]
+
+    # the 3 requests of the full window must slide out until one fits: 20s into the next window
+    assert rate_limiter.hit("ip:1") == pytest.approx(80)
+    clock.now = WINDOW_START + 79
+    assert rate_limiter.hit("ip:1") is not None
+    clock.now = WINDOW_START + 80
+    assert rate_limiter.hit("ip:1") is None
+
+
+def test_the_previous_window_is_weighted_by_its_overlap(clock):
+    rate_limiter = SlidingWindowRateLimiter(max_requests=4, window_seconds=60, max_keys=10)
+    for _ in range(4):
+        assert rate_limiter.hit("ip:1") is None
+
+    # halfway into the next window, half of the 4 previous requests still count
+    clock.now = WINDOW_START + 90
+    assert [rate_limiter.hit("ip:1") is None for _ in range(3)] == [True, True, False]
+
+
+def test_keys_idle_for_two_windows_start_over(clock):
+    rate_limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=60, max_keys=10)
+    assert rate_limiter.hit("ip:1") is None
+    assert rate_limiter.hit("ip:1") is not None
+
+    clock.now = WINDOW_START + 120
+    assert rate_limiter.hit("ip:1") is None
+
+
+def test_rejected_requests_count_against_no_key(clock):
+    rate_limiter = SlidingWindowRateLimiter(max_requests=2, window_seconds=60, max_keys=10)
+    for _ in range(2):
+        assert rate_limiter.hit("ip:attacker") is None
+
+    for _ in range(5):
+        assert rate_limiter.hit_all(["ip:attacker", "email:victim"]) is not None
+    assert rate_limiter.hit_all(["ip:user", "email:victim"]) is None
+    assert rate_limiter.hit_all(["ip:user", "email:victim"]) is None
+
+    stats = rate_limiter.get_stats()
+    assert (stats.allowed_requests, stats.limited_requests) == (4, 5)
+
+
+def test_at_most_max_keys_are_tracked(clock):
+    rate_limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=60, max_keys=3)
+    for index in range(10):
+        assert rate_limiter.hit(f"ip:{index}") is None
+
+    assert rate_limiter.get_stats().tracked_keys == 3
+
+
+@pytest.mark.parametrize(
+    "retry_after_seconds, header", [(0, "1"), (0.2, "1"), (1, "1"), (80.1, "81")]
+)
+def test_retry_after_header_rounds_up_to_whole_seconds(retry_after_seconds, header):
+    assert SlidingWindowRateLimiter.to_retry_after_header(retry_after_seconds) == header
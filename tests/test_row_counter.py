@@ -0,0 +1,65 @@
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, insert, text
+from sqlalchemy.orm import Session
+
+from py_spring_admin.core.service.model_query import RowCountMode
+from py_spring_admin.core.service.row_counter import RowCounter
+
+metadata = MetaData()
+counted_table = Table("counted", metadata, Column("id", Integer, primary_key=True))
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        session.execute(insert(counted_table), [{"id": _id} for _id in range(1, 11)])
+        yield session
+    engine.dispose()
+
+
+def _insert_row(session: Session, _id: int) -> None:
+    session.execute(insert(counted_table), [{"id": _id}])
+
+
+def test_exact_counts_are_cached_until_invalidated(session):
+    row_counter = RowCounter(cache_size=10, cache_ttl_seconds=60)
+
+    count = row_counter.count_rows(session, counted_table, [], None, RowCountMode.Exact)
+    assert count.total == 10 and not count.is_estimated
+
+    _insert_row(session, 11)
+    assert row_counter.count_rows(session, counted_table, [], None, RowCountMode.Exact).total == 10
+
+    row_counter.invalidate(counted_table.name)
+    assert row_counter.count_rows(session, counted_table, [], None, RowCountMode.Exact).total == 11
+
+
+def test_count_racing_an_invalidation_is_not_cached(session, monkeypatch):
+    row_counter = RowCounter(cache_size=10, cache_ttl_seconds=60)
+    execute = session.execute
+
+    def execute_while_writing(*args, **kwargs):
+        result = execute(*args, **kwargs)
+        # a write commits (and invalidates) after the count was read but before it is cached
+        execute(insert(counted_table), [{"id": 11}])
+        row_counter.invalidate(counted_table.name)
+        return result
+
+    monkeypatch.setattr(session, "execute", execute_while_writing)
+    assert row_counter.count_rows(session, counted_table, [], None, RowCountMode.Exact).total == 10
+    monkeypatch.undo()
+
+    assert row_counter.count_rows(session, counted_table, [], None, RowCountMode.Exact).total == 11
+
+
+def test_estimated_counts_read_sqlite_statistics(session):
+    row_counter = RowCounter(cache_size=10, cache_ttl_seconds=60)
+
+    count = row_counter.count_rows(session, counted_table, [], None, RowCountMode.Estimated)
+    assert count.total == 10 and not count.is_estimated
+
+    session.execute(text("ANALYZE"))
+    count = row_counter.count_rows(session, counted_table, [], None, RowCountMode.Estimated)
+    assert count.total == 10 and count.is_estimated
@@ -0,0 +1,74 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from typing import Optional
+
+import pytest
+from py_spring_model import PySpringModel
+from sqlmodel import Field
+
+from py_spring_admin.core.repository.commons import StrEnum
+from py_spring_admin.core.service.row_serializer import RowSerializer
+
+
+class SerializedColor(StrEnum):
+    Red = "red"
+    Blue = "blue"
+
+
+class SerializedRecord(PySpringModel, table=True):
+    __tablename__: str = "test_serialized_record"
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret: str = Field(exclude=True)
+    amount: Decimal = Field(max_digits=10, decimal_places=2)
+    color: SerializedColor
+    created_at: datetime.datetime
+    deleted_at: Optional[datetime.datetime] = None
+    birthday: Optional[datetime.date] = None
+    external_id: Optional[uuid.UUID] = None
+    is_active: bool = True
+    ratio: float = 0.5
+
+
+@pytest.fixture
+def row_serializer() -> RowSerializer:
+    return RowSerializer.from_model(SerializedRecord, SerializedRecord.__table__)  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime.datetime(2024, 5, 1, 8, 30, 15, 123456),
+        datetime.datetime(2024, 5, 1, 8, 30, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2024, 5, 1, 8, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=8))),
+    ],
+)
+def test_serialize_matches_the_pydantic_json_dump(row_serializer, created_at):
+    record = SerializedRecord(
+        id=7,
+        name="record",
+        secret="hidden",
+        amount=Decimal("12.50"),
+        color=SerializedColor.Blue,
+        created_at=created_at,
+        birthday=datetime.date(1990, 2, 3),
+        external_id=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        is_active=False,
+    )
+    row = tuple(getattr(record, column.name) for column in row_serializer.columns)
+
+    assert row_serializer.serialize(row) == json.loads(record.model_dump_json())
+
+
+def test_excluded_fields_are_never_selected(row_serializer):
+    assert "secret" not in row_serializer.field_names
+    assert "secret" not in [column.name for column in row_serializer.columns]
+
+
+def test_project_keeps_the_requested_fields_in_order(row_serializer):
+    projected_serializer = row_serializer.project(["color", "id"])
+
+    assert projected_serializer.field_names == ["color", "id"]
+    assert projected_serializer.serialize((SerializedColor.Red, 1)) == {"color": "red", "id": 1}
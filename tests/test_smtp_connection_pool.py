@@ -0,0 +1,111 @@
+import socket
+from email.message import EmailMessage
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from py_spring_admin.core.service.smtp_connection_pool import SmtpConnectionPool
+
+SENDER = "admin@example.com"
+
+
+class _RecordingHandler:
+    def __init__(self) -> None:
+        self.deliveries: list[tuple[tuple[str, int], list[str]]] = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address.startswith("rejected"):
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        # the client address tells connections apart
+        self.deliveries.append((session.peer, list(envelope.rcpt_tos)))
+        return "250 Message accepted for delivery"
+
+    def count_connections(self) -> int:
+        return len({peer for peer, _ in self.deliveries})
+
+
+def _find_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _to_message(recipient: str) -> EmailMessage:
+    email_message = EmailMessage()
+    email_message["From"] = SENDER
+    email_message["To"] = recipient
+    email_message["Subject"] = "Test"
+    email_message.set_content("Hello")
+    return email_message
+
+
+@pytest.fixture
+def smtp_handler():
+    smtp_handler = _RecordingHandler()
+    controller = Controller(smtp_handler, hostname="127.0.0.1", port=_find_free_port())
+    controller.start()
+    smtp_handler.port = controller.port  # type: ignore
+    yield smtp_handler
+    controller.stop()
+
+
+def _create_pool(smtp_handler: _RecordingHandler, idle_timeout_seconds: float = 60) -> SmtpConnectionPool:
+    return SmtpConnectionPool(
+        host="127.0.0.1",
+        port=smtp_handler.port,  # type: ignore
+        max_size=2,
+        idle_timeout_seconds=idle_timeout_seconds,
+        is_starttls=False,
+        timeout_seconds=5,
+    )
+
+
+def test_connections_are_reused_across_batches(smtp_handler):
+    connection_pool = _create_pool(smtp_handler)
+    for index in range(3):
+        assert connection_pool.send_messages(SENDER, [_to_message(f"user{index}@example.com")]) == []
+    connection_pool.close()
+
+    assert len(smtp_handler.deliveries) == 3
+    assert smtp_handler.count_connections() == 1
+
+
+def test_idle_connections_are_replaced(smtp_handler):
+    connection_pool = _create_pool(smtp_handler, idle_timeout_seconds=0)
+    for index in range(2):
+        assert connection_pool.send_messages(SENDER, [_to_message(f"user{index}@example.com")]) == []
+    connection_pool.close()
+
+    assert smtp_handler.count_connections() == 2
+
+
+def test_broken_connections_fail_the_health_check_and_are_replaced(smtp_handler):
+    connection_pool = _create_pool(smtp_handler)
+    assert connection_pool.send_messages(SENDER, [_to_message("first@example.com")]) == []
+    connection_pool.idle_connections[0].smtp.sock.shutdown(socket.SHUT_RDWR)  # type: ignore
+
+    assert connection_pool.send_messages(SENDER, [_to_message("second@example.com")]) == []
+    connection_pool.close()
+    assert smtp_handler.count_connections() == 2
+
+
+def test_rejected_messages_are_returned_without_dropping_the_session(smtp_handler):
+    connection_pool = _create_pool(smtp_handler)
+    rejected_message = _to_message("rejected@example.com")
+
+    failed_emails = connection_pool.send_messages(
+        SENDER, [_to_message("first@example.com"), rejected_message, _to_message("last@example.com")]
+    )
+    connection_pool.close()
+
+    assert [failed_email.email_message for failed_email in failed_emails] == [rejected_message]
+    assert "mailbox unavailable" in str(failed_emails[0].error)
+    assert [recipients for _, recipients in smtp_handler.deliveries] == [
+        ["first@example.com"],
+        ["last@example.com"],
+    ]
+    assert smtp_handler.count_connections() == 1
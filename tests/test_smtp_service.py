@@ -0,0 +1,170 @@
+import time
+from email.message import EmailMessage
+
+import pytest
+from sqlmodel import Session, select
+
+from py_spring_admin.core.repository.models import EmailOutboxMessage
+from py_spring_admin.core.service.email_outbox import EmailOutbox
+from py_spring_admin.core.service.smtp_connection_pool import FailedEmail
+from py_spring_admin.core.service.smtp_service import SmtpProperties, SmtpService
+
+
+class _StandInConnectionPool:
+    def __init__(self) -> None:
+        self.failing_recipients: set[str] = set()
+        self.error_message = "550 mailbox unavailable"
+        self.sent_recipients: list[str] = []
+        self.is_closed = False
+
+    def send_messages(self, sender_email: str, email_messages: list[EmailMessage]) -> list[FailedEmail]:
+        failed_emails: list[FailedEmail] = []
+        for email_message in email_messages:
+            if email_message["To"] in self.failing_recipients:
+                failed_emails.append(FailedEmail(email_message, OSError(self.error_message)))
+                continue
+            self.sent_recipients.append(str(email_message["To"]))
+        return failed_emails
+
+    def close(self) -> None:
+        self.is_closed = True
+
+
+def _to_message(recipient: str) -> EmailMessage:
+    email_message = EmailMessage()
+    email_message["To"] = recipient
+    email_message.set_content("Hello")
+    return email_message
+
+
+def _create_smtp_service(**properties) -> SmtpService:
+    smtp_service = SmtpService()
+    smtp_service.smtp_properties = SmtpProperties(
+        company_name="Example",
+        host="127.0.0.1",
+        port=25,
+        sender_email="admin@example.com",
+        sender_password="password",
+        allowed_domains=["example.com"],
+        **properties,
+    )
+    smtp_service.connection_pool = _StandInConnectionPool()  # type: ignore
+    return smtp_service
+
+
+def _wait_until(condition, timeout_seconds: float = 2) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_take_email_batch_drains_up_to_the_batch_size():
+    smtp_service = _create_smtp_service(send_batch_size=2)
+    for index in range(3):
+        smtp_service.email_queue.put(_to_message(f"user{index}@example.com"))
+
+    email_messages, is_stopping = smtp_service._take_email_batch()
+    assert [email_message["To"] for email_message in email_messages] == [
+        "user0@example.com",
+        "user1@example.com",
+    ]
+    assert not is_stopping
+
+    email_messages, is_stopping = smtp_service._take_email_batch()
+    assert [email_message["To"] for email_message in email_messages] == ["user2@example.com"]
+    assert not is_stopping
+
+
+def test_take_email_batch_stops_at_the_sentinel():
+    smtp_service = _create_smtp_service()
+    smtp_service.email_queue.put(_to_message("user@example.com"))
+    smtp_service.email_queue.put(None)
+    smtp_service.email_queue.put(_to_message("late@example.com"))
+
+    email_messages, is_stopping = smtp_service._take_email_batch()
+
+    assert [email_message["To"] for email_message in email_messages] == ["user@example.com"]
+    assert is_stopping
+    assert smtp_service.email_queue.qsize() == 1
+
+
+@pytest.mark.parametrize("is_dry_run", [True, False])
+def test_pre_destroy_sends_queued_emails_and_joins_the_workers(is_dry_run: bool):
+    smtp_service = _create_smtp_service(is_dry_run=is_dry_run, worker_count=3)
+    smtp_service._start_workers()
+    for index in range(5):
+        smtp_service.async_send_email(_to_message(f"user{index}@example.com"))
+
+    smtp_service.pre_destroy()
+
+    assert len(smtp_service.workers) == 3
+    assert all(not worker.is_alive() for worker in smtp_service.workers)
+    assert smtp_service.email_queue.empty()
+    connection_pool: _StandInConnectionPool = smtp_service.connection_pool  # type: ignore
+    assert connection_pool.is_closed
+    expected_recipients = [] if is_dry_run else [f"user{index}@example.com" for index in range(5)]
+    assert sorted(connection_pool.sent_recipients) == expected_recipients
+
+
+def test_failed_emails_are_retried_without_blocking_the_worker():
+    smtp_service = _create_smtp_service(is_dry_run=False, retry_delay_seconds=0.3)
+    connection_pool: _StandInConnectionPool = smtp_service.connection_pool  # type: ignore
+    connection_pool.failing_recipients.add("failing@example.com")
+    smtp_service._start_workers()
+
+    smtp_service.async_send_email(_to_message("failing@example.com"))
+    _wait_until(lambda: len(smtp_service.retry_timers) == 1)
+    smtp_service.async_send_email(_to_message("user@example.com"))
+    # sent by the same worker while the failed email waits for its retry
+    _wait_until(lambda: connection_pool.sent_recipients == ["user@example.com"])
+    assert len(smtp_service.retry_timers) == 1
+
+    connection_pool.failing_recipients.clear()
+    _wait_until(lambda: "failing@example.com" in connection_pool.sent_recipients)
+    assert len(smtp_service.retry_timers) == 0
+    smtp_service.pre_destroy()
+
+
+def test_pre_destroy_cancels_pending_retries():
+    smtp_service = _create_smtp_service(is_dry_run=False, retry_delay_seconds=60)
+    connection_pool: _StandInConnectionPool = smtp_service.connection_pool  # type: ignore
+    connection_pool.failing_recipients.add("failing@example.com")
+    smtp_service._start_workers()
+    smtp_service.async_send_email(_to_message("failing@example.com"))
+    _wait_until(lambda: len(smtp_service.retry_timers) == 1)
+    (retry_timer,) = smtp_service.retry_timers
+
+    started_at = time.monotonic()
+    smtp_service.pre_destroy()
+
+    assert time.monotonic() - started_at < 1
+    retry_timer.join(timeout=1)
+    assert not retry_timer.is_alive()
+    assert smtp_service.retry_timers == set()
+    assert all(not worker.is_alive() for worker in smtp_service.workers)
+    assert smtp_service.email_queue.empty()
+
+
+def test_outbox_failures_record_the_truncated_send_error(engine):
+    smtp_service = _create_smtp_service(is_dry_run=False)
+    connection_pool: _StandInConnectionPool = smtp_service.connection_pool  # type: ignore
+    connection_pool.failing_recipients.add("failing@example.com")
+    connection_pool.error_message = "connection reset " * 100
+    email_outbox = EmailOutbox(
+        max_attempts=3, base_backoff_seconds=0, max_backoff_seconds=0, claim_lease_seconds=60
+    )
+    email_outbox.enqueue(_to_message("failing@example.com"))
+    email_outbox.enqueue(_to_message("user@example.com"))
+
+    claim_token, claimed_emails = email_outbox.claim_batch(10)
+    smtp_service._send_claimed_emails(email_outbox, claim_token, claimed_emails)
+
+    with Session(engine) as session:
+        last_errors = {
+            outbox_message.receiver_email: outbox_message.last_error
+            for outbox_message in session.exec(select(EmailOutboxMessage)).all()
+        }
+    assert last_errors["user@example.com"] is None
+    assert last_errors["failing@example.com"] == connection_pool.error_message[:1024]
+    assert connection_pool.sent_recipients == ["user@example.com"]
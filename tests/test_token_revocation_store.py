@@ -0,0 +1,95 @@
+import datetime
+import time
+
+from sqlmodel import Session, select
+
+from py_spring_admin.core.repository.models import RevokedToken
+from py_spring_admin.core.service.token_revocation_store import TokenRevocationStore
+
+
+def _to_datetime(timestamp: float) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(timestamp, datetime.timezone.utc).replace(tzinfo=None)
+
+
+def test_revoked_tokens_are_kept_until_they_expire():
+    revocation_store = TokenRevocationStore(is_persisted=False, max_retention_seconds=60)
+    revocation_store.revoke("expiring", time.time() + 0.05)
+    revocation_store.revoke("long_lived", time.time() + 3600)
+
+    assert revocation_store.is_revoked("expiring")
+    assert not revocation_store.is_revoked("unknown")
+    time.sleep(0.1)
+    assert not revocation_store.is_revoked("expiring")
+
+    revocation_store.revoke("other")
+    assert "expiring" not in revocation_store.revoked_tokens
+    assert revocation_store.revoked_tokens["long_lived"] <= time.time() + 60
+
+
+def test_tokens_without_exp_are_retained_for_at_most_the_max_retention():
+    revocation_store = TokenRevocationStore(is_persisted=False, max_retention_seconds=0.05)
+    revocation_store.revoke("no_exp")
+
+    assert revocation_store.is_revoked("no_exp")
+    time.sleep(0.1)
+    assert not revocation_store.is_revoked("no_exp")
+    revocation_store.revoke("other")
+    assert list(revocation_store.revoked_tokens) == ["other"]
+
+
+def test_persisted_revocations_survive_a_reload_and_expired_rows_are_deleted(engine):
+    with Session(engine) as session:
+        session.add(RevokedToken(jti="expired", expired_at=_to_datetime(time.time() - 1)))
+        session.add(RevokedToken(jti="without_expiry", expired_at=None))
+        session.commit()
+
+    revocation_store = TokenRevocationStore(is_persisted=True, max_retention_seconds=60)
+    revocation_store.revoke("revoked", time.time() + 3600)
+
+    reloaded_store = TokenRevocationStore(is_persisted=True, max_retention_seconds=60)
+    reloaded_store.load()
+    assert reloaded_store.is_revoked("revoked")
+    assert reloaded_store.is_revoked("without_expiry")
+    assert not reloaded_store.is_revoked("expired")
+    with Session(engine) as session:
+        revoked_tokens = {
+            revoked_token.jti: revoked_token.expired_at
+            for revoked_token in session.exec(select(RevokedToken)).all()
+        }
+    assert set(revoked_tokens) == {"revoked", "without_expiry"}
+    assert all(expired_at is not None for expired_at in revoked_tokens.values())
+
+
+def test_revocations_are_shared_by_stores_on_the_same_database(engine):
+    revoking_store = TokenRevocationStore(is_persisted=True, max_retention_seconds=60)
+    checking_store = TokenRevocationStore(is_persisted=True, max_retention_seconds=60)
+    checking_store.load()
+
+    revoking_store.revoke("revoked", time.time() + 3600)
+
+    assert checking_store.is_revoked("revoked")
+    assert "revoked" in checking_store.revoked_tokens
+    assert not checking_store.is_revoked("unknown")
+
+
+def test_tokens_found_not_revoked_are_checked_again_after_the_interval(engine):
+    revoking_store = TokenRevocationStore(is_persisted=True, max_retention_seconds=60)
+    checking_store = TokenRevocationStore(
+        is_persisted=True, max_retention_seconds=60, check_interval_seconds=0.05
+    )
+
+    assert not checking_store.is_revoked("token")
+    revoking_store.revoke("token", time.time() + 3600)
+    assert not checking_store.is_revoked("token")
+    time.sleep(0.1)
+    assert checking_store.is_revoked("token")
+
+
+def test_expired_persisted_revocations_are_not_applied(engine):
+    with Session(engine) as session:
+        session.add(RevokedToken(jti="expired", expired_at=_to_datetime(time.time() - 1)))
+        session.commit()
+
+    revocation_store = TokenRevocationStore(is_persisted=True, max_retention_seconds=60)
+    assert not revocation_store.is_revoked("expired")
+    assert "expired" not in revocation_store.revoked_tokens
@@ -0,0 +1,69 @@
+import pytest
+
+from py_spring_admin.core.repository.models import User
+from py_spring_admin.core.repository.user_cache import UserCache
+
+
+@pytest.fixture
+def user() -> User:
+    return User(id=1, user_name="admin", email="admin@example.com", password="hashed")
+
+
+def test_users_are_cached_under_every_key(user):
+    user_cache = UserCache(max_size=10, ttl_seconds=60)
+    user_cache.put(user, user_cache.get_generation())
+
+    for key in [
+        UserCache.to_key("email", "admin@example.com"),
+        UserCache.to_key("user_name", "admin"),
+        UserCache.to_key("id", 1),
+    ]:
+        optional_user = user_cache.get(key)
+        assert optional_user is not None and optional_user.user_name == "admin"
+
+
+def test_cached_users_are_copied(user):
+    user_cache = UserCache(max_size=10, ttl_seconds=60)
+    user_cache.put(user, user_cache.get_generation())
+    user.user_name = "changed"
+
+    optional_user = user_cache.get(UserCache.to_key("id", 1))
+    assert optional_user is not None and optional_user.user_name == "admin"
+    optional_user.is_verified = True
+    optional_user = user_cache.get(UserCache.to_key("id", 1))
+    assert optional_user is not None and not optional_user.is_verified
+
+
+def test_invalidate_drops_every_key_of_the_user(user):
+    user_cache = UserCache(max_size=10, ttl_seconds=60)
+    user_cache.put(user, user_cache.get_generation())
+    user_cache.invalidate("admin@example.com", "admin", 1)
+
+    assert user_cache.get(UserCache.to_key("email", "admin@example.com")) is None
+    assert user_cache.get(UserCache.to_key("user_name", "admin")) is None
+    assert user_cache.get(UserCache.to_key("id", 1)) is None
+
+
+def test_users_loaded_before_a_write_are_not_cached(user):
+    user_cache = UserCache(max_size=10, ttl_seconds=60)
+    generation = user_cache.get_generation()
+    # a write commits and invalidates the user while the old row is being loaded
+    user_cache.invalidate("admin@example.com", "admin", 1)
+    user_cache.put(user, generation)
+    assert user_cache.get(UserCache.to_key("id", 1)) is None
+
+    generation = user_cache.get_generation()
+    user_cache.clear()
+    user_cache.put(user, generation)
+    assert user_cache.get(UserCache.to_key("id", 1)) is None
+
+
+def test_clear_drops_every_user(user):
+    user_cache = UserCache(max_size=10, ttl_seconds=60)
+    user_cache.put(user, user_cache.get_generation())
+    user_cache.clear()
+
+    assert user_cache.get(UserCache.to_key("id", 1)) is None
+    metrics = user_cache.get_metrics()
+    assert (metrics.size, metrics.invalidations, metrics.hits, metrics.misses) == (0, 1, 0, 1)
+    assert metrics.hit_ratio == 0
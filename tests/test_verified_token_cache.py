@@ -0,0 +1,45 @@
+import time
+
+from py_spring_admin.core.repository.commons import UserRead, UserRole
+from py_spring_admin.core.service.verified_token_cache import VerifiedTokenCache
+
+USER_READ = UserRead(id=1, role=UserRole.Admin, user_name="admin", is_verified=True)
+
+
+def test_cached_tokens_are_keyed_by_hash():
+    token_cache = VerifiedTokenCache(max_size=10, max_ttl_seconds=60)
+    token_cache.put("token", USER_READ, optional_jti="jti")
+
+    optional_verified_token = token_cache.get("token")
+    assert optional_verified_token is not None
+    assert (optional_verified_token.user_read, optional_verified_token.optional_jti) == (USER_READ, "jti")
+    assert token_cache.get("other_token") is None
+    assert "token" not in token_cache.cache
+    metrics = token_cache.get_metrics()
+    assert (metrics.hits, metrics.misses, metrics.hit_ratio) == (1, 1, 0.5)
+
+
+def test_expired_tokens_are_not_cached():
+    token_cache = VerifiedTokenCache(max_size=10, max_ttl_seconds=60)
+    token_cache.put("token", USER_READ, optional_expired_at=time.time() - 1)
+
+    assert token_cache.get("token") is None
+
+
+def test_entries_expire_after_the_max_ttl():
+    token_cache = VerifiedTokenCache(max_size=10, max_ttl_seconds=0.05)
+    token_cache.put("token", USER_READ, optional_expired_at=time.time() + 60)
+
+    assert token_cache.get("token") is not None
+    time.sleep(0.1)
+    assert token_cache.get("token") is None
+
+
+def test_evict_removes_a_revoked_token():
+    token_cache = VerifiedTokenCache(max_size=10, max_ttl_seconds=60)
+    token_cache.put("token", USER_READ)
+
+    assert token_cache.evict("token")
+    assert not token_cache.evict("token")
+    assert token_cache.get("token") is None
+    assert token_cache.get_metrics().evictions == 1